@@ -1,6 +1,8 @@
 # LegendsTrivia_onefile.spec
 # -*- mode: python ; coding: utf-8 -*-
 
+import glob
+
 from PyInstaller.utils.hooks import collect_submodules
 
 block_cipher = None
@@ -16,6 +18,12 @@ DATAS = [
     ('data/*.json',        'data'),
 ]
 
+# Banco compilado (python -m models.bank_compiler compile [--shards]), si existe
+if glob.glob('data/*.qbank'):
+    DATAS.append(('data/*.qbank', 'data'))
+for shards in glob.glob('data/*.shards'):
+    DATAS.append((shards + '/*', shards))
+
 # Hidden imports que a veces no se detectan
 HIDDEN = ['tkextrafont', 'customtkinter'] + collect_submodules('pygame')
 
@@ -1,3 +1,5 @@
+import os
+import time
 import tkinter as tk
 from tkinter import ttk
 import tkextrafont as xfont  # noqa: F401
@@ -25,10 +27,15 @@ from views.how_to_play_view import HowToPlayView
 
 
 from utils.audio import MusicManager, SfxManager
+from utils.asset_cache import asset_cache
+from utils.perf import perf
+from utils.lru_cache import all_stats
+from utils.frame_scheduler import all_stats as frame_stats
+from utils.ticker import Ticker
 
 
 class App(tk.Tk):
-    def __init__(self):
+    def __init__(self, pool_views: bool = False):
         super().__init__()
 
         # ---------- ICONO (mismo .ico que el ejecutable) ----------
@@ -48,6 +55,9 @@ class App(tk.Tk):
 
         self.configure(bg="#27474b")
 
+        # Reloj único para animaciones y timers de las vistas (utils.ticker)
+        self.ticker = Ticker(self)
+
         # Audio
         music_path = assets_path("music", "halloween-114610.mp3")
         self.music = MusicManager(music_file=music_path, volume=0.3)
@@ -69,38 +79,80 @@ class App(tk.Tk):
         self.lvl_model = LevelsModel(self.qm, "data/levels.json")
         self.progress  = ProgressModel()
 
-        def switch_view(view: tk.Widget):
+        # Pool de vistas: con pool_views=True se guarda UNA instancia por tipo
+        # de vista; al salir se oculta (pack_forget) en vez de destruirse y al
+        # volver se reutiliza con reset() + on_show(state).
+        self.pool_views = bool(pool_views)
+        self._pool: dict[type, tk.Widget] = {}
+        self._shown: set[int] = set()
+        self._current_view = None
+        self._nav_t0 = None
+        self._nav_after = None
+
+        def switch_view(view: tk.Widget, state=None):
+            prev = self._current_view
             for child in self.container.winfo_children():
-                if child is not view:
+                if child is view:
+                    continue
+                if child is prev and hasattr(child, "on_hide"):
+                    child.on_hide()
+                self.ticker.cancel_owner(child)
+                if self.pool_views and self._pool.get(type(child)) is child:
+                    child.pack_forget()
+                else:
+                    self._shown.discard(id(child))
                     child.destroy()
+
             view.pack(expand=True, fill="both")
+            if id(view) in self._shown and hasattr(view, "on_show"):
+                view.on_show(state)
+            self._shown.add(id(view))
+            self._current_view = view
+            self._measure_switch(prev, view)
+
+        def pooled(cls, create):
+            """Instancia del pool (tras reset()) o una nueva creada con `create`."""
+            self._nav_t0 = time.perf_counter()
+            v = self._pool.get(cls) if self.pool_views else None
+            if v is None:
+                v = create()
+                if self.pool_views:
+                    self._pool[cls] = v
+            else:
+                v.reset()
+            return v
 
         # ---------- Factories ----------
         def build_how_to_play_view() -> HowToPlayView:
             hc = HowToPlayController(to_menu=lambda: switch_view(build_menu_view()))
-            return HowToPlayView(
+            v = pooled(HowToPlayView, lambda: HowToPlayView(
                 self.container,
                 hc,
                 switch_view,
                 sound_manager=self.music,
                 sfx_manager=self.sfx,
-            )
+            ))
+            v.controller = hc  # la vista del pool no debe quedarse con el controller de su creación
+            return v
 
         def build_menu_view() -> MenuView:
             mc = MenuController(switch_view, build_levels_view, build_credits_view, build_how_to_play_view)
-            return MenuView(
+            v = pooled(MenuView, lambda: MenuView(
                 self.container, mc, switch_view,
                 sound_manager=self.music, sfx_manager=self.sfx
-            )
+            ))
+            v.controller = mc
+            return v
 
         def build_levels_view() -> LevelsView:
             lc = LevelsController(switch_view, lambda level: build_play_view(level), self.progress)
-            v = LevelsView(
+            v = pooled(LevelsView, lambda: LevelsView(
                 self.container, lc, self.progress,
                 self.lvl_model.total_levels(), switch_view,
                 sound_manager=self.music, sfx_manager=self.sfx
-            )
+            ))
             lc.on_menu = lambda: switch_view(build_menu_view())
+            v.controller = lc
             v.refresh()
             return v
 
@@ -111,23 +163,27 @@ class App(tk.Tk):
                 to_levels=lambda: switch_view(build_levels_view())
             )
 
-            return CongratulationsView(
+            v = pooled(CongratulationsView, lambda: CongratulationsView(
                 self.container,
                 cc,
                 switch_view,
                 sound_manager=self.music,
                 sfx_manager=self.sfx
-            )
+            ))
+            v.controller = cc
+            return v
         
         def build_credits_view() -> CreditsView:
             cc = CreditsController(to_menu=lambda: switch_view(build_menu_view()))
-            return CreditsView(
+            v = pooled(CreditsView, lambda: CreditsView(
                 self.container,
                 cc,
                 switch_view,
                 sound_manager=self.music,
                 sfx_manager=self.sfx
-            )
+            ))
+            v.controller = cc
+            return v
 
 
         def build_play_view(level_num: int) -> PlayView:
@@ -137,11 +193,11 @@ class App(tk.Tk):
                 if play_now and level_to_open is not None and level_to_open <= self.progress.unlocked():
                     switch_view(build_play_view(level_to_open))
 
-            v = PlayView(
+            v = pooled(PlayView, lambda: PlayView(
                 self.container, None, switch_view,
                 sound_manager=self.music,
                 sfx_manager=self.sfx
-            )
+            ))
 
             _ = PlayController(
                 view=v,
@@ -157,6 +213,53 @@ class App(tk.Tk):
 
         switch_view(build_menu_view())
 
+    # ---------- Cierre ----------
+    def close(self) -> None:
+        """Libera lo que los modelos tengan abierto (se puede llamar más de una vez)."""
+        self.qm.close()
+
+    def destroy(self):
+        self.close()
+        super().destroy()
+
+    # ---------- Métrica de cambio de vista ----------
+    def _measure_switch(self, prev, view):
+        """
+        Registra en utils.perf el tiempo desde que empezó la navegación (factory)
+        hasta que Tk procesa la vista nueva: "switch:<Origen>-><Destino>".
+        """
+        if self._nav_t0 is None:
+            return
+        t0, self._nav_t0 = self._nav_t0, None
+        name = f"switch:{type(prev).__name__ if prev else 'None'}->{type(view).__name__}"
+        if self._nav_after:
+            self.after_cancel(self._nav_after)
+
+        def done():
+            self._nav_after = None
+            perf.record(name, (time.perf_counter() - t0) * 1000.0)
+
+        self._nav_after = self.after(0, done)
+
+
+def print_perf_report(app: App) -> None:
+    """Estadísticas de caches, frames, ticker y tiempos (solo con LEGENDS_PERF=1)."""
+    print("[Ticker]", app.ticker.stats())
+    print("[AssetCache]", asset_cache.stats())
+    for st in all_stats():
+        print("[Cache]", st)
+    for st in frame_stats():
+        print("[Frame]", st)
+    print("[Perf]", perf.summary())
+
 
 if __name__ == "__main__":
-    App().mainloop()
+    # LEGENDS_POOL_VIEWS=1 reutiliza las vistas en vez de recrearlas
+    app = App(pool_views=os.environ.get("LEGENDS_POOL_VIEWS") == "1")
+    try:
+        app.mainloop()
+    finally:
+        app.close()  # "Exit" del menú sale con sys.exit() sin pasar por destroy()
+    # LEGENDS_PERF=1 imprime las estadísticas al salir
+    if os.environ.get("LEGENDS_PERF") == "1":
+        print_perf_report(app)
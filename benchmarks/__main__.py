@@ -0,0 +1,146 @@
+"""
+Corre todos los benchmarks y guarda el resultado en JSON para comparar
+corridas en el tiempo.
+
+Cada suite expone run(...) y devuelve filas serializables; aquí solo se
+juntan bajo su nombre junto con metadatos de la máquina. Una suite que
+falla (p.ej. falta Pillow) queda registrada como {"error": ...} y el
+resto sigue.
+
+Cada suite corre en su propio proceso: las que crean un tk.Tk() dejan
+caches de módulo (PhotoImage, Font) atados a ese intérprete, que no
+sirven para la raíz de la suite siguiente. Si no hay $DISPLAY, el Xvfb
+se levanta una sola vez aquí y lo heredan todos los procesos.
+
+Uso:
+    python -m benchmarks [--repeat N] [--only models,views] [--out FILE]
+"""
+import argparse
+import datetime
+import importlib
+import inspect
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+SUITES = ["models", "factories", "background", "raster", "path", "play_render", "views"]
+TK_SUITES = {"play_render", "views"}
+OUT_DIR = "benchmarks/results"
+
+
+def _git_rev():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"],
+                                       stderr=subprocess.DEVNULL, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _meta():
+    return {
+        "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+        "git": _git_rev(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+    }
+
+
+def run_suite(name: str, repeat: int):
+    mod = importlib.import_module(f"benchmarks.bench_{name}")
+    t0 = time.perf_counter()
+    kwargs = {"repeat": repeat} if "repeat" in inspect.signature(mod.run).parameters else {}
+    rows = mod.run(**kwargs)
+    return {"elapsed_s": round(time.perf_counter() - t0, 2), "results": rows}
+
+
+def _worker(name: str, repeat: int, path: str) -> None:
+    """Proceso hijo: corre una suite y deja el resultado en `path`."""
+    try:
+        res = run_suite(name, repeat)
+    except Exception as e:  # ImportError de deps opcionales, Tk sin display, ...
+        res = {"error": f"{type(e).__name__}: {e}"}
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(res, f)
+
+
+def run_isolated(name: str, repeat: int) -> dict:
+    """run_suite en un proceso nuevo (su salida va a stderr)."""
+    fd, path = tempfile.mkstemp(suffix=".json")
+    os.close(fd)
+    try:
+        proc = subprocess.run([sys.executable, "-m", "benchmarks", "--worker", name, path, "--repeat", str(repeat)],
+                              stdout=sys.stderr, stderr=subprocess.PIPE, text=True)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            tail = proc.stderr.strip().splitlines()[-1:] or [f"exit code {proc.returncode}"]
+            return {"error": f"worker failed: {tail[0]}"}
+    finally:
+        os.remove(path)
+
+
+def run(suites=SUITES, repeat: int = 5) -> dict:
+    out = {"meta": _meta(), "suites": {}}
+    xvfb = skip = None
+    if TK_SUITES.intersection(suites):
+        from benchmarks.bench_views import _ensure_display
+        xvfb, skip = _ensure_display()
+    try:
+        for name in suites:
+            if skip and name in TK_SUITES:
+                out["suites"][name] = {"skipped": skip}
+                continue
+            out["suites"][name] = run_isolated(name, repeat)
+    finally:
+        if xvfb is not None:
+            xvfb.terminate()
+    return out
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--repeat", type=int, default=5)
+    ap.add_argument("--only", default="", help="suites separadas por coma (default: todas)")
+    ap.add_argument("--out", default=None,
+                    help=f"archivo JSON de salida (default: {OUT_DIR}/<fecha>.json; '-' = stdout)")
+    ap.add_argument("--worker", nargs=2, metavar=("SUITE", "FILE"), help=argparse.SUPPRESS)
+    args = ap.parse_args()
+
+    if args.worker:
+        _worker(args.worker[0], args.repeat, args.worker[1])
+        return
+
+    suites = [s.strip() for s in args.only.split(",") if s.strip()] or SUITES
+    unknown = [s for s in suites if s not in SUITES]
+    if unknown:
+        ap.error(f"suites desconocidas: {', '.join(unknown)} (disponibles: {', '.join(SUITES)})")
+
+    data = run(suites, args.repeat)
+
+    if args.out == "-":
+        json.dump(data, sys.stdout, indent=2)
+        print()
+        return
+    path = args.out
+    if path is None:
+        os.makedirs(OUT_DIR, exist_ok=True)
+        stamp = datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
+        path = os.path.join(OUT_DIR, f"{stamp}.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+
+    for name, res in data["suites"].items():
+        status = res.get("error") or (f"skipped: {res['skipped']}" if "skipped" in res else f"ok ({res['elapsed_s']} s)")
+        print(f"{name:<12} {status}")
+    print("->", path)
+
+
+if __name__ == "__main__":
+    main()
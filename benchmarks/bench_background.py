@@ -0,0 +1,82 @@
+# benchmarks/bench_background.py
+"""
+Micro-benchmark del redibujo de fondo (sin Tk: solo el trabajo de PIL).
+
+Compara, para tamaños de ventana comunes:
+  - legacy : resize LANCZOS del original completo + crop (código anterior)
+  - final  : LANCZOS desde el mipmap más chico que cubre la ventana
+  - fast   : BILINEAR desde un mipmap más chico (ruta de arrastre)
+
+Uso:
+    python -m benchmarks.bench_background [--repeat N]
+"""
+import argparse
+import time
+
+from PIL import Image
+
+from utils.resource_path import assets_path
+from utils.asset_cache import load_image, load_mipmaps
+from utils.background import FAST_MIP_SCALE, cover_resize
+from utils.mipmap import pick_mip
+
+ASSETS = [("images", "bg.jpg"), ("images", "levels_spooky.png")]
+SIZES = [(680, 450), (1080, 720), (1366, 768), (1920, 1080)]
+
+
+def _legacy(src, w, h):
+    sw, sh = src.size
+    scale = max(w / sw, h / sh)
+    bg = src.resize((max(1, int(sw * scale)), max(1, int(sh * scale))), Image.Resampling.LANCZOS)
+    left = (bg.width - w) // 2
+    top = (bg.height - h) // 2
+    return bg.crop((left, top, left + w, top + h))
+
+
+def _time_ms(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, (time.perf_counter() - t0) * 1000.0)
+    return best
+
+
+def run(repeat: int = 5) -> list[dict]:
+    """Devuelve una fila por (asset, tamaño) con el mejor tiempo (ms) de cada ruta."""
+    rows = []
+    for parts in ASSETS:
+        path = assets_path(*parts)
+        src = load_image(path, "RGB")
+        mips = load_mipmaps(path)
+        for w, h in SIZES:
+            fast_src = pick_mip(mips, int(w * FAST_MIP_SCALE), int(h * FAST_MIP_SCALE))
+            final_src = pick_mip(mips, w, h)
+            rows.append({
+                "asset": parts[-1],
+                "size": f"{w}x{h}",
+                "src": f"{src.width}x{src.height}",
+                "mip": f"{final_src.width}x{final_src.height}",
+                "legacy_ms": round(_time_ms(lambda: _legacy(src, w, h), repeat), 2),
+                "final_ms": round(_time_ms(
+                    lambda: cover_resize(final_src, w, h, Image.Resampling.LANCZOS), repeat), 2),
+                "fast_ms": round(_time_ms(
+                    lambda: cover_resize(fast_src, w, h, Image.Resampling.BILINEAR), repeat), 2),
+            })
+    return rows
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--repeat", type=int, default=5)
+    args = ap.parse_args()
+
+    rows = run(args.repeat)
+    print(f"{'asset':<20}{'size':>11}{'mip':>11}{'legacy':>10}{'final':>10}{'fast':>10}")
+    for r in rows:
+        print(f"{r['asset']:<20}{r['size']:>11}{r['mip']:>11}"
+              f"{r['legacy_ms']:>10.1f}{r['final_ms']:>10.1f}{r['fast_ms']:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
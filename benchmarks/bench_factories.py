@@ -0,0 +1,104 @@
+# benchmarks/bench_factories.py
+"""
+Micro-benchmark de las fábricas de imágenes PIL de las vistas (sin Tk).
+
+Para cada tamaño de ventana entre minsize y maxsize de App se calcula la
+ui_scale de las vistas y se miden, con la geometría que usan ellas:
+  - panel   : tarjeta de PlayView (_make_panel_img / _card_photo)
+  - button  : botón de respuesta con sombra (_make_button_img)
+  - round   : botón de navegación (_make_round_img)
+  - token   : nodo del mapa (LevelsView._token_img)
+  - bg_fast / bg_final : trabajo PIL de _redraw_background (arrastre / asentado)
+
+"cold" vacía render_cache antes de cada llamada; "warm" es un hit de cache.
+PhotoImage no se mide (necesita Tk; ver bench_views).
+
+Uso:
+    python -m benchmarks.bench_factories [--repeat N]
+"""
+import argparse
+import time
+
+from utils.asset_cache import load_mipmaps
+from utils.background import FAST_MIP_SCALE, FAST_RESAMPLE, FINAL_RESAMPLE, cover_resize
+from utils.mipmap import MIN_VIEW_SIZE, pick_mip
+from utils.render_cache import panel_image, render_cache, round_rect_image, token_image
+from utils.resource_path import assets_path
+from utils.ui_scale import scale_for
+from views.levels_view import LevelsView
+from views.play_view import PlayView
+
+# minsize de App == MIN_VIEW_SIZE; maxsize de App
+MAX_SIZE = (1920, 1080)
+SIZES = [MIN_VIEW_SIZE, (800, 533), (900, 600), (1080, 720), (1366, 768), MAX_SIZE]
+
+
+def ui_scale(w: int, h: int) -> float:
+    """Misma regla que _set_scale_from_canvas: bucket de utils.ui_scale."""
+    return scale_for(w, h, PlayView.BASE_W, PlayView.BASE_H)
+
+
+def _cases(w, h):
+    s = ui_scale(w, h)
+
+    def S(v):
+        return max(1, int(round(v * s)))
+
+    P, L = PlayView, LevelsView
+    card_w = max(S(420), min(w - S(24), S(1000)))
+    return s, {
+        "panel": lambda: panel_image(card_w, S(P.CARD_H), S(P.CARD_R), P.CARD,
+                                     (0, 0, 0, 90), (0, S(P.SH_OFF)), S(P.SH_BLUR)),
+        "button": lambda: panel_image(S(P.BTN_W), S(P.BTN_H), S(P.BTN_R), "#110D2E",
+                                      (0, 0, 0, P.BTN_SH_ALPHA), (0, S(P.BTN_SH_OFF)), S(P.BTN_SH_BLUR)),
+        "round": lambda: round_rect_image(S(P.NAV_W), S(P.NAV_H), S(P.NAV_R), "#110D2E"),
+        "token": lambda: token_image(S(L.NODE_D_BASE), L.PRIMARY, L.PRIMARY_BORDER,
+                                     S(L.SH_OFF_BASE), S(L.SH_BLUR_BASE),
+                                     max(1, int(round(8 * 4 * s))), aa=4),
+    }
+
+
+def _best(fn, repeat, cold):
+    best = float("inf")
+    for _ in range(repeat):
+        if cold:
+            render_cache.clear()
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, (time.perf_counter() - t0) * 1000.0)
+    return best
+
+
+def run(repeat: int = 5) -> list[dict]:
+    mips = load_mipmaps(assets_path("images", "bg.jpg"))
+    rows = []
+    for w, h in SIZES:
+        s, cases = _cases(w, h)
+        row = {"size": f"{w}x{h}", "scale": round(s, 3)}
+        for name, fn in cases.items():
+            row[f"{name}_cold_ms"] = round(_best(fn, repeat, cold=True), 3)
+            fn()
+            row[f"{name}_warm_ms"] = round(_best(fn, repeat, cold=False), 4)
+
+        k = FAST_MIP_SCALE
+        fast_src = pick_mip(mips, max(1, int(w * k)), max(1, int(h * k)))
+        row["bg_fast_ms"] = round(_best(lambda: cover_resize(fast_src, w, h, FAST_RESAMPLE), repeat, False), 3)
+        row["bg_final_ms"] = round(_best(
+            lambda: cover_resize(pick_mip(mips, w, h), w, h, FINAL_RESAMPLE), repeat, False), 3)
+        rows.append(row)
+    return rows
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--repeat", type=int, default=5)
+    args = ap.parse_args()
+    rows = run(args.repeat)
+    cols = [k for k in rows[0] if k.endswith("_ms")]
+    print(f"{'size':>10} {'scale':>5} " + " ".join(f"{c[:-3]:>12}" for c in cols))
+    for r in rows:
+        print(f"{r['size']:>10} {r['scale']:>5} " + " ".join(f"{r[c]:>12.3f}" for c in cols))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+# benchmarks/bench_models.py
+"""
+Micro-benchmark de los modelos (sin Tk).
+
+  - QuestionModel / LevelsModel: carga desde data/*.json
+  - ProgressModel.save: con 1, 50 y 500 niveles con estrellas (archivo temporal)
+  - memoria por pregunta de un banco sintético de --bank preguntas:
+    lista de dicts + by_id (antes) vs QuestionStore (ahora)
+  - arranque de QuestionModel + 5 get() desde JSON vs banco compilado
+    (.qbank) para bancos de 1k / 100k / 300k preguntas, cada uno en un
+    proceso aparte para medir el RSS máximo
+
+Uso:
+    python -m benchmarks.bench_models [--repeat N] [--bank N]
+"""
+import argparse
+import gc
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from models.questions_model import QuestionModel
+from models.levels_model import LevelsModel
+from models.progress_model import ProgressModel
+from models.bank_compiler import compile_bank
+from models.question_store import QuestionStore
+
+QUESTIONS = "data/questions.json"
+LEVELS = "data/levels.json"
+PROGRESS_LEVELS = [1, 50, 500]
+BANK_SIZE = 100_000
+STARTUP_SIZES = [1_000, 100_000, 300_000]
+
+# Corre en un proceso limpio: tiempo de QuestionModel(path) + 5 get() y RSS máximo
+_STARTUP_SCRIPT = """
+import resource, sys, time
+t0 = time.perf_counter()
+from models.questions_model import QuestionModel
+qm = QuestionModel(sys.argv[1])
+for i in range(5):
+    qm.get("D%d" % (i * 7919 % int(sys.argv[2])))
+ms = (time.perf_counter() - t0) * 1000.0
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+try:  # VmHWM es del proceso nuevo; ru_maxrss puede heredar el pico del padre
+    with open("/proc/self/status") as f:
+        rss = next(int(l.split()[1]) for l in f if l.startswith("VmHWM:"))
+except (OSError, StopIteration):
+    pass
+print(type(qm.store).__name__, ms, rss)
+"""
+
+
+def _time_ms(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, (time.perf_counter() - t0) * 1000.0)
+    return best
+
+
+def synthetic_bank(n: int) -> str:
+    """JSON de n preguntas: las reales repetidas con ids únicos y texto variado."""
+    with open(QUESTIONS, "r", encoding="utf-8") as f:
+        base = json.load(f)
+    out = []
+    for i in range(n):
+        q = dict(base[i % len(base)])
+        q["id"] = f"D{i}"
+        q["question"] = f"{q['question']} ({i})"
+        out.append(q)
+    return json.dumps(out)
+
+
+def _retained_bytes(build) -> tuple[int, object]:
+    """Bytes que siguen vivos después de build() (tracemalloc)."""
+    gc.collect()
+    tracemalloc.start()
+    obj = build()
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size, obj
+
+
+def memory_rows(n: int = BANK_SIZE) -> list[dict]:
+    text = synthetic_bank(n)
+
+    def legacy():
+        questions = json.loads(text)
+        return questions, {q["id"]: q for q in questions}
+
+    rows = []
+    for case, build in (("questions.dicts", legacy),
+                        ("questions.store", lambda: QuestionStore.from_records(json.loads(text)))):
+        size, obj = _retained_bytes(build)
+        rows.append({"case": case, "n": n, "bytes_per_q": round(size / n, 1)})
+        del obj
+    return rows
+
+
+def startup_rows(sizes=STARTUP_SIZES) -> list[dict]:
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in sizes:
+            text = synthetic_bank(n)
+            json_only = os.path.join(tmp, f"json_{n}", "questions.json")
+            compiled = os.path.join(tmp, f"bank_{n}", "questions.json")
+            for path in (json_only, compiled):
+                os.makedirs(os.path.dirname(path))
+                with open(path, "w", encoding="utf-8") as f:
+                    f.write(text)
+            compile_bank(compiled, os.path.join(os.path.dirname(compiled), "levels.json"))
+            del text
+
+            for path in (json_only, compiled):
+                out = subprocess.run([sys.executable, "-c", _STARTUP_SCRIPT, path, str(n)],
+                                     capture_output=True, text=True, check=True).stdout.split()
+                rows.append({"case": f"startup.{out[0]}", "n": n,
+                             "best_ms": round(float(out[1]), 2), "max_rss_kb": int(out[2])})
+    return rows
+
+
+def run(repeat: int = 5, bank: int = BANK_SIZE, startup: bool = True) -> list[dict]:
+    rows = []
+    qm = QuestionModel(QUESTIONS)
+    rows.append({"case": "QuestionModel.load", "n": len(qm.all_ids()),
+                 "best_ms": round(_time_ms(lambda: QuestionModel(QUESTIONS), repeat), 3)})
+    lm = LevelsModel(qm, LEVELS)
+    rows.append({"case": "LevelsModel.load", "n": lm.total_levels(),
+                 "best_ms": round(_time_ms(lambda: LevelsModel(qm, LEVELS), repeat), 3)})
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in PROGRESS_LEVELS:
+            pm = ProgressModel(os.path.join(tmp, f"progress_{n}.json"))
+            pm.data = {"unlocked": n, "stars": {str(i): 3 for i in range(1, n + 1)}}
+            rows.append({"case": "ProgressModel.save", "n": n,
+                         "best_ms": round(_time_ms(pm.save, repeat), 3)})
+
+    if bank:
+        rows.extend(memory_rows(bank))
+    if startup:
+        rows.extend(startup_rows())
+    return rows
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--repeat", type=int, default=5)
+    ap.add_argument("--bank", type=int, default=BANK_SIZE, help="preguntas del banco sintético (0 = omitir)")
+    ap.add_argument("--no-startup", action="store_true", help="omitir JSON vs .qbank por tamaño")
+    args = ap.parse_args()
+    for r in run(args.repeat, args.bank, not args.no_startup):
+        if "max_rss_kb" in r:
+            print(f"{r['case']:<24} n={r['n']:<7} {r['best_ms']:9.1f} ms  rss {r['max_rss_kb'] / 1024:7.1f} MiB")
+        elif "bytes_per_q" in r:
+            print(f"{r['case']:<20} n={r['n']:<5} {r['bytes_per_q']:8.1f} B/question")
+        else:
+            print(f"{r['case']:<20} n={r['n']:<5} {r['best_ms']:8.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
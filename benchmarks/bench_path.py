@@ -0,0 +1,96 @@
+# benchmarks/bench_path.py
+"""
+Micro-benchmark del muestreo de caminos del mapa de niveles (sin Tk).
+
+Compara, para polilíneas de distinto largo y n nodos:
+  - legacy : recorre los segmentos desde el inicio para cada nodo (O(n·s))
+  - index  : PathIndex (longitudes acumuladas) sin cache
+  - cached : resample_path() con la entrada ya en cache (re-layout)
+
+Uso:
+    python -m benchmarks.bench_path [--nodes N] [--repeat R]
+"""
+import argparse
+import math
+import time
+
+from utils.path_index import PathIndex, resample_path
+
+VERTICES = [6, 100, 500]
+
+
+def _legacy(poly, n):
+    segs = []
+    total = 0.0
+    for i in range(len(poly) - 1):
+        x1, y1 = poly[i]
+        x2, y2 = poly[i + 1]
+        d = math.hypot(x2 - x1, y2 - y1)
+        segs.append((d, (x1, y1), (x2, y2)))
+        total += d
+    out = []
+    for k in range(n):
+        t = (k / (n - 1)) * total
+        acc = 0.0
+        for d, (x1, y1), (x2, y2) in segs:
+            if acc + d >= t:
+                u = (t - acc) / d if d > 0 else 0
+                out.append((x1 + u * (x2 - x1), y1 + u * (y2 - y1)))
+                break
+            acc += d
+    return out
+
+
+def _snake(vertices):
+    """Polilínea en zig-zag hacia arriba, ~6 vértices por página."""
+    pts = []
+    for i in range(vertices):
+        x = 0.2 + 0.6 * (0.5 + 0.5 * math.sin(i * 0.9))
+        pts.append((x, 0.82 - i * 0.17))
+    return pts
+
+
+def _time_ms(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, (time.perf_counter() - t0) * 1000.0)
+    return best
+
+
+def run(nodes: int = 10000, repeat: int = 3) -> list[dict]:
+    rows = []
+    for v in VERTICES:
+        poly = _snake(v)
+        ref = _legacy(poly, nodes)
+        got = PathIndex(poly).sample(nodes)
+        # el legacy puede perder el último punto por redondeo: comparar lo común
+        err = max(math.hypot(a[0] - b[0], a[1] - b[1]) for a, b in zip(ref, got))
+        resample_path(poly, nodes)  # calienta la cache
+        rows.append({
+            "vertices": v,
+            "nodes": nodes,
+            "legacy_ms": round(_time_ms(lambda: _legacy(poly, nodes), repeat), 2),
+            "index_ms": round(_time_ms(lambda: PathIndex(poly).sample(nodes), repeat), 2),
+            "cached_ms": round(_time_ms(lambda: resample_path(poly, nodes), repeat), 3),
+            "max_err": err,
+            "legacy_points": len(ref),
+        })
+    return rows
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--nodes", type=int, default=10000)
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+
+    print(f"{'vertices':>8} {'nodes':>6} {'legacy':>10} {'index':>9} {'cached':>8} {'max_err':>9}")
+    for r in run(args.nodes, args.repeat):
+        print(f"{r['vertices']:>8} {r['nodes']:>6} {r['legacy_ms']:>8.1f}ms {r['index_ms']:>7.1f}ms "
+              f"{r['cached_ms']:>6.2f}ms {r['max_err']:>9.2e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+# benchmarks/bench_play_render.py
+"""
+Tiempo por pregunta de PlayView.render_question (necesita display; sin
+$DISPLAY se levanta `Xvfb` como en bench_views, o se reporta "skipped").
+
+Recorre las preguntas de un nivel ida y vuelta (alternando mcq de 4
+opciones y truefalse de 2) con:
+  - retained : RETAIN_ITEMS = True  (items de tarjeta/botones reutilizados)
+  - rebuild  : RETAIN_ITEMS = False (se borran y recrean en cada pregunta)
+
+Uso:
+    python -m benchmarks.bench_play_render [--level N] [--rounds R]
+"""
+import argparse
+import statistics
+import time
+import tkinter as tk
+
+from benchmarks.bench_views import _ensure_display
+from models.questions_model import QuestionModel
+from models.levels_model import LevelsModel
+from views.play_view import PlayView
+
+
+class _StubController:
+    """Lo mínimo que PlayView usa del PlayController."""
+
+    def __init__(self, level):
+        self.level = level
+
+    def level_title(self):
+        return f"Level {self.level}"
+
+    def __getattr__(self, name):
+        return lambda *a, **k: None
+
+
+def _run_mode(root, questions, retain: bool, rounds: int) -> list[float]:
+    PlayView.RETAIN_ITEMS = retain
+    v = PlayView(root, _StubController(1), switch_view=lambda *_: None)
+    v.pack(expand=True, fill="both")
+    root.update()
+
+    order = list(range(len(questions))) + list(range(len(questions) - 2, 0, -1))
+    samples = []
+    for _ in range(rounds):
+        for i in order:
+            t0 = time.perf_counter()
+            v.render_question(questions[i], i, len(questions))
+            root.update_idletasks()
+            samples.append((time.perf_counter() - t0) * 1000.0)
+    items = len(v.canvas.find_all())
+    v.destroy()
+    print(f"  canvas items al final: {items}")
+    return samples
+
+
+def run(level: int = 1, rounds: int = 20) -> dict:
+    qm = QuestionModel("data/questions.json")
+    lm = LevelsModel(qm, "data/levels.json")
+    questions = [qm.get(qid) for qid in lm.questions_for_level(level)]
+
+    proc, skip = _ensure_display()
+    if skip:
+        return {"skipped": skip}
+    out = {}
+    root = None
+    try:
+        root = tk.Tk()
+        root.geometry("1080x720")
+        for name, retain in (("rebuild", False), ("retained", True)):
+            print(f"{name}:")
+            s = _run_mode(root, questions, retain, rounds)
+            out[name] = {
+                "n": len(s),
+                "mean_ms": round(statistics.mean(s), 3),
+                "p95_ms": round(sorted(s)[int(0.95 * (len(s) - 1))], 3),
+            }
+            print(f"  mean {out[name]['mean_ms']:.2f} ms   p95 {out[name]['p95_ms']:.2f} ms")
+    finally:
+        PlayView.RETAIN_ITEMS = True
+        if root is not None:
+            root.destroy()
+        if proc is not None:
+            proc.terminate()
+    return out
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--level", type=int, default=1)
+    ap.add_argument("--rounds", type=int, default=20)
+    args = ap.parse_args()
+    run(args.level, args.rounds)
+
+
+if __name__ == "__main__":
+    main()
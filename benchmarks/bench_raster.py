@@ -0,0 +1,103 @@
+# benchmarks/bench_raster.py
+"""
+Rasterizado de formas: PIL (4x + GaussianBlur + LANCZOS) vs SDF NumPy (1x).
+
+Para cada caso mide el mejor tiempo (ms) de ambos caminos y la diferencia
+de pixeles, comparando en RGBA premultiplicado (así un pixel casi
+transparente no cuenta como error de color):
+  - max  : mayor diferencia absoluta de un canal (0..255)
+  - mean : diferencia media por canal
+
+Con --check termina con código 1 si algún caso supera las tolerancias
+(MAX_DIFF / MEAN_DIFF); sirve como prueba de regresión visual.
+
+Uso:
+    python -m benchmarks.bench_raster [--repeat N] [--check]
+"""
+import argparse
+import sys
+import time
+
+from utils import render_cache as rc
+from utils import sdf_raster
+
+# Tolerancias de la comparación (los bordes AA difieren un poco: LANCZOS
+# tiene "ringing" y ImageDraw ubica el arco ~1/8 px hacia adentro)
+MAX_DIFF = 64
+MEAN_DIFF = 2.5
+
+# (nombre, args PIL, args NumPy) con medidas reales de las vistas a escala 1.0
+CASES = [
+    ("button 280x72 r18", lambda: rc._pil_panel(280, 72, 18, "#110D2E", (0, 0, 0, 90), 0, 6, 3, 4),
+     lambda: sdf_raster.panel(280, 72, 18, "#110D2E", (0, 0, 0, 90), 0, 6, 3)),
+    ("card 1000x160 r22", lambda: rc._pil_panel(1000, 160, 22, "#CCCCCC", (0, 0, 0, 90), 0, 8, 3, 4),
+     lambda: sdf_raster.panel(1000, 160, 22, "#CCCCCC", (0, 0, 0, 90), 0, 8, 3)),
+    ("round 200x56 r16", lambda: rc._pil_round_rect(200, 56, 16, "#255B88", None, 0, 4),
+     lambda: sdf_raster.round_rect(200, 56, 16, "#255B88")),
+    ("round+outline 320x64", lambda: rc._pil_round_rect(320, 64, 20, "#110D2E", "#FFFFFF", 2, 4),
+     lambda: sdf_raster.round_rect(320, 64, 20, "#110D2E", "#FFFFFF", 2)),
+    ("token d=64", lambda: rc._pil_token(64, "#2B6EA6", "#1F5A86", 6, 4, 23, 4),
+     lambda: sdf_raster.token(64, "#2B6EA6", "#1F5A86", 6, 4, 23 / 4)),
+    ("token d=90", lambda: rc._pil_token(90, "#2B6EA6", "#1F5A86", 8, 6, 32, 4),
+     lambda: sdf_raster.token(90, "#2B6EA6", "#1F5A86", 8, 6, 8)),
+]
+
+
+def _time_ms(fn, repeat):
+    best = float("inf")
+    out = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        out = fn()
+        best = min(best, (time.perf_counter() - t0) * 1000.0)
+    return best, out
+
+
+def pixel_diff(a, b) -> tuple[float, float]:
+    """(max, mean) de |a - b| en RGBA premultiplicado."""
+    np = sdf_raster.np
+    A = np.asarray(a.convert("RGBA"), dtype=np.float64)
+    B = np.asarray(b.convert("RGBA"), dtype=np.float64)
+    A[..., :3] *= A[..., 3:4] / 255.0
+    B[..., :3] *= B[..., 3:4] / 255.0
+    d = np.abs(A - B)
+    return float(d.max()), float(d.mean())
+
+
+def run(repeat: int = 5) -> list[dict]:
+    if not sdf_raster.HAVE_NUMPY:
+        raise SystemExit("NumPy no está instalado: solo existe el camino PIL.")
+    rows = []
+    for name, pil_fn, np_fn in CASES:
+        pil_ms, pil_img = _time_ms(pil_fn, repeat)
+        np_ms, np_img = _time_ms(np_fn, repeat)
+        mx, mean = pixel_diff(pil_img, np_img)
+        rows.append({
+            "case": name,
+            "pil_ms": round(pil_ms, 2),
+            "numpy_ms": round(np_ms, 2),
+            "speedup": round(pil_ms / np_ms, 1) if np_ms else None,
+            "max_diff": round(mx, 1),
+            "mean_diff": round(mean, 3),
+            "ok": mx <= MAX_DIFF and mean <= MEAN_DIFF,
+        })
+    return rows
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--repeat", type=int, default=5)
+    ap.add_argument("--check", action="store_true", help="falla si se superan las tolerancias")
+    args = ap.parse_args()
+
+    rows = run(args.repeat)
+    print(f"{'case':<24}{'pil ms':>9}{'numpy ms':>10}{'x':>6}{'max':>7}{'mean':>8}")
+    for r in rows:
+        print(f"{r['case']:<24}{r['pil_ms']:>9.1f}{r['numpy_ms']:>10.1f}{r['speedup']:>6}"
+              f"{r['max_diff']:>7.0f}{r['mean_diff']:>8.3f}{'' if r['ok'] else '  FAIL'}")
+    if args.check and not all(r["ok"] for r in rows):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
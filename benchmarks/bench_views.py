@@ -0,0 +1,153 @@
+# benchmarks/bench_views.py
+"""
+Construcción completa de cada vista (constructor + primer layout) bajo un
+display X virtual, y cambio a esa vista cuando ya está en el pool de App
+(reset() + pack + on_show + layout), para comparar navegar con y sin
+LEGENDS_POOL_VIEWS=1.
+
+Si no hay $DISPLAY se intenta levantar `Xvfb` (si está en el PATH); si
+tampoco, el resultado indica "skipped" en vez de fallar. Vistas cuyas
+dependencias no estén instaladas (p.ej. customtkinter) se reportan igual.
+
+Uso:
+    python -m benchmarks.bench_views [--repeat N] [--levels N]
+"""
+import argparse
+import importlib
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+
+XVFB_DISPLAY = ":99"
+GEOMETRY = "1080x720"
+
+
+class _StubController:
+    """Responde a cualquier callback del controller sin hacer nada."""
+
+    def level_title(self):
+        return "Level 1"
+
+    def __getattr__(self, name):
+        return lambda *a, **k: None
+
+
+def _ensure_display():
+    """Devuelve (proceso Xvfb o None, motivo de skip o None)."""
+    if os.environ.get("DISPLAY"):
+        return None, None
+    xvfb = shutil.which("Xvfb")
+    if not xvfb:
+        return None, "no $DISPLAY and Xvfb not found"
+    proc = subprocess.Popen([xvfb, XVFB_DISPLAY, "-screen", "0", "1920x1080x24"],
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    time.sleep(0.5)
+    os.environ["DISPLAY"] = XVFB_DISPLAY
+    return proc, None
+
+
+def _factories(progress, total_levels):
+    """(nombre, módulo, clase, fábrica(parent, cls))."""
+    c = _StubController()
+    nav = lambda *a, **k: None  # noqa: E731
+    return [
+        ("MenuView", "views.menu_view", "MenuView", lambda p, cls: cls(p, c, nav)),
+        ("LevelsView", "views.levels_view", "LevelsView",
+         lambda p, cls: cls(p, c, progress, total_levels, nav)),
+        ("PlayView", "views.play_view", "PlayView", lambda p, cls: cls(p, c, nav)),
+        ("HowToPlayView", "views.how_to_play_view", "HowToPlayView", lambda p, cls: cls(p, c, nav)),
+        ("CreditsView", "views.credits_view", "CreditsView", lambda p, cls: cls(p, c, nav)),
+        ("CongratulationsView", "views.congratulations_view", "CongratulationsView",
+         lambda p, cls: cls(p, c, nav)),
+    ]
+
+
+def _pooled_switch_ms(root, v, repeat: int) -> float:
+    """Mejor tiempo de volver a mostrar `v` como lo hace App.switch_view con pool."""
+    v.pack(expand=True, fill="both")
+    root.update()
+    best = float("inf")
+    for _ in range(repeat):
+        if hasattr(v, "on_hide"):
+            v.on_hide()
+        v.pack_forget()
+        root.update()
+        t0 = time.perf_counter()
+        if hasattr(v, "reset"):
+            v.reset()
+        v.pack(expand=True, fill="both")
+        if hasattr(v, "on_show"):
+            v.on_show(None)
+        root.update()
+        best = min(best, (time.perf_counter() - t0) * 1000.0)
+    v.destroy()
+    root.update()
+    return best
+
+
+def run(repeat: int = 3, total_levels: int = 6) -> dict:
+    proc, skip = _ensure_display()
+    if skip:
+        return {"skipped": skip, "views": []}
+
+    import tkinter as tk
+    from models.progress_model import ProgressModel
+
+    rows = []
+    try:
+        root = tk.Tk()
+        root.geometry(GEOMETRY)
+        with tempfile.TemporaryDirectory() as tmp:
+            progress = ProgressModel(os.path.join(tmp, "progress.json"))
+            for name, mod, cls_name, make in _factories(progress, total_levels):
+                try:
+                    cls = getattr(importlib.import_module(mod), cls_name)
+                except ImportError as e:
+                    rows.append({"view": name, "skipped": f"import: {e}"})
+                    continue
+                samples = []
+                items = 0
+                for _ in range(repeat):
+                    t0 = time.perf_counter()
+                    v = make(root, cls)
+                    v.pack(expand=True, fill="both")
+                    root.update()  # primer layout (after(0) / Configure)
+                    samples.append((time.perf_counter() - t0) * 1000.0)
+                    items = len(v.canvas.find_all())
+                    v.destroy()
+                    root.update()
+                pooled = _pooled_switch_ms(root, make(root, cls), repeat)
+                rows.append({
+                    "view": name,
+                    "first_ms": round(samples[0], 2),   # caches frías
+                    "best_ms": round(min(samples), 2),  # caches calientes = cambio sin pool
+                    "pooled_ms": round(pooled, 2),      # cambio con pool
+                    "canvas_items": items,
+                })
+        root.destroy()
+    finally:
+        if proc is not None:
+            proc.terminate()
+    return {"display": os.environ.get("DISPLAY"), "views": rows}
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--levels", type=int, default=6, help="total de niveles para LevelsView")
+    args = ap.parse_args()
+    out = run(args.repeat, args.levels)
+    if out.get("skipped"):
+        print("skipped:", out["skipped"])
+    for r in out["views"]:
+        if "skipped" in r:
+            print(f"{r['view']:<20} skipped ({r['skipped']})")
+        else:
+            print(f"{r['view']:<20} first {r['first_ms']:8.1f} ms   best {r['best_ms']:8.1f} ms   "
+                  f"pooled {r['pooled_ms']:7.1f} ms   items {r['canvas_items']}")
+
+
+if __name__ == "__main__":
+    main()
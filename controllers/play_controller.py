@@ -50,6 +50,13 @@ class PlayController:
         self.v.controller = self
         self._render_current()
 
+        # Mientras se lee la primera pregunta, la vista prepara el resto del nivel
+        self.v.precompute_level([self.qm.get(qid) for qid in self.qids])
+
+        # Y el modelo va cargando las preguntas del nivel siguiente (shards)
+        if self.level < self.total_levels:
+            self.qm.prefetch(self.lvl_model.questions_for_level(self.level + 1))
+
     # ----------------- Helpers -----------------
     def level_title(self):
         return f"Level {self.level}"
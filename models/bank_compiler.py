@@ -0,0 +1,255 @@
+# models/bank_compiler.py
+"""
+Compila questions.json + levels.json a un banco (.qbank) validado.
+
+- Valida en una sola pasada: ids únicos, tipos conocidos, opciones y
+  answer_index dentro de rango (mcq), answer_bool booleano (truefalse) y que
+  todo id referenciado en levels.json exista.
+- Guarda los niveles ya normalizados, los índices por categoría/tipo
+  (models.question_index) y el sello (tamaño, mtime, sha256) de cada
+  fuente; QuestionModel/LevelsModel usan el banco directamente mientras las
+  fuentes no cambien.
+- Con errores no se escribe nada (el banco anterior, si hay, queda intacto).
+- Con --shards escribe un directorio con un archivo por nivel en vez de un
+  único .qbank (models.question_shards).
+
+Uso:
+    python -m models.bank_compiler compile [--shards] [--questions data/questions.json] [--levels data/levels.json] [--out PATH]
+    python -m models.bank_compiler check   [--shards] [--questions ...] [--levels ...] [--out PATH]
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+from models.levels_model import LevelsModel
+from models.question_index import QuestionIndex
+from models.question_bank import (
+    BankFormatError, CompiledBank, bank_path_for, source_stamp, stamp_matches, write_bank,
+)
+from models.question_shards import ShardedBank, shards_path_for, write_shards
+from utils.resource_path import resource_path
+
+QUESTIONS = "data/questions.json"
+LEVELS = "data/levels.json"
+QUESTION_TYPES = ("mcq", "truefalse")
+MIN_OPTIONS = 2
+SHOW_ERRORS = 50
+
+
+class BankValidationError(ValueError):
+    """Las fuentes tienen errores; `errors` lista uno por línea."""
+
+    def __init__(self, errors: list[str]):
+        self.errors = errors
+        super().__init__(f"{len(errors)} error(es) de validación")
+
+
+class _IdsOnly:
+    """Lo único que LevelsModel necesita del modelo de preguntas para normalizar."""
+
+    def __init__(self, ids: list[str]):
+        self._ids = ids
+
+    def all_ids(self) -> list[str]:
+        return self._ids
+
+
+# ---------------- Validación ----------------
+def validate_questions(questions) -> tuple[list[str], set[str]]:
+    """
+    Una pasada sobre las preguntas. Retorna (errores, ids válidos).
+    Cada error empieza con el id (o la posición si el id no sirve).
+    """
+    if not isinstance(questions, list):
+        return [f"se esperaba una lista de preguntas, no {type(questions).__name__}"], set()
+
+    errors = []
+    err = errors.append
+    ids = set()
+    add = ids.add
+    for i, q in enumerate(questions):
+        if type(q) is not dict:
+            err(f"#{i}: la pregunta no es un objeto")
+            continue
+        qid = q.get("id")
+        if type(qid) is not str or not qid:
+            err(f"#{i}: id inválido {qid!r}")
+            where = f"#{i}"
+        elif qid in ids:
+            err(f"{qid}: id duplicado (#{i})")
+            where = qid
+        else:
+            add(qid)
+            where = qid
+
+        text = q.get("question")
+        if type(text) is not str or not text.strip():
+            err(f"{where}: falta el texto de la pregunta")
+
+        t = q.get("type")
+        if t == "mcq":
+            opts = q.get("options")
+            if type(opts) is not list or len(opts) < MIN_OPTIONS:
+                err(f"{where}: mcq necesita al menos {MIN_OPTIONS} opciones")
+                continue
+            for opt in opts:
+                if type(opt) is not str:
+                    err(f"{where}: opción no es texto: {opt!r}")
+                    break
+            ai = q.get("answer_index")
+            if type(ai) is not int:  # bool es subclase de int: se excluye aquí
+                err(f"{where}: answer_index debe ser entero, no {ai!r}")
+            elif not 0 <= ai < len(opts):
+                err(f"{where}: answer_index {ai} fuera de rango ({len(opts)} opciones)")
+        elif t == "truefalse":
+            if type(q.get("answer_bool")) is not bool:
+                err(f"{where}: answer_bool debe ser true/false, no {q.get('answer_bool')!r}")
+        else:
+            err(f"{where}: tipo desconocido {t!r} (se espera {', '.join(QUESTION_TYPES)})")
+    return errors, ids
+
+
+def validate_levels(raw, levels: dict[str, list[str]], ids: set[str]) -> list[str]:
+    """Forma del levels.json original + referencias de los niveles normalizados."""
+    errors = []
+    if isinstance(raw, dict):
+        blocks = raw.items()
+    elif isinstance(raw, list):
+        blocks = enumerate(raw, start=1)
+    else:
+        blocks = ()
+        if raw is not None:
+            errors.append(f"levels: se esperaba objeto o lista, no {type(raw).__name__}")
+    for k, v in blocks:
+        if not isinstance(v, list):
+            errors.append(f"nivel {k}: se esperaba una lista de ids, no {type(v).__name__}")
+
+    for number, qids in levels.items():
+        if not qids:
+            errors.append(f"nivel {number}: sin preguntas")
+        seen = set()
+        for qid in qids:
+            if qid not in ids:
+                errors.append(f"nivel {number}: pregunta inexistente {qid!r}")
+            elif qid in seen:
+                errors.append(f"nivel {number}: pregunta repetida {qid!r}")
+            seen.add(qid)
+    return errors
+
+
+# ---------------- Compilar / comprobar ----------------
+def _load_source(path: str):
+    """(sello, JSON) de un archivo fuente; ilegible o mal formado -> BankValidationError."""
+    try:
+        stamp = source_stamp(path)
+        with open(path, "r", encoding="utf-8") as f:
+            return stamp, json.load(f)
+    except (OSError, UnicodeDecodeError, json.JSONDecodeError) as e:
+        raise BankValidationError([f"{path}: {e}"]) from None
+
+
+def compile_bank(questions_path: str = QUESTIONS, levels_path: str = LEVELS, out_path: str | None = None,
+                 shards: bool = False) -> dict:
+    """
+    Valida las fuentes y escribe el banco (por defecto junto a questions.json;
+    con `shards`, el directorio de shards por nivel).
+    Lanza BankValidationError sin escribir nada si hay errores.
+    Retorna un resumen {out, questions, levels, validate_ms, write_ms}.
+    """
+    q_path = resource_path(questions_path)
+    l_path = resource_path(levels_path)
+    out_path = out_path or (shards_path_for if shards else bank_path_for)(q_path)
+
+    q_stamp, questions = _load_source(q_path)
+
+    raw_levels = l_stamp = None
+    if os.path.exists(l_path):
+        l_stamp, raw_levels = _load_source(l_path)
+
+    t0 = time.perf_counter()
+    errors, ids = validate_questions(questions)
+    if not isinstance(questions, list):
+        raise BankValidationError(errors)
+    order = [q["id"] for q in questions if type(q) is dict and type(q.get("id")) is str]
+    # La misma normalización que en runtime (sin el archivo, niveles auto-generados)
+    levels = LevelsModel(_IdsOnly(order), l_path).levels
+    errors += validate_levels(raw_levels, levels, ids)
+    validate_ms = (time.perf_counter() - t0) * 1000.0
+    if errors:
+        raise BankValidationError(errors)
+
+    t0 = time.perf_counter()
+    index = QuestionIndex.from_columns([q.get("category") for q in questions],
+                                       [q.get("type") for q in questions], None)
+    meta = {"sources": {"questions": q_stamp, "levels": l_stamp}, "levels": levels, "index": index.to_meta()}
+    if shards:
+        write_shards(questions, levels, out_path, meta=meta)
+    else:
+        write_bank(questions, out_path, meta=meta)
+    return {"out": out_path, "questions": len(questions), "levels": len(levels),
+            "validate_ms": validate_ms, "write_ms": (time.perf_counter() - t0) * 1000.0}
+
+
+def stale_sources(questions_path: str = QUESTIONS, levels_path: str = LEVELS, out_path: str | None = None,
+                  shards: bool = False) -> list[str]:
+    """Motivos por los que el banco no corresponde a las fuentes ([] = al día)."""
+    q_path = resource_path(questions_path)
+    l_path = resource_path(levels_path)
+    out_path = out_path or (shards_path_for if shards else bank_path_for)(q_path)
+    if not os.path.exists(out_path):
+        return [f"{out_path} no existe"]
+    try:
+        bank = (ShardedBank if shards else CompiledBank)(out_path)
+    except BankFormatError as e:
+        return [str(e)]
+    sources = bank.meta.get("sources", {})
+    if not shards:
+        bank.close()
+
+    out = []
+    if not stamp_matches(sources.get("questions"), q_path):
+        out.append(f"{q_path} cambió")
+    if sources.get("levels") is None:
+        if os.path.exists(l_path):
+            out.append(f"{l_path} no existía al compilar")
+    elif not stamp_matches(sources["levels"], l_path):
+        out.append(f"{l_path} cambió")
+    return out
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(prog="python -m models.bank_compiler", description=__doc__,
+                                 formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("command", choices=("compile", "check"))
+    ap.add_argument("--questions", default=QUESTIONS)
+    ap.add_argument("--levels", default=LEVELS)
+    ap.add_argument("--out", default=None, help="banco de salida (default: junto a questions.json)")
+    ap.add_argument("--shards", action="store_true", help="un archivo por nivel en vez de un único .qbank")
+    args = ap.parse_args(argv)
+
+    if args.command == "check":
+        stale = stale_sources(args.questions, args.levels, args.out, args.shards)
+        for reason in stale:
+            print(f"[bank] desactualizado: {reason}")
+        if not stale:
+            print("[bank] al día")
+        return 1 if stale else 0
+
+    try:
+        res = compile_bank(args.questions, args.levels, args.out, args.shards)
+    except BankValidationError as e:
+        for line in e.errors[:SHOW_ERRORS]:
+            print(f"  {line}", file=sys.stderr)
+        if len(e.errors) > SHOW_ERRORS:
+            print(f"  ... y {len(e.errors) - SHOW_ERRORS} más", file=sys.stderr)
+        print(f"[bank] {e}; no se escribió el banco", file=sys.stderr)
+        return 1
+    print(f"[bank] {res['questions']} preguntas, {res['levels']} niveles -> {res['out']} "
+          f"(validación {res['validate_ms']:.0f} ms, escritura {res['write_ms']:.0f} ms)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,6 +2,7 @@
 import json
 import os
 from typing import Dict, List
+from models.question_bank import stamp_matches
 from utils.resource_path import resource_path
 
 DEFAULT_LEVEL_SIZE = 5
@@ -11,7 +12,9 @@ class LevelsModel:
     """
     Modelo que gestiona la relación entre niveles y preguntas.
 
-    - Carga la definición de niveles desde un archivo JSON.
+    - Si el banco compilado trae los niveles y levels.json no cambió desde
+      que se compiló, los usa tal cual (ya validados y normalizados).
+    - Si no, carga la definición de niveles desde un archivo JSON.
     - Si no existe el archivo, genera automáticamente niveles
       agrupando las preguntas en bloques de tamaño fijo.
     """
@@ -21,7 +24,7 @@ class LevelsModel:
         Parámetros
         ----------
         questions_model : object
-            Modelo de preguntas, debe exponer `all_ids() -> list[str]`.
+            Modelo de preguntas, debe exponer `all_ids()` (secuencia de ids).
         levels_path : str
             Ruta al archivo JSON con definición de niveles.
             Si no existe, se auto-generan los niveles en bloques de DEFAULT_LEVEL_SIZE.
@@ -34,6 +37,11 @@ class LevelsModel:
 
         p = resource_path(levels_path)
 
+        compiled = self._compiled_levels(p)
+        if compiled is not None:
+            self.levels = compiled
+            return
+
         data = None
         if os.path.exists(p):
             try:
@@ -78,6 +86,19 @@ class LevelsModel:
         return sorted(out)
 
     # ---------------- Internos ----------------
+    def _compiled_levels(self, path: str):
+        """Niveles del banco compilado si su sello coincide con `path` (o None)."""
+        meta = getattr(self.qm, "bank_meta", None)
+        if not meta or "levels" not in meta:
+            return None
+        stamp = meta.get("sources", {}).get("levels")
+        if stamp is None:
+            # compilado sin levels.json: niveles auto-generados, válidos mientras siga sin existir
+            fresh = not os.path.exists(path) and self.default_level_size == DEFAULT_LEVEL_SIZE
+        else:
+            fresh = stamp_matches(stamp, path)
+        return meta["levels"] if fresh else None
+
     def _generate_levels(self) -> Dict[str, List[str]]:
         """Genera niveles automáticamente en bloques de tamaño fijo."""
         ids = list(self.qm.all_ids())
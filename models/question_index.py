@@ -0,0 +1,124 @@
+# models/question_index.py
+import base64
+import random
+import sys
+from array import array
+from itertools import chain
+
+
+def _pack(rows: array) -> str:
+    a = array("I", rows)
+    if sys.byteorder == "big":
+        a.byteswap()
+    return base64.b64encode(a.tobytes()).decode("ascii")
+
+
+def _unpack(text: str) -> array:
+    a = array("I")
+    a.frombytes(base64.b64decode(text))
+    if sys.byteorder == "big":
+        a.byteswap()
+    return a
+
+
+class QuestionIndex:
+    """
+    Índices secundarios por categoría y tipo sobre las filas del banco
+    (fila = posición en all_ids()).
+
+    - Por cada par (category, type) guarda las filas en un array('I')
+      ordenado; las listas por categoría o por tipo solos se arman una vez
+      (al construir o en la primera consulta) y quedan en cache.
+    - Contar es len() de un array y muestrear elige posiciones dentro de él:
+      ninguna consulta recorre el banco entero.
+    - `id_at(fila)` lo pone el backend (QuestionStore, CompiledBank o
+      ShardedBank), así el índice no guarda una copia de los ids.
+    - En las consultas, None significa "cualquiera".
+    """
+
+    def __init__(self, pairs: dict, id_at, total: int):
+        self._pairs: dict[tuple, array] = pairs
+        self._by_cat: dict = {}
+        self._by_type: dict = {}
+        self._id_at = id_at
+        self.total = int(total)
+
+    # ---------------- Construcción ----------------
+    @classmethod
+    def from_columns(cls, categories, types, id_at) -> "QuestionIndex":
+        """Una pasada sobre las columnas (iterables paralelos, una entrada por fila)."""
+        pairs: dict[tuple, array] = {}
+        by_cat: dict = {}
+        by_type: dict = {}
+        n = 0
+        for row, key in enumerate(zip(categories, types)):
+            rows = pairs.get(key)
+            if rows is None:
+                rows = pairs[key] = array("I")
+                by_cat.setdefault(key[0], array("I"))
+                by_type.setdefault(key[1], array("I"))
+            rows.append(row)
+            by_cat[key[0]].append(row)
+            by_type[key[1]].append(row)
+            n = row + 1
+        idx = cls(pairs, id_at, n)
+        idx._by_cat, idx._by_type = by_cat, by_type
+        return idx
+
+    @classmethod
+    def from_meta(cls, meta: dict, id_at) -> "QuestionIndex":
+        """Índice guardado por el compilador (ver to_meta)."""
+        pairs = {(c, t): _unpack(rows) for c, t, rows in meta["pairs"]}
+        return cls(pairs, id_at, meta["total"])
+
+    def to_meta(self) -> dict:
+        """Forma serializable a JSON: filas como array('I') little-endian en base64."""
+        return {"total": self.total, "pairs": [[c, t, _pack(rows)] for (c, t), rows in self._pairs.items()]}
+
+    # ---------------- Consultas ----------------
+    def rows(self, category=None, type=None):
+        """Filas (ordenadas) que cumplen el filtro; range(total) sin filtro."""
+        if category is None and type is None:
+            return range(self.total)
+        if category is not None and type is not None:
+            return self._pairs.get((category, type), ())
+        if type is None:
+            return self._union(self._by_cat, 0, category)
+        return self._union(self._by_type, 1, type)
+
+    def ids_where(self, category=None, type=None) -> list[str]:
+        id_at = self._id_at
+        return [id_at(r) for r in self.rows(category, type)]
+
+    def count(self, category=None, type=None) -> int:
+        return len(self.rows(category, type))
+
+    def sample(self, k: int, category=None, type=None, rng=None) -> list[str]:
+        """Hasta `k` ids distintos al azar entre los que cumplen el filtro."""
+        rows = self.rows(category, type)
+        picks = (rng or random).sample(range(len(rows)), min(int(k), len(rows)))
+        return [self._id_at(rows[i]) for i in picks]
+
+    def categories(self) -> dict:
+        """{categoría: cantidad de preguntas}."""
+        return self._counts(0)
+
+    def types(self) -> dict:
+        """{tipo: cantidad de preguntas}."""
+        return self._counts(1)
+
+    # ---------------- Internos ----------------
+    def _counts(self, i: int) -> dict:
+        out: dict = {}
+        for key, rows in self._pairs.items():
+            out[key[i]] = out.get(key[i], 0) + len(rows)
+        return out
+
+    def _union(self, cache: dict, i: int, value):
+        rows = cache.get(value)
+        if rows is None:
+            parts = [r for key, r in self._pairs.items() if key[i] == value]
+            if not parts:
+                return ()
+            rows = cache[value] = parts[0] if len(parts) == 1 else array("I", sorted(chain(*parts)))
+        return rows
@@ -0,0 +1,191 @@
+# models/question_shards.py
+import json
+import os
+import shutil
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from models.question_bank import BankFormatError
+from models.question_store import QuestionStore
+
+# Banco en shards: un directorio junto al JSON (questions.json -> questions.shards/)
+#
+#   manifest.json : {"format", "ids" (orden original), "shard_of" (índice de
+#                   shard por id), "shards" (archivos), "sources", "levels"}
+#   level_NNNN.json : preguntas del nivel N-ésimo (lista como questions.json)
+#   extra_NNNN.json : preguntas que ningún nivel usa, en bloques de EXTRA_SIZE
+#
+# Una pregunta que aparece en varios niveles vive en el shard del primero.
+# El manifest se escribe al final: un directorio sin manifest no se usa.
+SHARDS_SUFFIX = ".shards"
+MANIFEST = "manifest.json"
+FORMAT = 1
+EXTRA_SIZE = 1000
+MAX_RESIDENT = 4
+
+
+def shards_path_for(json_path: str) -> str:
+    """Directorio de shards que acompaña a `json_path` (questions.json -> questions.shards)."""
+    return os.path.splitext(json_path)[0] + SHARDS_SUFFIX
+
+
+def write_shards(questions, levels: dict[str, list[str]], out_dir: str, meta: dict | None = None) -> int:
+    """
+    Escribe `questions` en un shard por nivel (según `levels`) más bloques
+    para las que no usa ningún nivel. `meta` se agrega al manifest.
+
+    Se arma en un directorio temporal que reemplaza al anterior al final.
+    Retorna la cantidad de shards escritos.
+    """
+    ids = [str(q["id"]) for q in questions]
+    shard_of_id: dict[str, int] = {}
+    files: list[str] = []
+    for i, qids in enumerate(levels.values(), start=1):
+        files.append(f"level_{i:04d}.json")
+        for qid in qids:
+            shard_of_id.setdefault(qid, len(files) - 1)
+
+    extra = [qid for qid in ids if qid not in shard_of_id]
+    for k in range(0, len(extra), EXTRA_SIZE):
+        files.append(f"extra_{k // EXTRA_SIZE + 1:04d}.json")
+        for qid in extra[k:k + EXTRA_SIZE]:
+            shard_of_id[qid] = len(files) - 1
+
+    buckets: list[list] = [[] for _ in files]
+    for q, qid in zip(questions, ids):
+        buckets[shard_of_id[qid]].append(q)
+
+    tmp = out_dir + ".tmp"
+    shutil.rmtree(tmp, ignore_errors=True)
+    os.makedirs(tmp)
+    for name, bucket in zip(files, buckets):
+        with open(os.path.join(tmp, name), "w", encoding="utf-8") as f:
+            json.dump(bucket, f, ensure_ascii=False, separators=(",", ":"))
+    manifest = dict(meta or {})
+    manifest.update({"format": FORMAT, "ids": ids, "shard_of": [shard_of_id[q] for q in ids], "shards": files})
+    with open(os.path.join(tmp, MANIFEST), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, separators=(",", ":"))
+
+    shutil.rmtree(out_dir, ignore_errors=True)
+    os.replace(tmp, out_dir)
+    return len(files)
+
+
+class ShardedBank:
+    """
+    Banco de preguntas repartido en shards que se cargan al primer acceso.
+
+    - Al abrir solo se lee el manifest (ids y a qué shard va cada uno).
+    - record(qid) carga el shard de qid (un QuestionStore) si no está
+      residente; quedan a lo sumo `max_resident` shards (LRU).
+    - prefetch(qids) carga en un hilo de fondo los shards que falten, p.ej.
+      los del nivel siguiente mientras se juega el actual; close() lo
+      detiene (App lo llama al salir).
+    - Los archivos se leen fuera del lock: un record() de un shard residente
+      no espera a una precarga en curso, y el de un shard que se está
+      cargando espera esa carga en vez de leerlo otra vez.
+    """
+
+    def __init__(self, path: str, max_resident: int = MAX_RESIDENT):
+        self.path = path
+        self.max_resident = max(1, int(max_resident))
+        try:
+            with open(os.path.join(path, MANIFEST), "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError) as e:
+            raise BankFormatError(f"{path}: manifest ilegible ({e})") from None
+        if manifest.get("format") != FORMAT:
+            raise BankFormatError(f"{path}: formato {manifest.get('format')} (se esperaba {FORMAT})")
+
+        self._ids: list[str] = manifest.pop("ids")
+        self._shard_of: dict[str, int] = dict(zip(self._ids, manifest.pop("shard_of")))
+        self._files: list[str] = manifest.pop("shards")
+        self.meta = manifest
+
+        self._resident: OrderedDict[int, QuestionStore] = OrderedDict()
+        self._loading: dict[int, Future] = {}   # shard -> carga en curso
+        self._lock = threading.Lock()
+        self._pool = None
+        self.loads = 0
+        self.hits = 0
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, qid) -> bool:
+        return qid in self._shard_of
+
+    def record(self, qid: str):
+        """Pregunta `qid` (QuestionRecord); KeyError si no existe."""
+        return self._shard(self._shard_of[qid]).record(qid)
+
+    def all_ids(self) -> list[str]:
+        return list(self._ids)
+
+    def id_at(self, row: int) -> str:
+        return self._ids[row]
+
+    def prefetch(self, qids) -> None:
+        """Carga en segundo plano los shards de `qids` que no estén residentes."""
+        wanted = []
+        for qid in qids:
+            k = self._shard_of.get(qid)
+            if k is not None and k not in wanted and k not in self._resident and k not in self._loading:
+                wanted.append(k)
+        if not wanted:
+            return
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="shard-prefetch")
+        for k in wanted:
+            self._pool.submit(self._prefetch_one, k)
+
+    def close(self) -> None:
+        """Descarta las precargas pendientes y libera el hilo de fondo."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    def resident(self) -> list[str]:
+        """Archivos de los shards residentes, del menos al más usado."""
+        return [self._files[k] for k in self._resident]
+
+    def _prefetch_one(self, k: int):
+        try:
+            self._shard(k)
+        except (OSError, ValueError) as e:
+            print(f"[ShardedBank] No se pudo precargar {self._files[k]}. Detalle: {e}")
+
+    def _shard(self, k: int) -> QuestionStore:
+        with self._lock:
+            store = self._resident.get(k)
+            if store is not None:
+                self._resident.move_to_end(k)
+                self.hits += 1
+                return store
+            pending = self._loading.get(k)
+            if pending is None:
+                pending = self._loading[k] = Future()
+                owner = True
+            else:
+                owner = False
+        if not owner:
+            # Otro hilo ya lo está leyendo: esperar su resultado (o su error)
+            return pending.result()
+
+        try:
+            with open(os.path.join(self.path, self._files[k]), "r", encoding="utf-8") as f:
+                store = QuestionStore.from_records(json.load(f))
+        except BaseException as e:
+            with self._lock:
+                del self._loading[k]
+            pending.set_exception(e)
+            raise
+        with self._lock:
+            self._resident[k] = store
+            self.loads += 1
+            while len(self._resident) > self.max_resident:
+                self._resident.popitem(last=False)
+            del self._loading[k]
+        pending.set_result(store)
+        return store
@@ -0,0 +1,227 @@
+# models/question_store.py
+import sys
+from array import array
+from collections.abc import Mapping
+
+# Bits de `flags`: qué campos traía la pregunta original
+HAS_TYPE     = 1
+HAS_CATEGORY = 2
+HAS_QUESTION = 4
+HAS_OPTIONS  = 8
+HAS_INDEX    = 16
+HAS_BOOL     = 32
+BOOL_TRUE    = 64  # valor de answer_bool (independiente de answer_index)
+
+# Campos con columna propia; cualquier otro va a `extras` (disperso)
+KNOWN_FIELDS = ("id", "type", "category", "question", "options", "answer_index", "answer_bool")
+_KNOWN = frozenset(KNOWN_FIELDS)
+
+NO_CODE = 0xFFFF
+
+
+class QuestionRecord(Mapping):
+    """
+    Vista de solo lectura de una pregunta del QuestionStore.
+
+    Se comporta como el dict original del JSON (q["type"], q.get("options", []),
+    dict(q), ==) pero no guarda nada propio: decodifica desde las columnas del
+    store en cada acceso.
+    """
+
+    __slots__ = ("_store", "_row")
+
+    def __init__(self, store: "QuestionStore", row: int):
+        self._store = store
+        self._row = row
+
+    def __getitem__(self, key):
+        return self._store.field(self._row, key)
+
+    def __iter__(self):
+        return iter(self._store.keys(self._row))
+
+    def __len__(self):
+        return len(self._store.keys(self._row))
+
+    def __repr__(self):
+        return f"QuestionRecord({dict(self)!r})"
+
+
+class QuestionStore:
+    """
+    Banco de preguntas en columnas (struct-of-arrays) en vez de un dict por
+    pregunta.
+
+    - type / category: códigos en array('H') sobre tablas de strings
+      internadas (una copia de "mcq", "characters", ...).
+    - Texto de la pregunta y opciones: UTF-8 en un único blob; row_first[r]
+      es el índice (en str_off) del primer string de la fila r: primero la
+      pregunta (si tiene) y después sus opciones.
+    - answer_index: array('i'); answer_bool: bit BOOL_TRUE de `flags` (una
+      pregunta puede traer ambos).
+    - Campos no conocidos: `extras` {fila: dict}, solo para filas que los tengan.
+    - id -> fila en un dict (O(1)); los ids se internan.
+    """
+
+    def __init__(self):
+        self.ids: list[str] = []
+        self.index: dict[str, int] = {}
+        self.types: list[str] = []
+        self.categories: list[str] = []
+        self._type_code: dict[str, int] = {}
+        self._cat_code: dict[str, int] = {}
+
+        self.type_col = array("H")
+        self.cat_col = array("H")
+        self.flags = array("B")
+        self.answer = array("i")
+        self.row_first = array("I", [0])
+        self.str_off = array("I", [0])
+        self._blob = bytearray()
+        self.extras: dict[int, dict] = {}
+
+    # ---------------- Construcción ----------------
+    @classmethod
+    def from_records(cls, records) -> "QuestionStore":
+        """Construye el store desde dicts como los de questions.json."""
+        st = cls()
+        for q in records:
+            st.append(q)
+        st.freeze()
+        return st
+
+    def append(self, q: dict) -> int:
+        qid = sys.intern(str(q["id"]))
+        if qid in self.index:
+            raise ValueError(f"id de pregunta duplicado: {qid}")
+        row = len(self.ids)
+        self.ids.append(qid)
+        self.index[qid] = row
+
+        flags = 0
+        if "type" in q:
+            flags |= HAS_TYPE
+        if "category" in q:
+            flags |= HAS_CATEGORY
+        self.type_col.append(self._code(q.get("type"), self.types, self._type_code))
+        self.cat_col.append(self._code(q.get("category"), self.categories, self._cat_code))
+
+        if "question" in q:
+            flags |= HAS_QUESTION
+            self._push_str(q["question"])
+        if "options" in q:
+            flags |= HAS_OPTIONS
+            for opt in q["options"]:
+                self._push_str(opt)
+        self.row_first.append(len(self.str_off) - 1)
+
+        ans = 0
+        if "answer_index" in q:
+            flags |= HAS_INDEX
+            ans = int(q["answer_index"])
+        if "answer_bool" in q:
+            flags |= HAS_BOOL
+            if q["answer_bool"]:
+                flags |= BOOL_TRUE
+        self.answer.append(ans)
+        self.flags.append(flags)
+
+        extra = {k: v for k, v in q.items() if k not in _KNOWN}
+        if extra:
+            self.extras[row] = extra
+        return row
+
+    def freeze(self) -> None:
+        """Fin de la carga: el blob pasa a bytes (inmutable, sin holgura)."""
+        self._blob = bytes(self._blob)
+
+    def _push_str(self, s) -> None:
+        self._blob += str(s).encode("utf-8")
+        self.str_off.append(len(self._blob))
+
+    @staticmethod
+    def _code(value, table: list, codes: dict) -> int:
+        if value is None:
+            return NO_CODE
+        value = sys.intern(str(value))
+        c = codes.get(value)
+        if c is None:
+            c = codes[value] = len(table)
+            table.append(value)
+        return c
+
+    # ---------------- Lectura ----------------
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, qid) -> bool:
+        return qid in self.index
+
+    def record(self, qid: str) -> QuestionRecord:
+        return QuestionRecord(self, self.index[qid])
+
+    def all_ids(self) -> list[str]:
+        return list(self.ids)
+
+    def id_at(self, row: int) -> str:
+        return self.ids[row]
+
+    def column(self, key: str):
+        """Valores de "type" o "category" fila por fila (None si la pregunta no lo trae)."""
+        col, table = (self.type_col, self.types) if key == "type" else (self.cat_col, self.categories)
+        names = dict(enumerate(table))
+        names[NO_CODE] = None
+        return map(names.__getitem__, col)
+
+    def _str(self, k: int) -> str:
+        return self._blob[self.str_off[k]:self.str_off[k + 1]].decode("utf-8")
+
+    def keys(self, row: int) -> list[str]:
+        f = self.flags[row]
+        out = ["id"]
+        if f & HAS_TYPE:
+            out.append("type")
+        if f & HAS_CATEGORY:
+            out.append("category")
+        if f & HAS_QUESTION:
+            out.append("question")
+        if f & HAS_OPTIONS:
+            out.append("options")
+        if f & HAS_INDEX:
+            out.append("answer_index")
+        if f & HAS_BOOL:
+            out.append("answer_bool")
+        extra = self.extras.get(row)
+        if extra:
+            out.extend(extra)
+        return out
+
+    def field(self, row: int, key: str):
+        """Valor de `key` en la fila `row`; KeyError si la pregunta no lo traía."""
+        f = self.flags[row]
+        if key == "id":
+            return self.ids[row]
+        if key == "type" and f & HAS_TYPE:
+            c = self.type_col[row]
+            return None if c == NO_CODE else self.types[c]
+        if key == "category" and f & HAS_CATEGORY:
+            c = self.cat_col[row]
+            return None if c == NO_CODE else self.categories[c]
+        if key == "question" and f & HAS_QUESTION:
+            return self._str(self.row_first[row])
+        if key == "options" and f & HAS_OPTIONS:
+            start = self.row_first[row] + (1 if f & HAS_QUESTION else 0)
+            return [self._str(k) for k in range(start, self.row_first[row + 1])]
+        if key == "answer_index" and f & HAS_INDEX:
+            return self.answer[row]
+        if key == "answer_bool" and f & HAS_BOOL:
+            return bool(f & BOOL_TRUE)
+        extra = self.extras.get(row)
+        if extra is not None and key in extra:
+            return extra[key]
+        raise KeyError(key)
+
+    def nbytes(self) -> int:
+        """Bytes aproximados de columnas + blob (sin contar ids ni el índice)."""
+        cols = (self.type_col, self.cat_col, self.flags, self.answer, self.row_first, self.str_off)
+        return len(self._blob) + sum(a.itemsize * len(a) for a in cols)
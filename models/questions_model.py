@@ -1,5 +1,11 @@
 import json
+import os
+from collections.abc import Mapping
 from utils.resource_path import resource_path
+from models.question_bank import BankFormatError, CompiledBank, bank_path_for, stamp_matches
+from models.question_index import QuestionIndex
+from models.question_shards import ShardedBank, shards_path_for
+from models.question_store import QuestionStore
 
 
 
@@ -7,8 +13,19 @@ class QuestionModel:
     """
     Modelo de preguntas del juego.
 
-    - Carga todas las preguntas desde un archivo JSON.
-    - Indexa preguntas por su ID para acceso rápido.
+    - Si junto al JSON hay un banco compilado (.qbank) cuyo sello coincide
+      con el JSON (python -m models.bank_compiler compile), lo abre con mmap
+      y solo decodifica las preguntas que se piden (models.question_bank):
+      el arranque no depende del tamaño del banco. `bank_meta` expone los
+      niveles ya normalizados para LevelsModel.
+    - Si en cambio hay un directorio de shards (compile --shards), solo lee
+      su manifest y carga cada shard (un nivel) al primer get() de una de
+      sus preguntas, con un LRU de shards residentes (models.question_shards).
+    - Si no, carga todas las preguntas desde el JSON a un QuestionStore
+      compacto (columnas + strings internados + un blob UTF-8).
+    - Indexa preguntas por su ID para acceso rápido, y por categoría/tipo
+      (QuestionIndex, armado una vez al cargar o leído del banco compilado)
+      para consultas como ids_where(category="characters", type="mcq").
     - Permite obtener una pregunta específica o la lista de todos los IDs.
     """
 
@@ -20,13 +37,52 @@ class QuestionModel:
             Ruta al archivo JSON con las preguntas.
             Cada entrada debe contener al menos un campo "id".
         """
-        with open(resource_path(data_path), "r", encoding="utf-8") as f:
-            self.questions: list[dict] = json.load(f)
+        p = resource_path(data_path)
+        bank = self._open_compiled(p, ShardedBank, shards_path_for) or self._open_compiled(p, CompiledBank, bank_path_for)
+        self.store = bank or self._load_json(p)
+        self.bank_meta: dict | None = bank.meta if bank is not None else None
+        self.index = self._build_index()
+        self._all_ids: tuple[str, ...] | None = None
 
-        # Diccionario de acceso rápido: id -> pregunta
-        self.by_id: dict[str, dict] = {q["id"]: q for q in self.questions}
+    @staticmethod
+    def _open_compiled(json_path: str, kind, path_for):
+        """Banco `kind` junto a `json_path` si existe y fue compilado desde este JSON."""
+        path = path_for(json_path)
+        if not os.path.exists(path):
+            return None
+        try:
+            bank = kind(path)
+        except (OSError, BankFormatError) as e:
+            print(f"[QuestionModel] No se pudo abrir {path}; se usa el JSON. Detalle: {e}")
+            return None
+        if os.path.exists(json_path) and not stamp_matches(bank.meta.get("sources", {}).get("questions"), json_path):
+            print(f"[QuestionModel] {path} no corresponde a {json_path}; se usa el JSON.")
+            if hasattr(bank, "close"):
+                bank.close()
+            return None
+        return bank
 
-    def get(self, qid: str) -> dict:
+    def _build_index(self) -> QuestionIndex:
+        meta = (self.bank_meta or {}).get("index")
+        if meta:
+            return QuestionIndex.from_meta(meta, self.store.id_at)
+        if isinstance(self.store, QuestionStore):
+            return QuestionIndex.from_columns(self.store.column("category"), self.store.column("type"), self.store.id_at)
+        # Banco compilado sin índice (versión anterior del compilador): decodificar todo una vez
+        print("[QuestionModel] El banco no trae índice por categoría/tipo; recompilar para evitar este recorrido.")
+        recs = [self.store.record(qid) for qid in self.store.all_ids()]
+        return QuestionIndex.from_columns([q.get("category") for q in recs], [q.get("type") for q in recs], self.store.id_at)
+
+    @staticmethod
+    def _load_json(json_path: str) -> QuestionStore:
+        with open(json_path, "r", encoding="utf-8") as f:
+            # Los dicts del JSON se descartan al terminar: solo queda el store
+            return QuestionStore.from_records(json.load(f))
+
+    def __len__(self) -> int:
+        return len(self.store)
+
+    def get(self, qid: str) -> Mapping:
         """
         Devuelve la pregunta asociada a un ID.
 
@@ -37,18 +93,63 @@ class QuestionModel:
 
         Retorna
         -------
-        dict
-            Diccionario con los datos de la pregunta.
+        Mapping
+            Datos de la pregunta con las mismas llaves que en el JSON
+            (QuestionRecord o, desde el banco compilado, un dict nuevo).
+            KeyError si el ID no existe.
         """
-        return self.by_id[qid]
+        return self.store.record(qid)
+
+    def prefetch(self, qids) -> None:
+        """
+        Anticipa que se van a pedir `qids` (p.ej. el nivel siguiente). Con
+        shards los carga en segundo plano; con el resto de formatos ya están
+        disponibles y no hace nada.
+        """
+        prefetch = getattr(self.store, "prefetch", None)
+        if prefetch is not None:
+            prefetch(qids)
+
+    def close(self) -> None:
+        """Libera el banco compilado (mmap) o el hilo de precarga de shards."""
+        close = getattr(self.store, "close", None)
+        if close is not None:
+            close()
 
-    def all_ids(self) -> list[str]:
+    def all_ids(self) -> tuple[str, ...]:
         """
-        Devuelve la lista de todos los IDs de preguntas disponibles.
+        Devuelve todos los IDs de preguntas disponibles.
 
         Retorna
         -------
-        list[str]
-            Lista de IDs de todas las preguntas.
+        tuple[str, ...]
+            IDs de todas las preguntas en el orden del JSON. Se arma la
+            primera vez y se reutiliza (por eso es una tupla).
         """
-        return [q["id"] for q in self.questions]
+        if self._all_ids is None:
+            self._all_ids = tuple(self.store.all_ids())
+        return self._all_ids
+
+    # ---------------- Consultas por categoría / tipo ----------------
+    def ids_where(self, category: str | None = None, type: str | None = None) -> list[str]:
+        """
+        IDs que cumplen el filtro, en el orden del JSON (None = cualquiera).
+        Cuesta lo que mide el resultado, no el banco.
+        """
+        return self.index.ids_where(category, type)
+
+    def count_where(self, category: str | None = None, type: str | None = None) -> int:
+        """Cantidad de preguntas que cumplen el filtro (O(1))."""
+        return self.index.count(category, type)
+
+    def sample(self, k: int, category: str | None = None, type: str | None = None, rng=None) -> list[str]:
+        """Hasta `k` IDs distintos al azar entre los que cumplen el filtro."""
+        return self.index.sample(k, category, type, rng)
+
+    def categories(self) -> dict[str, int]:
+        """Cantidad de preguntas por categoría."""
+        return self.index.categories()
+
+    def types(self) -> dict[str, int]:
+        """Cantidad de preguntas por tipo ("mcq", "truefalse")."""
+        return self.index.types()
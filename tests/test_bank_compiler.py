@@ -0,0 +1,103 @@
+# tests/test_bank_compiler.py
+import json
+import shutil
+
+import pytest
+
+from models import bank_compiler as bc
+
+
+@pytest.fixture
+def sources(tmp_path):
+    qp = tmp_path / "questions.json"
+    lp = tmp_path / "levels.json"
+    shutil.copy("data/questions.json", qp)
+    shutil.copy("data/levels.json", lp)
+    return qp, lp
+
+
+@pytest.mark.parametrize("raw", [5, "Q1", True, 1.5])
+def test_levels_of_wrong_type_are_a_validation_error(sources, raw):
+    qp, lp = sources
+    lp.write_text(json.dumps(raw), encoding="utf-8")
+    with pytest.raises(bc.BankValidationError) as e:
+        bc.compile_bank(str(qp), str(lp))
+    assert any(err.startswith("levels: se esperaba objeto o lista") for err in e.value.errors)
+    assert not (qp.parent / "questions.qbank").exists()
+
+
+@pytest.mark.parametrize("which", ["questions", "levels"])
+def test_malformed_or_missing_source_is_a_validation_error(sources, which, capsys):
+    qp, lp = sources
+    bad = qp if which == "questions" else lp
+    bad.write_text("{bad", encoding="utf-8")
+    with pytest.raises(bc.BankValidationError) as e:
+        bc.compile_bank(str(qp), str(lp))
+    assert len(e.value.errors) == 1 and e.value.errors[0].startswith(str(bad))
+
+    assert bc.main(["compile", "--questions", str(qp), "--levels", str(lp)]) == 1
+    assert "no se escribió el banco" in capsys.readouterr().err
+
+    with pytest.raises(bc.BankValidationError):
+        bc.compile_bank(str(qp.parent / "missing.json"), str(lp))
+
+
+def test_valid_sources_compile_and_are_fresh(sources):
+    qp, lp = sources
+    res = bc.compile_bank(str(qp), str(lp))
+    assert res["questions"] == 28 and res["levels"] == 6
+    assert bc.stale_sources(str(qp), str(lp)) == []
+
+
+def test_sharded_model_close_stops_prefetch(sources):
+    from models.questions_model import QuestionModel
+
+    qp, lp = sources
+    bc.compile_bank(str(qp), str(lp), shards=True)
+    qm = QuestionModel(str(qp))
+    qm.prefetch(qm.all_ids())
+    pool = qm.store._pool
+    qm.close()
+    qm.close()
+    assert qm.store._pool is None and pool._shutdown
+    assert qm.get("Q1")["id"] == "Q1"  # sin hilo de fondo, get() sigue cargando a demanda
+
+
+def test_resident_shard_does_not_wait_for_a_slow_prefetch(sources, monkeypatch):
+    import threading
+
+    from models import question_shards as qs
+
+    qp, lp = sources
+    bc.compile_bank(str(qp), str(lp), shards=True)
+    bank = qs.ShardedBank(str(qs.shards_path_for(str(qp))))
+    levels = list(bank.meta["levels"].values())
+    first, second = levels[0][0], levels[1][0]
+    assert bank.record(first)["id"] == first
+
+    started, release = threading.Event(), threading.Event()
+    from_records = qs.QuestionStore.from_records
+
+    def slow(records):
+        if threading.current_thread().name.startswith("shard-prefetch"):
+            started.set()
+            release.wait(5)
+        return from_records(records)
+
+    monkeypatch.setattr(qs.QuestionStore, "from_records", staticmethod(slow))
+    bank.prefetch([second])
+    assert started.wait(5)
+
+    got = []
+    reader = threading.Thread(target=lambda: got.append(bank.record(first)["id"]))
+    reader.start()
+    reader.join(1)
+    assert got == [first]  # la precarga sigue bloqueada y el residente respondió
+
+    waiter = threading.Thread(target=lambda: got.append(bank.record(second)["id"]))
+    waiter.start()
+    release.set()
+    waiter.join(5)
+    bank.close()
+    assert got == [first, second]
+    assert bank.loads == 2  # el shard en vuelo se leyó una sola vez
@@ -0,0 +1,80 @@
+# tests/test_question_index.py
+import json
+import random
+import shutil
+
+import pytest
+
+from models import bank_compiler as bc
+from models.question_bank import CompiledBank
+from models.question_index import QuestionIndex
+from models.question_shards import ShardedBank
+
+CATEGORIES = ("characters", "theme", "summary", None)  # None en un filtro = cualquiera
+TYPES = ("mcq", "truefalse")
+FILTERS = [(c, t) for c in CATEGORIES for t in TYPES + (None,)] + [("nope", None), ("theme", "nope")]
+
+
+@pytest.fixture
+def questions():
+    rng = random.Random(7)
+    return [{"id": f"Q{i}", "category": rng.choice(CATEGORIES), "type": rng.choice(TYPES)} for i in range(300)]
+
+
+def _index(questions):
+    ids = [q["id"] for q in questions]
+    return QuestionIndex.from_columns([q["category"] for q in questions],
+                                      [q["type"] for q in questions], ids.__getitem__)
+
+
+def _brute(questions, category, type):
+    return [q["id"] for q in questions
+            if (category is None or q["category"] == category) and (type is None or q["type"] == type)]
+
+
+def test_meta_round_trip_keeps_every_filter(questions):
+    idx = _index(questions)
+    meta = json.loads(json.dumps(idx.to_meta()))
+    back = QuestionIndex.from_meta(meta, [q["id"] for q in questions].__getitem__)
+    assert back.total == idx.total == len(questions)
+    for c, t in FILTERS:
+        assert back.ids_where(c, t) == idx.ids_where(c, t)
+    assert back.categories() == idx.categories() and back.types() == idx.types()
+
+
+@pytest.mark.parametrize("category,type", FILTERS)
+def test_queries_match_a_brute_force_filter(questions, category, type):
+    idx = _index(questions)
+    want = _brute(questions, category, type)
+    assert idx.ids_where(category, type) == want
+    assert idx.count(category, type) == len(want)
+
+    picks = idx.sample(10, category, type, rng=random.Random(1))
+    assert len(picks) == min(10, len(want)) and len(set(picks)) == len(picks)
+    assert set(picks) <= set(want)
+    assert sorted(idx.sample(len(want) + 5, category, type)) == sorted(want)
+
+
+@pytest.mark.parametrize("shards", [False, True])
+def test_compiled_records_match_the_json(tmp_path, shards):
+    qp, lp = tmp_path / "questions.json", tmp_path / "levels.json"
+    shutil.copy("data/questions.json", qp)
+    shutil.copy("data/levels.json", lp)
+    out = bc.compile_bank(str(qp), str(lp), shards=shards)["out"]
+    with open(qp, "r", encoding="utf-8") as f:
+        source = json.load(f)
+
+    bank = ShardedBank(out, max_resident=2) if shards else CompiledBank(out)
+    try:
+        assert len(bank) == len(source)
+        assert bank.all_ids() == [q["id"] for q in source]
+        for q in source:
+            assert dict(bank.record(q["id"])) == q
+        with pytest.raises(KeyError):
+            bank.record("no-existe")
+
+        idx = QuestionIndex.from_meta(bank.meta["index"], bank.id_at)
+        for c in {q["category"] for q in source}:
+            assert idx.ids_where(c) == _brute(source, c, None)
+    finally:
+        bank.close()
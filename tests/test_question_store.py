@@ -0,0 +1,20 @@
+# tests/test_question_store.py
+import json
+
+from models.question_store import QuestionStore
+
+
+def test_round_trips_every_question_in_the_bank():
+    with open("data/questions.json", "r", encoding="utf-8") as f:
+        questions = json.load(f)
+    st = QuestionStore.from_records(questions)
+    for q in questions:
+        assert dict(st.record(q["id"])) == q
+
+
+def test_keeps_both_answer_fields():
+    q = {"id": "X", "type": "mcq", "question": "?", "options": ["a", "b"],
+         "answer_index": 1, "answer_bool": False, "hint": "h"}
+    st = QuestionStore.from_records([q, dict(q, id="Y", answer_bool=True, answer_index=0)])
+    assert dict(st.record("X")) == q
+    assert st.record("Y")["answer_bool"] is True and st.record("Y")["answer_index"] == 0
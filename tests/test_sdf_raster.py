@@ -0,0 +1,16 @@
+# tests/test_sdf_raster.py
+import pytest
+
+pytest.importorskip("PIL")
+pytest.importorskip("numpy")
+
+from benchmarks.bench_raster import CASES, MAX_DIFF, MEAN_DIFF, pixel_diff  # noqa: E402
+
+
+@pytest.mark.parametrize("name, pil_fn, np_fn", CASES, ids=[c[0] for c in CASES])
+def test_numpy_raster_matches_pil(name, pil_fn, np_fn):
+    pil_img, np_img = pil_fn(), np_fn()
+    assert pil_img.size == np_img.size
+    mx, mean = pixel_diff(pil_img, np_img)
+    assert mx <= MAX_DIFF, f"{name}: max diff {mx:.0f} > {MAX_DIFF}"
+    assert mean <= MEAN_DIFF, f"{name}: mean diff {mean:.3f} > {MEAN_DIFF}"
@@ -0,0 +1,104 @@
+# tests/test_ticker.py
+import time
+
+from utils.ticker import Ticker
+
+
+class FakeWidget:
+    """after()/after_cancel() sin Tk: guarda los pendientes y los corre a mano."""
+
+    def __init__(self):
+        self.pending = {}
+        self.max_pending = 0
+        self._next = 0
+
+    def after(self, ms, fn):
+        self._next += 1
+        self.pending[self._next] = (time.perf_counter() + ms / 1000.0, fn)
+        self.max_pending = max(self.max_pending, len(self.pending))
+        return self._next
+
+    def after_cancel(self, after_id):
+        self.pending.pop(after_id, None)
+
+    def run(self, limit=1000):
+        ticks = 0
+        while self.pending and ticks < limit:
+            after_id = min(self.pending, key=lambda k: self.pending[k][0])
+            due, fn = self.pending.pop(after_id)
+            time.sleep(max(0.0, due - time.perf_counter()))
+            fn()
+            ticks += 1
+        return ticks
+
+
+def test_rescheduling_callbacks_keep_a_single_after():
+    w = FakeWidget()
+    ticker = Ticker(w, frame_ms=1, budget_ms=50.0)
+    runs = {}
+
+    def make(owner):
+        def cb():
+            runs[owner] = runs.get(owner, 0) + 1
+            if runs[owner] < 5:
+                ticker.call_later(owner, 1, cb, key="again")
+        return cb
+
+    for i in range(15):
+        ticker.call_later(i, 1, make(i), key="again")
+
+    w.run()
+    assert runs == {i: 5 for i in range(15)}
+    assert w.max_pending == 1
+    assert ticker.pending() == 0
+
+
+def test_tween_and_timers_share_one_after():
+    w = FakeWidget()
+    ticker = Ticker(w, frame_ms=1, budget_ms=50.0)
+    steps = []
+    done = []
+    ticker.tween("view", 5, steps.append, done=lambda: done.append(True))
+    ticker.call_later("view", 2, lambda: ticker.call_later("view", 1, lambda: None))
+
+    w.run()
+    assert done == [True] and steps[-1] == 1.0
+    assert w.max_pending == 1
+
+
+def test_a_failing_callback_does_not_stop_the_clock(capsys):
+    w = FakeWidget()
+    ticker = Ticker(w, frame_ms=1, budget_ms=50.0)
+    fired = []
+    steps = []
+
+    def boom():
+        raise ValueError("bug en una vista")
+
+    ticker.call_later("a", 1, boom)
+    ticker.call_later("b", 1, lambda: fired.append("b"))
+    ticker.call_later("b", 5, lambda: fired.append("b-later"))
+    ticker.tween("b", 3, steps.append)
+
+    w.run()
+    assert fired == ["b", "b-later"]
+    assert steps[-1] == 1.0
+    assert "ValueError: bug en una vista" in capsys.readouterr().err
+    assert ticker.pending() == 0
+
+
+def test_a_failing_tween_is_dropped_alone():
+    w = FakeWidget()
+    ticker = Ticker(w, frame_ms=1, budget_ms=50.0)
+    w.report_callback_exception = lambda *exc: reported.append(exc[0])
+    reported = []
+    steps = []
+
+    def bad_step(p):
+        raise RuntimeError
+
+    ticker.tween("a", 3, bad_step)
+    ticker.tween("b", 3, steps.append)
+    w.run()
+    assert reported == [RuntimeError]
+    assert steps[-1] == 1.0
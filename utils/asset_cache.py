@@ -0,0 +1,108 @@
+# utils/asset_cache.py
+import os
+import time
+from PIL import Image
+
+from utils.lru_cache import ByteLRUCache, image_nbytes
+from utils.mipmap import MIN_VIEW_SIZE, build_mipmaps, darken, mipmaps_nbytes
+
+# Presupuesto por defecto: alcanza para bg.jpg + levels_spooky.png decodificados
+# y las imágenes de How To Play, sin crecer sin límite.
+DEFAULT_MAX_BYTES = 96 * 1024 * 1024
+
+
+class AssetCache:
+    """
+    Cache de imágenes decodificadas compartida por todas las vistas.
+
+    - Cada archivo (ruta + modo) se decodifica UNA sola vez por proceso.
+    - Las vistas reciben la MISMA instancia PIL: deben tratarla como solo
+      lectura (resize/crop/convert devuelven copias, así que no hay problema).
+    - Presupuesto en bytes con expulsión LRU.
+    - Contadores de hits/misses/bytes y tiempo de decodificación ahorrado.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self._lru = ByteLRUCache(max_bytes, name="assets")
+        self._decode_ms: dict = {}
+        self.decode_ms_total = 0.0
+        self.decode_ms_saved = 0.0
+        self.bytes_saved = 0
+
+    def load(self, path: str | os.PathLike, mode: str = "RGB") -> Image.Image:
+        """
+        Devuelve la imagen de `path` convertida a `mode`, decodificándola solo
+        la primera vez.
+
+        Parámetros
+        ----------
+        path : str | os.PathLike
+            Ruta absoluta (usar assets_path/resource_path).
+        mode : str
+            Modo PIL final ("RGB", "RGBA", ...).
+
+        Retorna
+        -------
+        PIL.Image.Image
+            Imagen compartida (no modificar in-place).
+        """
+        key = (os.path.normcase(os.path.abspath(path)), mode)
+        img = self._lru.get(key)
+        if img is not None:
+            self.decode_ms_saved += self._decode_ms.get(key, 0.0)
+            self.bytes_saved += image_nbytes(img)
+            return img
+
+        t0 = time.perf_counter()
+        with Image.open(path) as src:
+            img = src.convert(mode)
+        img.load()
+        ms = (time.perf_counter() - t0) * 1000.0
+
+        self.decode_ms_total += ms
+        self._decode_ms[key] = ms
+        self._lru.put(key, img, image_nbytes(img))
+        return img
+
+    def mipmaps(self, path: str | os.PathLike, overlay_alpha: int = 0,
+                min_size=MIN_VIEW_SIZE) -> tuple:
+        """
+        Pirámide de mipmaps (RGB) de `path`, construida una sola vez por
+        asset y compartida por todas las vistas. `overlay_alpha` oscurece el
+        origen antes de reducir (fondos de Credits / How To Play).
+        """
+        key = ("mip", os.path.normcase(os.path.abspath(path)), int(overlay_alpha), tuple(min_size))
+        return self._lru.get_or_create(
+            key,
+            lambda: build_mipmaps(darken(self.load(path, "RGB"), overlay_alpha), min_size),
+            # sin overlay el nivel 0 ES la imagen ya cacheada por load()
+            nbytes=lambda lv: mipmaps_nbytes(lv[1:] if not overlay_alpha else lv),
+        )
+
+    def clear(self) -> None:
+        self._lru.clear()
+        self._decode_ms.clear()
+
+    def stats(self) -> dict:
+        """Contadores de la cache (hits, misses, bytes, ms de decodificación)."""
+        out = self._lru.stats()
+        out.update({
+            "decode_ms_total": round(self.decode_ms_total, 1),
+            "decode_ms_saved": round(self.decode_ms_saved, 1),
+            "bytes_saved": self.bytes_saved,
+        })
+        return out
+
+
+# Instancia única del proceso (la comparten todas las vistas)
+asset_cache = AssetCache()
+
+
+def load_image(path: str | os.PathLike, mode: str = "RGB") -> Image.Image:
+    """Atajo a `asset_cache.load(path, mode)`."""
+    return asset_cache.load(path, mode)
+
+
+def load_mipmaps(path: str | os.PathLike, overlay_alpha: int = 0) -> tuple:
+    """Atajo a `asset_cache.mipmaps(path, overlay_alpha)`."""
+    return asset_cache.mipmaps(path, overlay_alpha)
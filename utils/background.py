@@ -0,0 +1,116 @@
+# utils/background.py
+import time
+import tkinter as tk
+from PIL import Image, ImageTk
+
+from utils.mipmap import build_mipmaps, pick_mip
+from utils.perf import perf
+
+# ===================== Configuración =====================
+# Filtro durante un arrastre de ventana (rápido) y al asentarse (calidad)
+FAST_RESAMPLE = Image.Resampling.BILINEAR
+FINAL_RESAMPLE = Image.Resampling.LANCZOS
+# ms sin redibujos para considerar que el resize terminó (pasada LANCZOS)
+SETTLE_MS = 150
+# Durante el arrastre se admite ampliar hasta 1/FAST_MIP_SCALE el nivel elegido
+FAST_MIP_SCALE = 0.5
+
+
+def cover_resize(src: Image.Image, w: int, h: int, resample) -> Image.Image:
+    """
+    Escala `src` para CUBRIR (w, h) y recorta centrado, en un solo paso:
+    `resize(box=...)` solo procesa la región visible del origen.
+    """
+    sw, sh = src.size
+    scale = max(w / sw, h / sh)
+    bw, bh = w / scale, h / scale
+    left, top = (sw - bw) / 2, (sh - bh) / 2
+    return src.resize((w, h), resample, box=(left, top, left + bw, top + bh))
+
+
+class BackgroundRenderer:
+    """
+    Fondo "cover" de un Canvas con calidad progresiva.
+
+    - Si los redibujos llegan seguidos (arrastre de ventana) usa un mipmap
+      aún más chico (se amplía hasta 1/fast_mip_scale) y FAST_RESAMPLE.
+    - Cuando pasan `settle_ms` sin redibujos hace UNA pasada FINAL_RESAMPLE.
+    - Un redibujo aislado (primer layout, cambio de vista) va directo a calidad.
+    - Ambas pasadas remuestrean desde el nivel mipmap más chico que sirve,
+      nunca desde el original completo.
+    """
+
+    def __init__(self, canvas: tk.Canvas, item, mips, settle_ms: int = SETTLE_MS,
+                 fast_resample=FAST_RESAMPLE, final_resample=FINAL_RESAMPLE,
+                 fast_mip_scale: float = FAST_MIP_SCALE):
+        """
+        `mips` es la pirámide compartida de asset_cache.load_mipmaps(); también
+        se acepta una imagen suelta (se le construye su pirámide).
+        """
+        self.canvas = canvas
+        self.item = item
+        self.settle_ms = int(settle_ms)
+        self.fast_resample = fast_resample
+        self.final_resample = final_resample
+        self.fast_mip_scale = float(fast_mip_scale)
+        self._mips = build_mipmaps(mips) if isinstance(mips, Image.Image) else tuple(mips)
+
+        self._photo = None
+        self._final_size = None      # tamaño ya pintado en calidad final
+        self._last_call = 0.0
+        self._settle_after = None
+
+    def redraw(self):
+        w, h = self.canvas.winfo_width(), self.canvas.winfo_height()
+        if w < 2 or h < 2:
+            return
+        if (w, h) == self._final_size and self._settle_after is None:
+            return
+
+        now = time.perf_counter()
+        dragging = (now - self._last_call) * 1000.0 < self.settle_ms
+        self._last_call = now
+
+        if self._settle_after is not None:
+            self.canvas.after_cancel(self._settle_after)
+            self._settle_after = None
+
+        if dragging:
+            self._paint(w, h, final=False)
+            self._settle_after = self.canvas.after(self.settle_ms, self._settle)
+        else:
+            self._paint(w, h, final=True)
+
+    def _settle(self):
+        self._settle_after = None
+        try:
+            w, h = self.canvas.winfo_width(), self.canvas.winfo_height()
+        except tk.TclError:
+            return  # canvas destruido
+        if w >= 2 and h >= 2:
+            self._paint(w, h, final=True)
+
+    def _paint(self, w, h, final: bool):
+        with perf.probe("background"):
+            self._paint_now(w, h, final)
+
+    def _paint_now(self, w, h, final: bool):
+        if final:
+            img = cover_resize(pick_mip(self._mips, w, h), w, h, self.final_resample)
+        else:
+            k = self.fast_mip_scale
+            src = pick_mip(self._mips, max(1, int(w * k)), max(1, int(h * k)))
+            img = cover_resize(src, w, h, self.fast_resample)
+        self._photo = ImageTk.PhotoImage(img)
+        self.canvas.itemconfig(self.item, image=self._photo)
+        self.canvas.coords(self.item, 0, 0)
+        self._final_size = (w, h) if final else None
+
+    def cancel(self):
+        """Cancela la pasada final pendiente (al ocultar/destruir la vista)."""
+        if self._settle_after is not None:
+            try:
+                self.canvas.after_cancel(self._settle_after)
+            except tk.TclError:
+                pass
+            self._settle_after = None
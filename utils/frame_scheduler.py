@@ -0,0 +1,125 @@
+# utils/frame_scheduler.py
+import time
+import tkinter as tk
+import weakref
+
+from utils.perf import perf
+
+# Regiones de una vista, en el orden en que se redibujan dentro de un frame
+# (los íconos al final para que queden por encima del cuerpo)
+REGIONS = ("background", "header", "body", "footer", "icons")
+
+# Todos los schedulers vivos (para reportes); no los mantiene vivos
+_registry: "weakref.WeakSet[FrameScheduler]" = weakref.WeakSet()
+
+
+class FrameScheduler:
+    """
+    Agrupa los redibujos de una vista en UNA pasada after_idle por frame.
+
+    - mark(*regiones) marca regiones sucias y agenda la pasada si no hay una.
+    - Marcar una región que ya estaba sucia no cuesta nada: es un layout
+      redundante evitado (contador `coalesced`).
+    - flush() corre los handlers de las regiones sucias en el orden de
+      REGIONS. Si un handler marca una región posterior, se atiende en la
+      misma pasada.
+    """
+
+    def __init__(self, widget: tk.Misc, handlers: dict, name: str = "frame"):
+        """
+        Parámetros
+        ----------
+        widget : tk.Misc
+            Widget con el que se agenda after_idle (la vista).
+        handlers : dict
+            {región: callable sin argumentos}. Regiones fuera de REGIONS se
+            corren después de las conocidas.
+        name : str
+            Prefijo de la métrica en perf ("<name>.frame").
+        """
+        self.widget = widget
+        self.name = name
+        self.handlers = dict(handlers)
+        self.order = [r for r in REGIONS if r in self.handlers]
+        self.order += [r for r in self.handlers if r not in REGIONS]
+
+        self._dirty: set[str] = set()
+        self._after = None
+        self._flushing = False
+
+        self.frames = 0
+        self.marks = 0
+        self.coalesced = 0
+        self.runs = {r: 0 for r in self.order}
+        _registry.add(self)
+
+    def mark(self, *regions: str) -> None:
+        """Marca regiones sucias (todas si no se indica ninguna)."""
+        for r in (regions or self.order):
+            if r not in self.handlers:
+                continue
+            self.marks += 1
+            if r in self._dirty:
+                self.coalesced += 1
+            else:
+                self._dirty.add(r)
+        if self._dirty and self._after is None and not self._flushing:
+            self._after = self.widget.after_idle(self.flush)
+
+    def is_dirty(self, region: str) -> bool:
+        return region in self._dirty
+
+    def flush(self) -> None:
+        """Redibuja ya lo pendiente (también se puede llamar a mano)."""
+        if self._after is not None:
+            try:
+                self.widget.after_cancel(self._after)
+            except tk.TclError:
+                pass
+            self._after = None
+        if not self._dirty:
+            return
+
+        t0 = time.perf_counter()
+        self._flushing = True
+        try:
+            for r in self.order:
+                if r in self._dirty:
+                    self._dirty.discard(r)
+                    self.handlers[r]()
+                    self.runs[r] += 1
+        except tk.TclError:
+            self._dirty.clear()  # vista destruida
+            return
+        finally:
+            self._flushing = False
+        self.frames += 1
+        perf.record(f"{self.name}.frame", (time.perf_counter() - t0) * 1000.0)
+
+        # Regiones re-marcadas por un handler posterior: siguiente frame
+        if self._dirty:
+            self._after = self.widget.after_idle(self.flush)
+
+    def cancel(self) -> None:
+        """Descarta lo pendiente (al destruir la vista)."""
+        if self._after is not None:
+            try:
+                self.widget.after_cancel(self._after)
+            except tk.TclError:
+                pass
+            self._after = None
+        self._dirty.clear()
+
+    def stats(self) -> dict:
+        return {
+            "name": self.name,
+            "frames": self.frames,
+            "marks": self.marks,
+            "coalesced": self.coalesced,
+            "runs": dict(self.runs),
+        }
+
+
+def all_stats() -> list[dict]:
+    """Estadísticas de todos los schedulers vivos, ordenadas por nombre."""
+    return sorted((s.stats() for s in list(_registry)), key=lambda st: st["name"])
@@ -0,0 +1,142 @@
+# utils/lru_cache.py
+import weakref
+from collections import OrderedDict
+
+# Todas las caches vivas (para reportes); no las mantiene vivas
+_registry: "weakref.WeakSet[ByteLRUCache]" = weakref.WeakSet()
+
+
+def image_nbytes(img) -> int:
+    """
+    Estima los bytes que ocupa una imagen (PIL.Image o ImageTk.PhotoImage).
+
+    - PIL: ancho * alto * bandas.
+    - PhotoImage: Tk guarda siempre 4 bytes por pixel.
+    """
+    try:
+        bands = len(img.getbands())
+        return int(img.width) * int(img.height) * bands
+    except AttributeError:
+        pass
+    try:
+        return int(img.width()) * int(img.height()) * 4
+    except Exception:
+        return 0
+
+
+class ByteLRUCache:
+    """
+    Cache LRU acotada por bytes (no por número de entradas).
+
+    - Cada entrada guarda su tamaño estimado en bytes.
+    - Al superar `max_bytes` se expulsan las entradas menos usadas.
+    - Lleva contadores de hits / misses / evictions para diagnóstico.
+    """
+
+    def __init__(self, max_bytes: int, name: str = "cache"):
+        """
+        Parámetros
+        ----------
+        max_bytes : int
+            Presupuesto máximo en bytes. Una entrada más grande que el
+            presupuesto se devuelve pero no se guarda.
+        name : str
+            Nombre usado en los reportes de estadísticas.
+        """
+        self.name = name
+        self.max_bytes = int(max_bytes)
+        self._data: OrderedDict = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.peak_bytes = 0
+        _registry.add(self)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key) -> bool:
+        return key in self._data
+
+    def get(self, key, default=None):
+        """Devuelve el valor y lo marca como usado recientemente."""
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        self._data.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, key, value, nbytes: int) -> None:
+        """Guarda `value` ocupando `nbytes` y expulsa lo necesario."""
+        nbytes = max(0, int(nbytes))
+        old = self._data.pop(key, None)
+        if old is not None:
+            self._bytes -= old[1]
+        if nbytes > self.max_bytes:
+            return
+        self._data[key] = (value, nbytes)
+        self._bytes += nbytes
+        self._evict()
+        self.peak_bytes = max(self.peak_bytes, self._bytes)
+
+    def get_or_create(self, key, factory, nbytes=image_nbytes):
+        """
+        Devuelve la entrada de `key`; si no existe la crea con `factory()`.
+
+        `nbytes` puede ser un entero o una función que recibe el valor creado.
+        """
+        entry = self._data.get(key)
+        if entry is not None:
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+        self.misses += 1
+        value = factory()
+        size = nbytes(value) if callable(nbytes) else nbytes
+        self.put(key, value, size)
+        return value
+
+    def discard(self, key) -> None:
+        old = self._data.pop(key, None)
+        if old is not None:
+            self._bytes -= old[1]
+
+    def clear(self) -> None:
+        self._data.clear()
+        self._bytes = 0
+
+    def _evict(self) -> None:
+        while self._bytes > self.max_bytes and self._data:
+            _, (_, nbytes) = self._data.popitem(last=False)
+            self._bytes -= nbytes
+            self.evictions += 1
+
+    @property
+    def bytes(self) -> int:
+        return self._bytes
+
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return (self.hits / total) if total else 0.0
+
+    def stats(self) -> dict:
+        """Resumen de contadores (para logs o el overlay de rendimiento)."""
+        return {
+            "name": self.name,
+            "entries": len(self._data),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "peak_bytes": self.peak_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hit_rate(), 3),
+        }
+
+
+def all_stats() -> list[dict]:
+    """Estadísticas de todas las caches vivas, ordenadas por nombre."""
+    return sorted((c.stats() for c in list(_registry)), key=lambda st: st["name"])
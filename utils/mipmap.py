@@ -0,0 +1,44 @@
+# utils/mipmap.py
+from PIL import Image
+
+# Ventana más chica permitida (App.minsize): ningún nivel útil es menor
+MIN_VIEW_SIZE = (680, 450)
+
+
+def darken(src: Image.Image, overlay_alpha: int) -> Image.Image:
+    """Equivale a componer un negro con alfa `overlay_alpha` sobre `src` (RGB)."""
+    if not overlay_alpha:
+        return src
+    return Image.blend(src, Image.new("RGB", src.size, (0, 0, 0)), overlay_alpha / 255.0)
+
+
+def build_mipmaps(src: Image.Image, min_size=MIN_VIEW_SIZE) -> tuple:
+    """
+    Pirámide de niveles a la mitad (nivel 0 = original). Se detiene en el
+    último nivel que todavía CUBRE `min_size`: niveles más chicos nunca
+    se usarían sin ampliar.
+    """
+    mw, mh = min_size
+    levels = [src]
+    img = src
+    while img.width // 2 >= 1 and img.height // 2 >= 1:
+        w2, h2 = img.width // 2, img.height // 2
+        if max(mw / w2, mh / h2) > 1.0:
+            break
+        img = img.reduce(2)
+        levels.append(img)
+    return tuple(levels)
+
+
+def pick_mip(levels, w: int, h: int) -> Image.Image:
+    """El nivel más chico que todavía cubre (w, h) sin ampliar."""
+    best = levels[0]
+    for lvl in levels:
+        if max(w / lvl.width, h / lvl.height) > 1.0:
+            break
+        best = lvl
+    return best
+
+
+def mipmaps_nbytes(levels) -> int:
+    return sum(lvl.width * lvl.height * len(lvl.getbands()) for lvl in levels)
@@ -0,0 +1,76 @@
+# utils/path_index.py
+from bisect import bisect_left
+import math
+
+from utils.lru_cache import ByteLRUCache
+
+# Muestreos cacheados por (polilínea, n); cada entrada pesa ~n puntos
+SAMPLES_MAX_BYTES = 4 * 1024 * 1024
+_POINT_NBYTES = 16
+
+_samples = ByteLRUCache(SAMPLES_MAX_BYTES, name="path.samples")
+
+
+class PathIndex:
+    """
+    Índice de una polilínea por longitud de arco.
+
+    - Longitudes acumuladas precalculadas (una pasada O(segmentos)).
+    - point_at(s) ubica el segmento con bisect: O(log segmentos).
+    - sample(n) reparte n puntos equiespaciados; como los t son crecientes
+      avanza el segmento en vez de buscarlo: O(n + segmentos).
+    """
+
+    def __init__(self, poly):
+        self.poly = [(float(x), float(y)) for x, y in poly]
+        cum = [0.0]
+        for (x1, y1), (x2, y2) in zip(self.poly, self.poly[1:]):
+            cum.append(cum[-1] + math.hypot(x2 - x1, y2 - y1))
+        self.cum = cum
+
+    @property
+    def length(self) -> float:
+        return self.cum[-1]
+
+    def _lerp(self, i: int, s: float):
+        """Punto a longitud `s` dentro del segmento i (poly[i] -> poly[i+1])."""
+        (x1, y1), (x2, y2) = self.poly[i], self.poly[i + 1]
+        d = self.cum[i + 1] - self.cum[i]
+        u = (s - self.cum[i]) / d if d > 0 else 0.0
+        return (x1 + u * (x2 - x1), y1 + u * (y2 - y1))
+
+    def point_at(self, s: float):
+        """Punto a longitud de arco `s` (se recorta a [0, length])."""
+        if len(self.poly) < 2:
+            return self.poly[0]
+        s = min(max(s, 0.0), self.length)
+        # primer vértice con cum >= s; el segmento es el anterior
+        i = max(1, bisect_left(self.cum, s)) - 1
+        return self._lerp(min(i, len(self.poly) - 2), s)
+
+    def sample(self, n: int):
+        """n puntos equiespaciados, incluyendo ambos extremos."""
+        if not self.poly:
+            return [(0.5, 0.5)] * n
+        if self.length == 0 or n <= 1:
+            return [self.poly[0]] * n
+
+        out = []
+        last = len(self.poly) - 2
+        i = 0
+        step = self.length / (n - 1)
+        for k in range(n):
+            s = k * step
+            while i < last and self.cum[i + 1] < s:
+                i += 1
+            out.append(self._lerp(i, s))
+        return out
+
+
+def resample_path(poly, n: int):
+    """PathIndex(poly).sample(n), cacheado por (polilínea, n)."""
+    key = (tuple((float(x), float(y)) for x, y in poly), int(n))
+    return _samples.get_or_create(
+        key, lambda: tuple(PathIndex(key[0]).sample(key[1])),
+        nbytes=lambda pts: _POINT_NBYTES * max(1, len(pts)),
+    )
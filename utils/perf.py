@@ -0,0 +1,86 @@
+# utils/perf.py
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+
+# Muestras que se guardan por métrica (ventana deslizante)
+WINDOW = 120
+
+_NO_PROBE = nullcontext()
+
+
+class PerfStats:
+    """
+    Registro liviano de tiempos (ms) por nombre de métrica.
+
+    - record(name, ms): agrega una muestra.
+    - timer(name): context manager que mide un bloque.
+    - probe(name): como timer, pero solo mide con `enabled` (overlay de
+      rendimiento visible); apagado no cuesta más que un if.
+    - last / p95 / summary para reportes (sobre la ventana de WINDOW
+      muestras); total(name) cuenta todas las muestras desde el inicio.
+    """
+
+    def __init__(self, window: int = WINDOW):
+        self.window = int(window)
+        self._samples: dict[str, deque] = {}
+        self._totals: dict[str, int] = {}
+        self.enabled = False
+
+    def record(self, name: str, ms: float) -> None:
+        buf = self._samples.get(name)
+        if buf is None:
+            buf = self._samples[name] = deque(maxlen=self.window)
+        buf.append(float(ms))
+        self._totals[name] = self._totals.get(name, 0) + 1
+
+    @contextmanager
+    def timer(self, name: str):
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, (time.perf_counter() - t0) * 1000.0)
+
+    def probe(self, name: str):
+        return self.timer(name) if self.enabled else _NO_PROBE
+
+    def count(self, name: str) -> int:
+        buf = self._samples.get(name)
+        return len(buf) if buf else 0
+
+    def total(self, name: str) -> int:
+        """Muestras registradas desde el inicio (count() se limita a la ventana)."""
+        return self._totals.get(name, 0)
+
+    def names(self) -> list[str]:
+        return sorted(self._samples.keys())
+
+    def last(self, name: str) -> float:
+        buf = self._samples.get(name)
+        return buf[-1] if buf else 0.0
+
+    def p95(self, name: str) -> float:
+        buf = self._samples.get(name)
+        if not buf:
+            return 0.0
+        ordered = sorted(buf)
+        return ordered[min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))]
+
+    def summary(self) -> dict:
+        """{nombre: {"n", "last", "avg", "p95"}} con valores en ms."""
+        out = {}
+        for name, buf in self._samples.items():
+            if not buf:
+                continue
+            out[name] = {
+                "n": len(buf),
+                "last": round(buf[-1], 2),
+                "avg": round(sum(buf) / len(buf), 2),
+                "p95": round(self.p95(name), 2),
+            }
+        return out
+
+
+# Instancia única del proceso
+perf = PerfStats()
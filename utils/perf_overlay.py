@@ -0,0 +1,125 @@
+# utils/perf_overlay.py
+import tkinter as tk
+
+from utils.lru_cache import all_stats
+from utils.perf import perf
+
+# Cada cuánto se refresca el texto mientras está visible (ms)
+REFRESH_MS = 500
+
+FONT = "TkFixedFont"
+FG = "#E8F5E9"
+BG = "#000000"
+PAD = 8
+
+
+class PerfOverlay:
+    """
+    Panel de rendimiento dibujado sobre el canvas de la vista activa; se
+    muestra/oculta con "p" (junto a m / s en _bind_hotkeys de cada vista).
+
+    - Muestra last/p95 del layout de la vista ("<vista>.frame"), del tiempo
+      en fábricas PIL y en el fondo, hit rate de cada cache y el número de
+      items vivos del canvas.
+    - Estado global: si está encendido, sigue a la vista que se muestre
+      (cada vista llama a attach() al enlazar sus atajos).
+    - Apagado no deja nada corriendo y perf.enabled queda en False, así que
+      las mediciones opcionales (perf.probe) no cuestan nada.
+    """
+
+    def __init__(self):
+        self.visible = False
+        self.canvas = None
+        self.view_name = ""
+        self._bg_item = None
+        self._txt_item = None
+        self._after = None
+
+    # ---------------- API ----------------
+    def attach(self, canvas: tk.Canvas, view_name: str):
+        """La vista `view_name` pasó a ser la activa."""
+        if canvas is self.canvas:
+            return
+        self._remove()
+        self.canvas, self.view_name = canvas, view_name
+        if self.visible:
+            self._create()
+
+    def toggle(self, canvas: tk.Canvas | None = None, view_name: str | None = None):
+        if canvas is not None:
+            self.attach(canvas, view_name or self.view_name)
+        self.visible = not self.visible
+        perf.enabled = self.visible
+        if self.visible:
+            self._create()
+        else:
+            self._remove()
+
+    # ---------------- Dibujo ----------------
+    def _create(self):
+        if self.canvas is None or self._txt_item is not None:
+            return
+        try:
+            self._bg_item = self.canvas.create_rectangle(
+                0, 0, 0, 0, fill=BG, outline="", stipple="gray50"
+            )
+            self._txt_item = self.canvas.create_text(
+                0, 0, text="", fill=FG, font=FONT, anchor="ne", justify="left"
+            )
+        except tk.TclError:
+            self._bg_item = self._txt_item = None
+            return
+        self._refresh()
+
+    def _remove(self):
+        if self.canvas is not None:
+            try:
+                if self._after is not None:
+                    self.canvas.after_cancel(self._after)
+                for item in (self._bg_item, self._txt_item):
+                    if item is not None:
+                        self.canvas.delete(item)
+            except tk.TclError:
+                pass  # canvas destruido
+        self._after = None
+        self._bg_item = self._txt_item = None
+
+    def _refresh(self):
+        self._after = None
+        if not self.visible or self._txt_item is None:
+            return
+        try:
+            c = self.canvas
+            c.itemconfigure(self._txt_item, text=self._text())
+            x = c.winfo_width() - PAD
+            c.coords(self._txt_item, x, PAD + 60)
+            x0, y0, x1, y1 = c.bbox(self._txt_item)
+            c.coords(self._bg_item, x0 - PAD, y0 - PAD, x1 + PAD, y1 + PAD)
+            c.tag_raise(self._bg_item)
+            c.tag_raise(self._txt_item)
+            self._after = c.after(REFRESH_MS, self._refresh)
+        except tk.TclError:
+            self._txt_item = self._bg_item = None
+
+    def _text(self) -> str:
+        def row(label, name):
+            if not perf.count(name):
+                return f"{label:<11} -"
+            return f"{label:<11} last {perf.last(name):6.1f} ms  p95 {perf.p95(name):6.1f} ms"
+
+        lines = [
+            f"[{self.view_name}]  items: {len(self.canvas.find_all())}",
+            row("layout", f"{self.view_name}.frame"),
+            row("PIL", "pil.factory") + f"  n={perf.total('pil.factory')}",
+            row("background", "background"),
+            row("ticker", "ticker.frame"),
+            "caches (hit rate):",
+        ]
+        for st in all_stats():
+            if st["hits"] + st["misses"]:
+                lines.append(f"  {st['name']:<16} {st['hit_rate'] * 100:5.1f}%  ({st['entries']})")
+        return "\n".join(lines)
+
+
+# Instancia única del proceso
+perf_overlay = PerfOverlay()
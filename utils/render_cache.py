@@ -0,0 +1,255 @@
+# utils/render_cache.py
+import os
+
+from PIL import Image, ImageTk, ImageDraw, ImageFilter
+
+from utils.lru_cache import ByteLRUCache
+from utils.perf import perf
+from utils import sdf_raster
+
+# Presupuesto de la cache de primitivas (botones, paneles, tokens, barras)
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# Cache compartida por TODAS las vistas. Las claves incluyen la geometría ya
+# escalada (w, h, r, sombra...), el color y el factor de supersampling, así que
+# volver a una pantalla con la misma escala no repite trabajo de PIL.
+render_cache = ByteLRUCache(DEFAULT_MAX_BYTES, name="render")
+
+# Rasterizador de formas: "numpy" (SDF analítico a 1x, ver utils.sdf_raster)
+# o "pil" (supersampling aa + GaussianBlur + LANCZOS). Sin NumPy siempre "pil".
+# LEGENDS_RASTER=pil fuerza el camino original.
+RASTER_BACKEND = "numpy" if sdf_raster.HAVE_NUMPY else "pil"
+if os.environ.get("LEGENDS_RASTER") == "pil":
+    RASTER_BACKEND = "pil"
+
+# Presupuesto de cada cache de imágenes ligadas al tamaño de ventana
+# (barras de header/footer): unos pocos anchos completos a 1920 px.
+RESIZE_MAX_BYTES = 8 * 1024 * 1024
+
+
+def resize_cache(name: str, max_bytes: int = RESIZE_MAX_BYTES) -> ByteLRUCache:
+    """
+    Cache LRU por bytes para PhotoImages que dependen del tamaño de la
+    ventana. Durante un arrastre cada ancho crea una entrada nueva; el
+    presupuesto mantiene la memoria plana y expulsa los anchos viejos.
+    """
+    return ByteLRUCache(max_bytes, name=name)
+
+
+def _rgba(color, alpha=None):
+    """Normaliza "#RRGGBB" o tupla a una tupla usable por PIL."""
+    if isinstance(color, str) and alpha is not None:
+        hx = color.lstrip("#")
+        return (int(hx[0:2], 16), int(hx[2:4], 16), int(hx[4:6], 16), int(alpha))
+    return color
+
+
+def _get(key, build, photo):
+    """
+    Devuelve la imagen PIL de `key` (creándola con `build` si falta) o, si
+    `photo=True`, su PhotoImage, que se cachea aparte con la misma clave.
+    """
+    def timed_build():
+        with perf.probe("pil.factory"):
+            return build()
+
+    if not photo:
+        return render_cache.get_or_create(key, timed_build)
+    return render_cache.get_or_create(
+        ("photo",) + key,
+        lambda: ImageTk.PhotoImage(render_cache.get_or_create(key, timed_build)),
+    )
+
+
+# ===================== Rasterizado directo =====================
+def _raster_round_rect(w, h, r, fill, outline, outline_width, aa):
+    """Rasteriza directo: SDF con NumPy, o supersampling `aa` + LANCZOS."""
+    if RASTER_BACKEND == "numpy":
+        return sdf_raster.round_rect(w, h, r, fill, outline, outline_width)
+    return _pil_round_rect(w, h, r, fill, outline, outline_width, aa)
+
+
+def _pil_round_rect(w, h, r, fill, outline, outline_width, aa):
+    W, H, R = w * aa, h * aa, r * aa
+    img = Image.new("RGBA", (W, H), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(img)
+    draw.rounded_rectangle([0, 0, W - 1, H - 1], R, fill=fill)
+    if outline and outline_width > 0:
+        ow = outline_width * aa
+        draw.rounded_rectangle(
+            [ow // 2, ow // 2, W - 1 - ow // 2, H - 1 - ow // 2],
+            R - ow // 2, outline=outline, width=ow
+        )
+    return img.resize((w, h), Image.Resampling.LANCZOS)
+
+
+def _raster_panel(w, h, r, fill, shadow_color, ox, oy, blur, aa):
+    """Rasteriza directo panel + sombra desenfocada (SDF o supersampling `aa`)."""
+    if RASTER_BACKEND == "numpy":
+        return sdf_raster.panel(w, h, r, fill, shadow_color, ox, oy, blur)
+    return _pil_panel(w, h, r, fill, shadow_color, ox, oy, blur, aa)
+
+
+def _pil_panel(w, h, r, fill, shadow_color, ox, oy, blur, aa):
+    W, H, R = w * aa, h * aa, r * aa
+    sox, soy = ox * aa, oy * aa
+    base = Image.new("RGBA", (W + abs(sox), H + abs(soy)), (0, 0, 0, 0))
+
+    shadow = Image.new("RGBA", (W, H), (0, 0, 0, 0))
+    ImageDraw.Draw(shadow).rounded_rectangle([0, 0, W - 1, H - 1], R, fill=tuple(shadow_color))
+    if blur > 0:
+        shadow = shadow.filter(ImageFilter.GaussianBlur(blur * aa))
+    base.alpha_composite(shadow, (max(0, sox), max(0, soy)))
+
+    card = Image.new("RGBA", (W, H), (0, 0, 0, 0))
+    ImageDraw.Draw(card).rounded_rectangle([0, 0, W - 1, H - 1], R, fill=fill)
+    base.alpha_composite(card, (0, 0))
+
+    return base.resize((w + abs(ox), h + abs(oy)), Image.Resampling.LANCZOS)
+
+
+def _pil_token(d, fill, border, sh_off, sh_blur, border_w, aa):
+    D = d * aa
+    base = Image.new("RGBA", (D, D + sh_off * aa), (0, 0, 0, 0))
+
+    sh = Image.new("RGBA", (D, D), (0, 0, 0, 0))
+    ImageDraw.Draw(sh).ellipse([0, 0, D - 1, D - 1], fill=(0, 0, 0, 120))
+    sh = sh.filter(ImageFilter.GaussianBlur(sh_blur * aa))
+    base.alpha_composite(sh, (0, (sh_off * aa) // 2))
+
+    ImageDraw.Draw(base).ellipse([0, 0, D - 1, D - 1], fill=fill, outline=border, width=border_w)
+    return base.resize((d, d + sh_off), Image.Resampling.LANCZOS)
+
+
+# ===================== Nine-slice =====================
+def _nine_slice(proto, c, size, extra):
+    """
+    Compone una imagen de tamaño `size` a partir de `proto`, un prototipo
+    cuadrado de lado (2c + 1) + `extra` (sombra desplazada):
+
+    - esquinas (c x c, más `extra` a derecha/abajo) se copian tal cual;
+    - la fila/columna central del prototipo es constante a lo largo del
+      borde, así que se estira (NEAREST) para cubrir cualquier tamaño.
+    """
+    out_w, out_h = size
+    pw, ph = proto.size
+    ex, ey = extra
+    rw, bh = c + ex, c + ey             # ancho/alto de la franja derecha/inferior
+    mw, mh = out_w - c - rw, out_h - c - bh
+    out = Image.new("RGBA", (out_w, out_h), (0, 0, 0, 0))
+
+    xs = [(0, c, 0, c), (c, c + 1, c, mw), (pw - rw, pw, c + mw, rw)]
+    ys = [(0, c, 0, c), (c, c + 1, c, mh), (ph - bh, ph, c + mh, bh)]
+    for sx0, sx1, dx, dw in xs:
+        for sy0, sy1, dy, dh in ys:
+            if dw <= 0 or dh <= 0:
+                continue
+            tile = proto.crop((sx0, sy0, sx1, sy1))
+            if tile.size != (dw, dh):
+                tile = tile.resize((dw, dh), Image.Resampling.NEAREST)
+            out.paste(tile, (dx, dy))
+    return out
+
+
+def _slice_corner(r, blur=0):
+    """
+    Lado de la esquina del nine-slice: radio + alcance del desenfoque
+    (~3 sigma) + margen para el filtro LANCZOS del supersampling.
+    """
+    return r + 3 * blur + 2
+
+
+# ===================== Imágenes PIL =====================
+def round_rect_image(w, h, r, fill, outline=None, outline_width=0, aa=4, photo=False):
+    """
+    Rectángulo redondeado antialiasado (supersampling `aa` + LANCZOS).
+    Se compone por nine-slice desde un prototipo cacheado por (r, colores),
+    así que un ancho nuevo no vuelve a rasterizar.
+    La imagen devuelta es compartida: no modificar in-place.
+    """
+    w = max(1, int(w)); h = max(1, int(h)); r = max(0, int(r)); aa = max(1, int(aa))
+    key = ("round", w, h, r, fill, outline, outline_width, aa)
+
+    def build():
+        c = _slice_corner(r)
+        p = 2 * c + 1
+        if w < p or h < p:
+            return _raster_round_rect(w, h, r, fill, outline, outline_width, aa)
+        proto = render_cache.get_or_create(
+            ("round9", r, fill, outline, outline_width, aa),
+            lambda: _raster_round_rect(p, p, r, fill, outline, outline_width, aa),
+        )
+        return _nine_slice(proto, c, (w, h), (0, 0))
+
+    return _get(key, build, photo)
+
+
+def panel_image(w, h, r, fill="#CCCCCC",
+                shadow_color=(0, 0, 0, 90), shadow_offset=(0, 8), blur=3, aa=4, photo=False):
+    """
+    Panel redondeado con sombra desenfocada (Gaussian) desplazada.
+    Tamaño final: (w + |ox|, h + |oy|). Nine-slice desde un prototipo por
+    (r, color, sombra, blur). Imagen compartida: no modificar.
+    """
+    w = max(1, int(w)); h = max(1, int(h)); r = max(0, int(r)); aa = max(1, int(aa))
+    ox, oy = int(shadow_offset[0]), int(shadow_offset[1])
+    blur = max(0, int(blur))
+    shadow_color = tuple(shadow_color)
+    key = ("panel", w, h, r, fill, shadow_color, (ox, oy), blur, aa)
+
+    def build():
+        c = _slice_corner(r, blur)
+        p = 2 * c + 1
+        if w < p or h < p:
+            return _raster_panel(w, h, r, fill, shadow_color, ox, oy, blur, aa)
+        proto = render_cache.get_or_create(
+            ("panel9", r, fill, shadow_color, (ox, oy), blur, aa),
+            lambda: _raster_panel(p, p, r, fill, shadow_color, ox, oy, blur, aa),
+        )
+        return _nine_slice(proto, c, (w + abs(ox), h + abs(oy)), (abs(ox), abs(oy)))
+
+    return _get(key, build, photo)
+
+
+def bar_image(w, h, color_hex, alpha=160):
+    """
+    Barra sólida semitransparente (header/footer). NO pasa por la cache
+    compartida: depende del ancho de la ventana y crearla es trivial, así que
+    solo llenaría la cache durante un resize. Las vistas cachean el
+    PhotoImage en su propia resize_cache().
+    """
+    w = max(1, int(w)); h = max(1, int(h))
+    return Image.new("RGBA", (w, h), _rgba(color_hex, alpha))
+
+
+def token_image(d, fill, border, sh_off, sh_blur, border_w, aa=4, photo=False):
+    """Token circular con borde y sombra (nodos del mapa de niveles)."""
+    d = max(1, int(d)); sh_off = max(0, int(sh_off)); sh_blur = max(1, int(sh_blur))
+    key = ("token", d, fill, border, sh_off, sh_blur, int(border_w), aa)
+
+    def build():
+        if RASTER_BACKEND == "numpy":
+            # border_w viene en pixeles del supersampling
+            return sdf_raster.token(d, fill, border, sh_off, sh_blur, int(border_w) / aa)
+        return _pil_token(d, fill, border, sh_off, sh_blur, int(border_w), aa)
+
+    return _get(key, build, photo)
+
+
+
+# ===================== Atajos PhotoImage (Tk) =====================
+def round_rect_photo(w, h, r, fill, outline=None, outline_width=0, aa=4):
+    return round_rect_image(w, h, r, fill, outline, outline_width, aa, photo=True)
+
+
+def panel_photo(w, h, r, fill="#CCCCCC",
+                shadow_color=(0, 0, 0, 90), shadow_offset=(0, 8), blur=3, aa=4):
+    return panel_image(w, h, r, fill, shadow_color, shadow_offset, blur, aa, photo=True)
+
+
+def bar_photo(w, h, color_hex, alpha=160):
+    return ImageTk.PhotoImage(bar_image(w, h, color_hex, alpha))
+
+
+def token_photo(d, fill, border, sh_off, sh_blur, border_w, aa=4):
+    return token_image(d, fill, border, sh_off, sh_blur, border_w, aa, photo=True)
@@ -0,0 +1,125 @@
+# utils/sprite_atlas.py
+import time
+
+from PIL import Image, ImageColor, ImageTk
+
+from utils.lru_cache import ByteLRUCache
+from utils.perf import perf
+from utils.resource_path import assets_path
+
+# Íconos y logos de la UI: nombre -> ruta relativa a assets/
+SPRITES = {
+    "music_on":     ("icons", "music_on.png"),
+    "music_off":    ("icons", "music_off.png"),
+    "sound_on":     ("icons", "sound_on.png"),
+    "sound_off":    ("icons", "sound_off.png"),
+    "logo_ucr":     ("logos", "logo_ucr.png"),
+    "logo_tcu_658": ("logos", "logo_tcu_658.png"),
+    "logo_escuela": ("logos", "logo_escuela.png"),
+}
+
+# Alto de cada sprite dentro del atlas: ~2x el mayor alto en pantalla
+# (logo de 70 px), así la reducción final sigue siendo de buena calidad
+SPRITE_H = 160
+# Separación entre sprites (evita sangrado del LANCZOS entre vecinos)
+PADDING = 2
+# PhotoImages escaladas/tintadas compartidas por todas las vistas
+PHOTOS_MAX_BYTES = 8 * 1024 * 1024
+
+
+class SpriteAtlas:
+    """
+    Todos los íconos y logos empaquetados en UNA imagen RGBA.
+
+    - Cada PNG de origen se decodifica y reduce a SPRITE_H una sola vez por
+      proceso (los logos originales miden hasta 2700 px de alto).
+    - photo(nombre, alto, tinte) recorta del atlas, escala y tinta; el
+      resultado se guarda en una cache compartida por (nombre, alto, tinte):
+      cambiar de vista o volver a una escala ya vista no hace trabajo PIL.
+    """
+
+    def __init__(self, sprites: dict = SPRITES, sprite_h: int = SPRITE_H):
+        self.sprites = dict(sprites)
+        self.sprite_h = int(sprite_h)
+        self._atlas = None
+        self._rects: dict[str, tuple] = {}
+        self._src_sizes: dict[str, tuple] = {}
+        self._photos = ByteLRUCache(PHOTOS_MAX_BYTES, name="atlas.photos")
+
+    # ---------------- Atlas ----------------
+    def _build(self):
+        t0 = time.perf_counter()
+        tiles = []
+        for name, parts in self.sprites.items():
+            with Image.open(assets_path(*parts)) as src:
+                img = src.convert("RGBA")
+            self._src_sizes[name] = img.size
+            w = max(1, round(img.width * self.sprite_h / img.height))
+            tiles.append((name, img.resize((w, self.sprite_h), Image.Resampling.LANCZOS, reducing_gap=3.0)))
+
+        # Una sola fila: todos los sprites tienen el mismo alto
+        total_w = sum(t.width for _, t in tiles) + PADDING * (len(tiles) + 1)
+        atlas = Image.new("RGBA", (total_w, self.sprite_h + 2 * PADDING), (0, 0, 0, 0))
+        x = PADDING
+        for name, tile in tiles:
+            atlas.paste(tile, (x, PADDING))
+            self._rects[name] = (x, PADDING, x + tile.width, PADDING + tile.height)
+            x += tile.width + PADDING
+
+        self._atlas = atlas
+        perf.record("atlas.build", (time.perf_counter() - t0) * 1000.0)
+
+    @property
+    def atlas(self) -> Image.Image:
+        if self._atlas is None:
+            self._build()
+        return self._atlas
+
+    def size_of(self, name: str, height: int) -> tuple:
+        """
+        (ancho, alto) del sprite escalado a `height`, sin crear la imagen.
+        El ancho sale de la proporción del PNG original (igual que antes del
+        atlas), no de la del tile ya redondeado.
+        """
+        self._rect(name)
+        sw, sh = self._src_sizes[name]
+        return max(1, int(sw * (height / sh))), int(height)
+
+    def _rect(self, name: str) -> tuple:
+        if self._atlas is None:
+            self._build()
+        return self._rects[name]
+
+    # ---------------- Sprites ----------------
+    def image(self, name: str, height: int, tint: str | None = None) -> Image.Image:
+        """Sprite `name` escalado a `height` (mantiene proporción) y tintado."""
+        img = self.atlas.crop(self._rect(name))
+        img = img.resize(self.size_of(name, height), Image.Resampling.LANCZOS)
+        if tint:
+            colored = Image.new("RGBA", img.size, ImageColor.getrgb(tint)[:3] + (255,))
+            colored.putalpha(img.getchannel("A"))
+            img = colored
+        return img
+
+    def photo(self, name: str, height: int, tint: str | None = None) -> ImageTk.PhotoImage:
+        """PhotoImage compartida de image(name, height, tint)."""
+        key = (name, int(height), tint)
+
+        def build():
+            with perf.probe("pil.factory"):
+                return ImageTk.PhotoImage(self.image(name, height, tint))
+
+        return self._photos.get_or_create(key, build)
+
+    def stats(self) -> dict:
+        st = self._photos.stats()
+        st["atlas_size"] = self._atlas.size if self._atlas is not None else None
+        return st
+
+
+# Instancia única del proceso
+ui_atlas = SpriteAtlas()
+
+
+def atlas_photo(name: str, height: int, tint: str | None = None) -> ImageTk.PhotoImage:
+    return ui_atlas.photo(name, height, tint)
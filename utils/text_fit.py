@@ -0,0 +1,184 @@
+# utils/text_fit.py
+import tkinter.font as tkfont
+
+from utils.lru_cache import ByteLRUCache
+
+# Entradas máximas del memo de resultados (cada entrada cuenta como 1 "byte")
+MEMO_MAX_ENTRIES = 4096
+
+
+class GlyphTable:
+    """
+    Anchos de avance por glifo para UNA fuente (familia + tamaño).
+
+    Cada glifo se mide con Tk una sola vez; después el ancho de un texto es
+    la suma de avances en Python puro (sin kerning, igual que el wrap que
+    hace Tk por palabras). Glifos desconocidos caen a Tk y se guardan.
+    """
+
+    def __init__(self, font: tkfont.Font):
+        self._font = font
+        self.advances: dict[str, int] = {}
+        self.tk_calls = 0
+
+    def advance(self, ch: str) -> int:
+        w = self.advances.get(ch)
+        if w is None:
+            w = self.advances[ch] = self._font.measure(ch)
+            self.tk_calls += 1
+        return w
+
+    def width(self, text: str) -> int:
+        adv = self.advances
+        try:
+            return sum(adv[ch] for ch in text)
+        except KeyError:
+            return sum(self.advance(ch) for ch in text)
+
+    def preload(self, chars: str) -> None:
+        for ch in chars:
+            self.advance(ch)
+
+
+# Tablas compartidas por proceso: {(familia, px): GlyphTable}
+_tables: dict = {}
+_fonts: dict = {}
+
+
+def get_font(family: str, px: int) -> tkfont.Font:
+    """Pool de tkfont.Font por (familia, tamaño en pixeles)."""
+    f = _fonts.get((family, px))
+    if f is None:
+        f = _fonts[(family, px)] = tkfont.Font(family=family, size=px)
+    return f
+
+
+def glyph_table(family: str, px: int) -> GlyphTable:
+    t = _tables.get((family, px))
+    if t is None:
+        t = _tables[(family, px)] = GlyphTable(get_font(family, px))
+    return t
+
+
+def wrap_words(text: str, max_px: int, table: GlyphTable) -> list[str]:
+    """
+    Wrap por palabras midiendo con la tabla de glifos (sin llamar a Tk una
+    vez conocidos los glifos). Una palabra más ancha que max_px queda sola.
+    """
+    words = (text or "").split()
+    if not words:
+        return [""]
+
+    space = table.advance(" ")
+    lines = []
+    cur = words[0]
+    cur_w = table.width(cur)
+    for w in words[1:]:
+        ww = table.width(w)
+        if cur_w + space + ww <= max_px:
+            cur += " " + w
+            cur_w += space + ww
+        else:
+            lines.append(cur)
+            cur, cur_w = w, ww
+    lines.append(cur)
+    return lines
+
+
+class TextFitter:
+    """
+    Elige el tamaño de fuente más grande con el que un texto entra en una caja.
+
+    - Pool de tkfont.Font por tamaño en pixeles (se crean una sola vez).
+    - Anchos desde tablas de avance por glifo (GlyphTable): el wrap corre
+      en Python puro; linespace memoizado por tamaño.
+    - Memo del resultado por (texto, inner_w, inner_h, ui_scale): en layouts
+      repetidos no se llama a Tk.
+    - Búsqueda binaria del tamaño: el alto envuelto crece con el tamaño.
+    """
+
+    def __init__(self, family: str = "Mikado Ultra", start_pt: int = 18,
+                 min_pt: int = 11, max_lines: int = 2, name: str = "textfit"):
+        self.family = family
+        self.start_pt = int(start_pt)
+        self.min_pt = int(min_pt)
+        self.max_lines = int(max_lines)
+        self._linespace: dict[int, int] = {}
+        self._memo = ByteLRUCache(MEMO_MAX_ENTRIES, name=f"{name}.fit")
+
+    # ---------------- Fuentes ----------------
+    @staticmethod
+    def px_size(pt: int, ui_scale: float) -> int:
+        return max(8, int(round(pt * ui_scale)))
+
+    def font(self, px: int) -> tkfont.Font:
+        return get_font(self.family, px)
+
+    def table(self, px: int) -> GlyphTable:
+        return glyph_table(self.family, px)
+
+    def measure(self, text: str, px: int) -> int:
+        return self.table(px).width(text)
+
+    def linespace(self, px: int) -> int:
+        ls = self._linespace.get(px)
+        if ls is None:
+            ls = self._linespace[px] = self.font(px).metrics("linespace")
+        return ls
+
+    # ---------------- Wrap ----------------
+    def wrap(self, text: str, max_px: int, px: int) -> list[str]:
+        """Wrap básico por palabras, medido con la tabla de glifos."""
+        return wrap_words(text, max_px, self.table(px))
+
+    # ---------------- Fit ----------------
+    def fit(self, text: str, inner_w: int, inner_h: int, ui_scale: float) -> int:
+        """
+        Tamaño (en 'pt base') más grande que:
+          - permita wrap a <= max_lines y quepa en inner_h;
+          - si es imposible, que al menos quepa en inner_h;
+          - si tampoco, min_pt.
+        """
+        key = (text, int(inner_w), int(inner_h), round(float(ui_scale), 4))
+        pt = self._memo.get(key)
+        if pt is None:
+            pt = self._search(text, inner_w, inner_h, ui_scale)
+            self._memo.put(key, pt, 1)
+        return pt
+
+    def _search(self, text, inner_w, inner_h, ui_scale) -> int:
+        def fits(pt, limit_lines):
+            px = self.px_size(pt, ui_scale)
+            lines = self.wrap(text, inner_w, px)
+            if limit_lines and len(lines) > self.max_lines:
+                return False
+            return len(lines) * self.linespace(px) <= inner_h
+
+        for limit_lines in (True, False):
+            pt = self._largest(lambda p: fits(p, limit_lines))
+            if pt is not None:
+                return pt
+        return self.min_pt
+
+    def _largest(self, ok):
+        """Mayor pt en [min_pt, start_pt] con ok(pt), asumiendo monotonía."""
+        lo, hi = self.min_pt, self.start_pt
+        if ok(hi):
+            return hi
+        if not ok(lo):
+            return None
+        # invariante: ok(lo) y not ok(hi)
+        while hi - lo > 1:
+            mid = (lo + hi) // 2
+            if ok(mid):
+                lo = mid
+            else:
+                hi = mid
+        return lo
+
+    def stats(self) -> dict:
+        return {
+            "fit": self._memo.stats(),
+            "glyph_tables": len(_tables),
+            "glyph_tk_calls": sum(t.tk_calls for t in _tables.values()),
+        }
@@ -0,0 +1,254 @@
+# utils/ticker.py
+import heapq
+import itertools
+import sys
+import time
+import tkinter as tk
+import traceback
+import weakref
+
+from utils.perf import perf
+
+# Frame objetivo (~60 fps) y cuánto de ese frame puede usar el ticker
+FRAME_MS = 16
+BUDGET_MS = 8.0
+
+
+def linear(t: float) -> float:
+    return t
+
+
+def ease_out_cubic(t: float) -> float:
+    return 1.0 - (1.0 - t) ** 3
+
+
+def ease_in_out_cubic(t: float) -> float:
+    return 4 * t * t * t if t < 0.5 else 1.0 - (-2 * t + 2) ** 3 / 2
+
+
+class _Job:
+    __slots__ = ("owner", "key", "fn", "due", "seq", "alive",
+                 "start", "duration", "step", "done", "ease")
+
+    def __init__(self, owner, key, seq):
+        self.owner = owner
+        self.key = key
+        self.seq = seq
+        self.alive = True
+        self.fn = self.step = self.done = self.ease = None
+        self.due = self.start = self.duration = 0.0
+
+    def __lt__(self, other):
+        return (self.due, self.seq) < (other.due, other.seq)
+
+
+class Ticker:
+    """
+    Reloj único de la App para animaciones y callbacks diferidos.
+
+    - call_later(owner, ms, fn, key=None): como after(); con `key`, volver a
+      llamarlo reprograma el mismo trabajo (debounce de resize, feedback de
+      click) en vez de apilar timers.
+    - tween(owner, ms, step, done=None, ease=...): llama step(p) con p en
+      [0, 1] cada frame según el tiempo real transcurrido; si se pierden
+      frames la animación salta, no se alarga.
+    - Un solo after() pendiente: cada FRAME_MS mientras haya tweens, o hasta
+      el próximo timer si no; sin trabajo no queda nada agendado.
+    - Presupuesto por frame (BUDGET_MS): lo que no entra se corre en el
+      frame siguiente (contador `deferred`).
+    - cancel_owner(owner) descarta todo lo de una vista; App lo llama al
+      ocultar/destruir vistas y cada owner se limpia solo en <Destroy>.
+    """
+
+    def __init__(self, widget: tk.Misc, frame_ms: int = FRAME_MS, budget_ms: float = BUDGET_MS):
+        self.widget = widget
+        self.frame_ms = int(frame_ms)
+        self.budget_ms = float(budget_ms)
+
+        self._timers: list[_Job] = []     # heap por (due, seq)
+        self._tweens: list[_Job] = []
+        self._by_key: dict = {}           # (owner, key) -> _Job
+        self._owners: dict = {}           # owner -> set[_Job]
+        self._bound = weakref.WeakSet()   # owners con <Destroy> ya enlazado
+        self._seq = itertools.count()
+        self._after = None
+        self._after_due = 0.0
+
+        self.frames = 0
+        self.dropped = 0
+        self.deferred = 0
+        self.callbacks = 0
+
+    # ---------------- API ----------------
+    def call_later(self, owner, ms: float, fn, key=None) -> _Job:
+        job = self._job(owner, key)
+        job.fn = fn
+        job.due = time.perf_counter() + ms / 1000.0
+        heapq.heappush(self._timers, job)
+        self._wake()
+        return job
+
+    def tween(self, owner, ms: float, step, done=None, ease=ease_out_cubic, key=None) -> _Job:
+        job = self._job(owner, key)
+        job.start = time.perf_counter()
+        job.duration = max(1e-6, ms / 1000.0)
+        job.step, job.done, job.ease = step, done, ease
+        self._tweens.append(job)
+        self._wake()
+        return job
+
+    def cancel(self, job: _Job | None) -> None:
+        if job is None or not job.alive:
+            return
+        job.alive = False
+        if job.key is not None and self._by_key.get((job.owner, job.key)) is job:
+            del self._by_key[(job.owner, job.key)]
+        jobs = self._owners.get(job.owner)
+        if jobs is not None:
+            jobs.discard(job)
+        # el heap y la lista de tweens se limpian solos en el próximo tick
+
+    def cancel_owner(self, owner) -> None:
+        for job in list(self._owners.pop(owner, ())):
+            self.cancel(job)
+
+    def pending(self, owner=None) -> int:
+        if owner is not None:
+            return len(self._owners.get(owner, ()))
+        return sum(len(j) for j in self._owners.values())
+
+    # ---------------- Internos ----------------
+    def _job(self, owner, key) -> _Job:
+        if key is not None:
+            self.cancel(self._by_key.get((owner, key)))
+        job = _Job(owner, key, next(self._seq))
+        if key is not None:
+            self._by_key[(owner, key)] = job
+        jobs = self._owners.get(owner)
+        if jobs is None:
+            jobs = self._owners[owner] = set()
+            if isinstance(owner, tk.Misc) and owner not in self._bound:
+                try:
+                    owner.bind("<Destroy>", lambda e, o=owner: e.widget is o and self.cancel_owner(o), add="+")
+                    self._bound.add(owner)
+                except tk.TclError:
+                    pass
+        jobs.add(job)
+        return job
+
+    def _delay_ms(self, now: float) -> int:
+        """Un frame si hay tweens; si no, hasta el próximo timer."""
+        if self._tweens or not self._timers:
+            return self.frame_ms
+        return max(1, int((self._timers[0].due - now) * 1000.0 + 0.999))
+
+    def _schedule(self, now: float):
+        delay = self._delay_ms(now)
+        self._after_due = now + delay / 1000.0
+        try:
+            self._after = self.widget.after(delay, self._tick)
+        except tk.TclError:
+            self._after = None  # raíz destruida
+
+    def _wake(self):
+        now = time.perf_counter()
+        if self._after is not None:
+            # ya hay tick agendado: solo adelantarlo si hace falta
+            if now + self._delay_ms(now) / 1000.0 >= self._after_due:
+                return
+            try:
+                self.widget.after_cancel(self._after)
+            except tk.TclError:
+                pass
+        self._schedule(now)
+
+    def _run(self, job: _Job, fn, *args):
+        try:
+            fn(*args)
+        except tk.TclError:
+            self.cancel_owner(job.owner)  # la vista ya no existe
+        except Exception:
+            # El error de una vista no debe parar el reloj de todas: se
+            # reporta como cualquier callback de Tk y se descarta solo ese job
+            self.cancel(job)
+            report = getattr(self.widget, "report_callback_exception", None)
+            if report is not None:
+                report(*sys.exc_info())
+            else:
+                traceback.print_exc()
+
+    def _tick(self):
+        self._after = None
+        t0 = now = time.perf_counter()
+        # Frames perdidos: cuánto llegó tarde este tick respecto a lo agendado
+        lost = int((now - self._after_due) * 1000.0 / self.frame_ms)
+        if lost > 0:
+            self.dropped += lost
+        deadline = t0 + self.budget_ms / 1000.0
+
+        # Tweens primero: son los que se ven saltar si no se atienden
+        tweens, self._tweens = self._tweens, []
+        i = 0
+        try:
+            while i < len(tweens):
+                job = tweens[i]
+                i += 1
+                if not job.alive:
+                    continue
+                if time.perf_counter() > deadline and i > 1:
+                    self.deferred += 1
+                    self._tweens.append(job)
+                    continue
+                p = min(1.0, (now - job.start) / job.duration)
+                self._run(job, job.step, job.ease(p))
+                if p >= 1.0 and job.alive:
+                    self.cancel(job)
+                    if job.done is not None:
+                        self._run(job, job.done)
+                elif job.alive:
+                    self._tweens.append(job)
+
+            # Timers vencidos, en orden; al menos uno por frame aunque no haya presupuesto
+            ran = 0
+            while self._timers and self._timers[0].due <= now:
+                if not self._timers[0].alive:
+                    heapq.heappop(self._timers)
+                    continue
+                if ran and time.perf_counter() > deadline:
+                    self.deferred += 1
+                    break
+                job = heapq.heappop(self._timers)
+                self.cancel(job)
+                self._run(job, job.fn)
+                self.callbacks += 1
+                ran += 1
+        finally:
+            # Aunque algo falle a mitad del frame: los tweens sin procesar
+            # siguen vivos y el próximo tick queda agendado
+            self._tweens.extend(j for j in tweens[i:] if j.alive)
+            while self._timers and not self._timers[0].alive:
+                heapq.heappop(self._timers)
+
+            self.frames += 1
+            perf.record("ticker.frame", (time.perf_counter() - t0) * 1000.0)
+            # Un callback que llamó a call_later() ya agendó el próximo tick vía _wake()
+            if (self._tweens or self._timers) and self._after is None:
+                self._schedule(time.perf_counter())
+
+    def stats(self) -> dict:
+        return {
+            "frames": self.frames,
+            "dropped": self.dropped,
+            "deferred": self.deferred,
+            "callbacks": self.callbacks,
+            "pending": self.pending(),
+        }
+
+
+def ticker_for(widget: tk.Misc) -> Ticker:
+    """Ticker de la ventana raíz de `widget` (se crea la primera vez)."""
+    top = widget.winfo_toplevel()
+    t = getattr(top, "ticker", None)
+    if t is None:
+        t = top.ticker = Ticker(top)
+    return t
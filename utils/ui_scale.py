@@ -0,0 +1,109 @@
+# utils/ui_scale.py
+import time
+import tkinter as tk
+
+from utils.perf import perf
+from utils.ticker import ticker_for
+
+# Escalas permitidas: cada tamaño de ventana cae en el bucket más grande que
+# entra en ella (solo reduce, mínimo 60% para legibilidad). Con pocas escalas
+# distintas, S()/F() repiten valores y las claves de cache se reutilizan.
+SCALE_BUCKETS = (0.6, 0.7, 0.8, 0.9, 1.0)
+
+
+def quantise(s: float) -> float:
+    """Bucket más grande <= s (acotado a [0.6, 1.0])."""
+    best = SCALE_BUCKETS[0]
+    for b in SCALE_BUCKETS:
+        if b <= s + 1e-9:
+            best = b
+    return best
+
+
+def scale_for(w: int, h: int, base_w: int, base_h: int) -> float:
+    """ui_scale de una vista de tamaño base (base_w, base_h) en una ventana w x h."""
+    return quantise(min(w / base_w, h / base_h))
+
+
+def neighbours(s: float) -> list[float]:
+    """[s, bucket inferior, bucket superior] (los que existan)."""
+    i = SCALE_BUCKETS.index(quantise(s))
+    return [SCALE_BUCKETS[j] for j in (i, i - 1, i + 1) if 0 <= j < len(SCALE_BUCKETS)]
+
+
+class ScaleWarmer:
+    """
+    Pre-renderiza las primitivas de una vista para su bucket actual y los
+    vecinos, así cruzar a otro bucket al redimensionar no genera imágenes.
+
+    - La vista expone un generador `jobs()` que llama a sus fábricas con
+      self.S()/self.F(); cada `yield` es un paso.
+    - Cada paso corre en un tick del Ticker de la App con self.ui_scale
+      cambiado temporalmente al bucket que se calienta (y restaurado al
+      terminar el paso), así que el generador no toca items del canvas.
+    - Los buckets ya calentados no se repiten; si la vista se oculta el
+      Ticker cancela los pasos pendientes y start() retoma lo que falte.
+    """
+
+    STEP_MS = 1  # entre pasos: deja pasar eventos y redibujos
+
+    def __init__(self, view: tk.Misc, jobs, name: str = "view"):
+        self.view = view
+        self.jobs = jobs
+        self.name = name
+        self.warmed: set[float] = set()
+        self._queue: list[float] = []
+        self._gen = None
+        self._scale = None
+        self._job = None
+        self._ms = 0.0
+
+    def start(self) -> None:
+        """Calienta el bucket actual de la vista y sus vecinos (lo que falte)."""
+        cur = quantise(getattr(self.view, "ui_scale", 1.0))
+        self._queue = [s for s in neighbours(cur) if s not in self.warmed and s != self._scale]
+        if self._gen is None and not self._queue:
+            return
+        self._schedule()
+
+    def cancel(self) -> None:
+        ticker_for(self.view).cancel(self._job)
+        self._job = self._gen = self._scale = None
+        self._queue = []
+
+    def _schedule(self):
+        self._job = ticker_for(self.view).call_later(self.view, self.STEP_MS, self._step, key="prewarm")
+
+    def _step(self):
+        self._job = None
+        if self._gen is None:
+            if not self._queue:
+                return
+            self._scale = self._queue.pop(0)
+            self._gen = self.jobs()
+            self._ms = 0.0
+
+        view = self.view
+        saved = view.ui_scale
+        view.ui_scale = self._scale
+        t0 = time.perf_counter()
+        try:
+            next(self._gen)
+        except StopIteration:
+            self.warmed.add(self._scale)
+            perf.record(f"{self.name}.prewarm", self._ms + (time.perf_counter() - t0) * 1000.0)
+            self._gen = self._scale = None
+        except tk.TclError:
+            self._gen = self._scale = None  # vista destruida
+            return
+        except Exception as e:
+            print(f"Warning: {self.name} prewarm stopped: {e}")
+            self._gen = self._scale = None
+            self._queue = []
+            return
+        finally:
+            view.ui_scale = saved
+        self._ms += (time.perf_counter() - t0) * 1000.0
+
+        if self._gen is not None or self._queue:
+            self._schedule()
@@ -2,10 +2,17 @@
 import time
 import tkinter as tk
 from tkinter import ttk
-from PIL import Image, ImageTk, ImageDraw, ImageFilter, ImageColor
-from pathlib import Path
+from PIL import ImageTk
 
 from utils.resource_path import assets_path
+from utils.asset_cache import load_mipmaps
+from utils.sprite_atlas import atlas_photo
+from utils.render_cache import bar_image, panel_image, panel_photo, round_rect_photo, resize_cache
+from utils.background import BackgroundRenderer
+from utils.frame_scheduler import FrameScheduler
+from utils.perf_overlay import perf_overlay
+from utils.ticker import ticker_for
+from utils.ui_scale import ScaleWarmer, scale_for
 
 
 class CongratulationsView(ttk.Frame):
@@ -97,17 +104,19 @@ class CongratulationsView(ttk.Frame):
         self.canvas.pack(expand=True, fill="both")
 
         bg_path = assets_path("images", "bg.jpg")
-        self._bg_src = Image.open(bg_path).convert("RGB")
-        self._bg_photo = None
+        self._bg_mips = load_mipmaps(bg_path)
         self._bg_item = self.canvas.create_image(0, 0, anchor="nw")
-
-        # caches
-        self._bar_cache = {}
-        self._btn_cache = {}
+        self._bg_renderer = BackgroundRenderer(self.canvas, self._bg_item, self._bg_mips)
+        self._frame = FrameScheduler(
+            self, {"background": self._redraw_background, "body": self._layout_all}, name="congrats"
+        )
+        # Pre-render del bucket de escala actual y vecinos (utils.ui_scale)
+        self._warmer = ScaleWarmer(self, self._iter_warm_jobs, name="congrats")
 
         # header / footer
         self._hdr_img_ref = None
         self._foot_img_ref = None
+        self._bar_cache = resize_cache("congrats.bars")
 
         self._hdr_item = self.canvas.create_image(0, 0, anchor="nw")
         self._hdr_txt  = self.canvas.create_text(
@@ -142,15 +151,12 @@ class CongratulationsView(ttk.Frame):
         self._top_icons_h = self.ICON_H_BASE
 
         # eventos
-        self._resize_after = None
+        self._ticker = ticker_for(self)  # debounce de resize y feedback de click
         self._last_size = (0, 0)
         self.canvas.bind("<Configure>", self._on_resize)
 
         # hotkeys
-        self.canvas.bind_all("<m>", lambda e: (self._play_sfx("toggle"), self._toggle_music()))
-        self.canvas.bind_all("<M>", lambda e: (self._play_sfx("toggle"), self._toggle_music()))
-        self.canvas.bind_all("<s>", lambda e: (self._play_sfx("toggle"), self._toggle_sfx()))
-        self.canvas.bind_all("<S>", lambda e: (self._play_sfx("toggle"), self._toggle_sfx()))
+        self._bind_hotkeys()
 
         self.after(0, self._build)
 
@@ -158,8 +164,7 @@ class CongratulationsView(ttk.Frame):
     def _set_scale_from_canvas(self) -> bool:
         w = max(1, self.canvas.winfo_width())
         h = max(1, self.canvas.winfo_height())
-        s = min(w / self.BASE_W, h / self.BASE_H)
-        s = min(1.0, max(0.6, s))
+        s = scale_for(w, h, self.BASE_W, self.BASE_H)
         changed = abs(self.ui_scale - s) > 0.01
         self.ui_scale = s
         return changed
@@ -170,6 +175,28 @@ class CongratulationsView(ttk.Frame):
     def F(self, pt: int):
         return ("Mikado Ultra", max(8, int(round(pt * self.ui_scale))))
 
+    def _iter_warm_jobs(self):
+        """Primitivas de Congrats a la escala actual; cada yield es un paso (ScaleWarmer)."""
+        w, h, r = self.S(self.BTN_W), self.S(self.BTN_H), self.S(self.BTN_R)
+        self._make_round_img(w, h, r, "#110D2E")
+        self._make_round_img(w, h, r, "#255B88")
+        yield
+
+        # en cualquier bucket la ventana entra S(CARD_W) + margen: mismo ancho que _build_card
+        panel_photo(
+            self.S(self.CARD_W), self.S(self.CARD_H), self.S(self.CARD_R),
+            fill=self.CARD,
+            shadow_color=(0, 0, 0, 90),
+            shadow_offset=(0, self.S(self.SH_OFF)),
+            blur=self.S(self.SH_BLUR),
+        )
+        yield
+
+        color = self._get_title_color()
+        for name in ("music_on", "music_off", "sound_on", "sound_off"):
+            atlas_photo(name, self.S(self.ICON_H_BASE), color)
+        yield
+
     # ----------------- Build -----------------
     def _build(self):
         self._set_scale_from_canvas()
@@ -193,6 +220,7 @@ class CongratulationsView(ttk.Frame):
 
         self._redraw_background()
         self._layout_all()
+        self._warmer.start()
 
     # ----------------- Controller actions -----------------
 
@@ -204,6 +232,46 @@ class CongratulationsView(ttk.Frame):
         if self.controller and hasattr(self.controller, "on_menu"):
             self.controller.on_menu()
 
+    # ----------------- Pool de vistas (App) -----------------
+    def reset(self):
+        """Congrats no guarda estado entre visitas."""
+        for b in (self._btn_levels, self._btn_menu):
+            if isinstance(b, dict):
+                self.canvas.itemconfig(b["img_item"], image=b["img_norm"])
+
+    def on_show(self, state=None):
+        """Se llama al volver a mostrar la vista reutilizada."""
+        self._bind_hotkeys()
+        self._redraw_background()  # no-op si el fondo ya está en calidad final
+        self._sync_audio_icons()
+        self._warmer.start()
+
+    def on_hide(self):
+        self._bg_renderer.cancel()
+        self.canvas.config(cursor="")
+
+    def _bind_hotkeys(self):
+        self.canvas.bind_all("<m>", lambda e: (self._play_sfx("toggle"), self._toggle_music()))
+        self.canvas.bind_all("<M>", lambda e: (self._play_sfx("toggle"), self._toggle_music()))
+        self.canvas.bind_all("<s>", lambda e: (self._play_sfx("toggle"), self._toggle_sfx()))
+        self.canvas.bind_all("<S>", lambda e: (self._play_sfx("toggle"), self._toggle_sfx()))
+        self.canvas.bind_all("<p>", lambda e: perf_overlay.toggle(self.canvas, self._frame.name))
+        self.canvas.bind_all("<P>", lambda e: perf_overlay.toggle(self.canvas, self._frame.name))
+        perf_overlay.attach(self.canvas, self._frame.name)
+
+    def _sync_audio_icons(self):
+        """Re-aplica on/off de los íconos (el mute pudo cambiar en otra vista)."""
+        if self._item_music is not None and self.sound_manager:
+            self.canvas.itemconfig(
+                self._item_music,
+                image=self._img_music_off if self.sound_manager.is_muted() else self._img_music_on
+            )
+        if self._item_sound is not None and self.sfx_manager:
+            self.canvas.itemconfig(
+                self._item_sound,
+                image=self._img_sound_off if self.sfx_manager.is_muted() else self._img_sound_on
+            )
+
     # ----------------- Card + text items -----------------
     def _build_card(self):
         # limpiar anterior
@@ -225,14 +293,13 @@ class CongratulationsView(ttk.Frame):
         # panel
         sh_off = max(0, self.S(self.SH_OFF))
         sh_blur = max(0, self.S(self.SH_BLUR))
-        pil_panel = self._make_panel_img(
+        self._card_img = panel_photo(
             card_w, card_h, card_r,
             fill=self.CARD,
             shadow_color=(0, 0, 0, 90),
             shadow_offset=(0, sh_off),
             blur=sh_blur,
         )
-        self._card_img = ImageTk.PhotoImage(pil_panel)
 
         cx = w // 2
         cy = self.S(self.BAR_H) + (h - self.S(self.BAR_H) - self.S(self.FOOT_H)) // 2
@@ -312,12 +379,9 @@ class CongratulationsView(ttk.Frame):
 
     # ----------------- Resize/Layout -----------------
     def _on_resize(self, _evt=None):
-        if self._resize_after:
-            self.after_cancel(self._resize_after)
-        self._resize_after = self.after(16, self._do_resize)
+        self._ticker.call_later(self, 16, self._do_resize, key="resize")
 
     def _do_resize(self):
-        self._resize_after = None
         w, h = self.canvas.winfo_width(), self.canvas.winfo_height()
         if (w, h) == self._last_size or w < 2 or h < 2:
             return
@@ -335,9 +399,9 @@ class CongratulationsView(ttk.Frame):
                 if isinstance(b, dict):
                     b["w"], b["h"], b["r"] = self.S(self.BTN_W), self.S(self.BTN_H), self.S(self.BTN_R)
                     self._refresh_button_visual(b)
+            self._warmer.start()
 
-        self._redraw_background()
-        self._layout_all()
+        self._frame.mark("background", "body")
 
     def _layout_all(self):
         w, h = self.canvas.winfo_width(), self.canvas.winfo_height()
@@ -348,7 +412,10 @@ class CongratulationsView(ttk.Frame):
         FOOT_H = self.S(self.FOOT_H)
 
         # header
-        hdr_img = ImageTk.PhotoImage(self._make_bar_img(w, BAR_H, self.TOPBAR, 230))
+        hdr_img = self._bar_cache.get_or_create(
+            (w, BAR_H, self.TOPBAR, 230),
+            lambda: ImageTk.PhotoImage(self._make_bar_img(w, BAR_H, self.TOPBAR, 230))
+        )
         self.canvas.itemconfig(self._hdr_item, image=hdr_img)
         self._hdr_img_ref = hdr_img
         self.canvas.coords(self._hdr_item, 0, 0)
@@ -357,7 +424,10 @@ class CongratulationsView(ttk.Frame):
         self.canvas.coords(self._hdr_txt, w // 2, BAR_H // 2)
 
         # footer
-        foot_img = ImageTk.PhotoImage(self._make_bar_img(w, FOOT_H, self.TOPBAR, 160))
+        foot_img = self._bar_cache.get_or_create(
+            (w, FOOT_H, self.TOPBAR, 160),
+            lambda: ImageTk.PhotoImage(self._make_bar_img(w, FOOT_H, self.TOPBAR, 160))
+        )
         self.canvas.itemconfig(self._foot_item, image=foot_img)
         self._foot_img_ref = foot_img
         self.canvas.coords(self._foot_item, 0, h)
@@ -398,86 +468,19 @@ class CongratulationsView(ttk.Frame):
 
     # ----------------- Fondo -----------------
     def _redraw_background(self):
-        w, h = self.canvas.winfo_width(), self.canvas.winfo_height()
-        if w < 2 or h < 2:
-            return
-        sw, sh = self._bg_src.size
-        scale = max(w / sw, h / sh)
-        bg = self._bg_src.resize((max(1, int(sw * scale)), max(1, int(sh * scale))), Image.Resampling.LANCZOS)
-        left = (bg.width - w) // 2
-        top = (bg.height - h) // 2
-        bg = bg.crop((left, top, left + w, top + h))
-        self._bg_photo = ImageTk.PhotoImage(bg)
-        self.canvas.itemconfig(self._bg_item, image=self._bg_photo)
-        self.canvas.coords(self._bg_item, 0, 0)
+        # Rápido (mipmap) mientras se arrastra; LANCZOS al asentarse
+        self._bg_renderer.redraw()
 
     # ----------------- PIL helpers -----------------
     def _make_bar_img(self, w, h, color_hex, alpha=160, aa=4):
-        key = ("bar", w, h, color_hex, alpha, aa)
-        if key in self._bar_cache:
-            return self._bar_cache[key].copy()
-
-        color_hex = color_hex.lstrip("#")
-        r = int(color_hex[0:2], 16); g = int(color_hex[2:4], 16); b = int(color_hex[4:6], 16)
-        W, H = max(1, w * aa), max(1, h * aa)
-        img = Image.new("RGBA", (W, H), (r, g, b, alpha))
-        out = img.resize((max(1, w), max(1, h)), Image.Resampling.LANCZOS)
-        self._bar_cache[key] = out.copy()
-        return out
+        return bar_image(w, h, color_hex, alpha)
 
     def _make_panel_img(self, w, h, r, fill="#CCCCCC",
                         shadow_color=(0,0,0,90), shadow_offset=(0,10), blur=4, aa=4):
-        w = max(1, int(w))
-        h = max(1, int(h))
-        r = max(0, int(r))
-
-        aa = max(1, int(aa))
-        ox, oy = shadow_offset
-        ox = int(ox); oy = int(oy)
-
-        W = max(1, w * aa)
-        H = max(1, h * aa)
-        R = max(0, r * aa)
-
-        ox *= aa
-        oy *= aa
-
-        base_w = max(1, W + abs(ox))
-        base_h = max(1, H + abs(oy))
-        base = Image.new("RGBA", (base_w, base_h), (0, 0, 0, 0))
-
-        shadow = Image.new("RGBA", (W, H), (0, 0, 0, 0))
-        d = ImageDraw.Draw(shadow)
-        d.rounded_rectangle([0, 0, W - 1, H - 1], R, fill=shadow_color)
-
-        blur = max(0, int(blur))
-        if blur > 0:
-            shadow = shadow.filter(ImageFilter.GaussianBlur(blur * aa))
-
-        base.alpha_composite(shadow, (max(0, ox), max(0, oy)))
-
-        card = Image.new("RGBA", (W, H), (0, 0, 0, 0))
-        d2 = ImageDraw.Draw(card)
-        d2.rounded_rectangle([0, 0, W - 1, H - 1], R, fill=fill)
-        base.alpha_composite(card, (0, 0))
-
-        out_w = max(1, w + abs(ox) // aa)
-        out_h = max(1, h + abs(oy) // aa)
-        return base.resize((out_w, out_h), Image.Resampling.LANCZOS)
+        return panel_image(w, h, r, fill, shadow_color, shadow_offset, blur, aa)
 
     def _make_round_img(self, w, h, r, fill, aa=4):
-        w = max(1, int(w)); h = max(1, int(h)); r = max(0, int(r)); aa = max(1, int(aa))
-        key = ("round", w, h, r, fill, aa)
-        if key in self._btn_cache:
-            return self._btn_cache[key]
-        W, H, R = w * aa, h * aa, r * aa
-        img = Image.new("RGBA", (max(1, W), max(1, H)), (0, 0, 0, 0))
-        d = ImageDraw.Draw(img)
-        d.rounded_rectangle([0, 0, W - 1, H - 1], R, fill=fill)
-        img = img.resize((w, h), Image.Resampling.LANCZOS)
-        tkimg = ImageTk.PhotoImage(img)
-        self._btn_cache[key] = tkimg
-        return tkimg
+        return round_rect_photo(w, h, r, fill, aa=aa)
 
     # ----------------- Buttons -----------------
     def _create_button_item(self, text, command, width, height, r,
@@ -544,15 +547,6 @@ class CongratulationsView(ttk.Frame):
         except Exception:
             return self.TEXT
 
-    def _tint_rgba(self, img, color_str: str):
-        if img.mode != "RGBA":
-            img = img.convert("RGBA")
-        r, g, b, a = img.split()
-        rgb = ImageColor.getrgb(color_str)
-        colored = Image.new("RGBA", img.size, rgb + (255,))
-        colored.putalpha(a)
-        return colored
-
     def _ensure_icons_scale(self):
         new_h = self.S(self.ICON_H_BASE)
         if self._icons_h_cur != new_h:
@@ -562,32 +556,12 @@ class CongratulationsView(ttk.Frame):
 
     def _load_top_icons(self):
         try:
-            icons_dir = Path(assets_path("icons"))
-            music_on  = Image.open(icons_dir / "music_on.png").convert("RGBA")
-            music_off = Image.open(icons_dir / "music_off.png").convert("RGBA")
-            sound_on  = Image.open(icons_dir / "sound_on.png").convert("RGBA")
-            sound_off = Image.open(icons_dir / "sound_off.png").convert("RGBA")
-
-            def scale_keep_ratio(img, h):
-                h = max(1, int(h))
-                w = max(1, int(img.width * (h / img.height)))
-                return img.resize((w, h), Image.Resampling.LANCZOS)
-
-            music_on  = scale_keep_ratio(music_on,  self._top_icons_h)
-            music_off = scale_keep_ratio(music_off, self._top_icons_h)
-            sound_on  = scale_keep_ratio(sound_on,  self._top_icons_h)
-            sound_off = scale_keep_ratio(sound_off, self._top_icons_h)
-
+            # Atlas compartido: PhotoImages ya escaladas/tintadas por (alto, color)
             color = self._get_title_color()
-            music_on  = self._tint_rgba(music_on,  color)
-            music_off = self._tint_rgba(music_off, color)
-            sound_on  = self._tint_rgba(sound_on,  color)
-            sound_off = self._tint_rgba(sound_off, color)
-
-            self._img_music_on  = ImageTk.PhotoImage(music_on)
-            self._img_music_off = ImageTk.PhotoImage(music_off)
-            self._img_sound_on  = ImageTk.PhotoImage(sound_on)
-            self._img_sound_off = ImageTk.PhotoImage(sound_off)
+            self._img_music_on  = atlas_photo("music_on",  self._top_icons_h, color)
+            self._img_music_off = atlas_photo("music_off", self._top_icons_h, color)
+            self._img_sound_on  = atlas_photo("sound_on",  self._top_icons_h, color)
+            self._img_sound_off = atlas_photo("sound_off", self._top_icons_h, color)
 
             if self._item_music is None:
                 initial = self._img_music_off if (self.sound_manager and self.sound_manager.is_muted()) else self._img_music_on
@@ -2,10 +2,17 @@
 import time
 import tkinter as tk
 from tkinter import ttk
-from PIL import Image, ImageTk, ImageDraw, ImageColor, Image
-from pathlib import Path
+from PIL import ImageTk
 
 from utils.resource_path import assets_path
+from utils.asset_cache import load_mipmaps
+from utils.sprite_atlas import atlas_photo
+from utils.render_cache import bar_image, round_rect_photo, resize_cache
+from utils.background import BackgroundRenderer
+from utils.frame_scheduler import FrameScheduler
+from utils.perf_overlay import perf_overlay
+from utils.ticker import ticker_for
+from utils.ui_scale import ScaleWarmer, scale_for
 
 
 class CreditsView(ttk.Frame):
@@ -118,7 +125,7 @@ class CreditsView(ttk.Frame):
         # ---- escala ----
         self.ui_scale = 1.0
         self._last_size = (0, 0)
-        self._resize_after = None
+        self._ticker = ticker_for(self)  # debounce de resize y feedback de click
 
         # hover sfx
         self._last_hover_ts = 0.0
@@ -129,13 +136,14 @@ class CreditsView(ttk.Frame):
 
         # Fondo
         bg_path = assets_path("images", "bg.jpg")
-        self._bg_src = Image.open(bg_path).convert("RGB")
-        self._bg_photo = None
+        self._bg_mips = load_mipmaps(bg_path, self.BG_OVERLAY_ALPHA)
         self._bg_item = self.canvas.create_image(0, 0, anchor="nw")
-
-        # Caches
-        self._bar_cache = {}
-        self._btn_cache = {}
+        self._bg_renderer = BackgroundRenderer(self.canvas, self._bg_item, self._bg_mips)
+        self._frame = FrameScheduler(
+            self, {"background": self._redraw_background, "body": self._layout_all}, name="credits"
+        )
+        # Pre-render del bucket de escala actual y vecinos (utils.ui_scale)
+        self._warmer = ScaleWarmer(self, self._iter_warm_jobs, name="credits")
 
         # ---- Título del juego (arriba, sin barra) ----
         self._game_title_item = self.canvas.create_text(
@@ -149,6 +157,7 @@ class CreditsView(ttk.Frame):
 
         # Footer
         self._foot_img_ref = None
+        self._bar_cache = resize_cache("credits.bars")
         self._foot_item = self.canvas.create_image(0, 0, anchor="sw")
 
         # Centro: título + 2 columnas
@@ -209,10 +218,7 @@ class CreditsView(ttk.Frame):
         self.canvas.bind("<Configure>", self._on_resize)
 
         # Hotkeys
-        self.canvas.bind_all("<m>", lambda e: (self._play_sfx("toggle"), self._toggle_music()))
-        self.canvas.bind_all("<M>", lambda e: (self._play_sfx("toggle"), self._toggle_music()))
-        self.canvas.bind_all("<s>", lambda e: (self._play_sfx("toggle"), self._toggle_sfx()))
-        self.canvas.bind_all("<S>", lambda e: (self._play_sfx("toggle"), self._toggle_sfx()))
+        self._bind_hotkeys()
 
         self.after(0, self._build)
 
@@ -220,8 +226,7 @@ class CreditsView(ttk.Frame):
     def _set_scale_from_canvas(self) -> bool:
         w = max(1, self.canvas.winfo_width())
         h = max(1, self.canvas.winfo_height())
-        s = min(w / self.BASE_W, h / self.BASE_H)
-        s = min(1.0, max(0.6, s))
+        s = scale_for(w, h, self.BASE_W, self.BASE_H)
         changed = abs(self.ui_scale - s) > 0.01
         self.ui_scale = s
         return changed
@@ -232,6 +237,25 @@ class CreditsView(ttk.Frame):
     def F(self, pt: int):
         return ("Mikado Ultra", max(8, int(round(pt * self.ui_scale))))
 
+    def _iter_warm_jobs(self):
+        """Primitivas de Credits a la escala actual; cada yield es un paso (ScaleWarmer)."""
+        w, h, r = self.S(self.BTN_W), self.S(self.BTN_H), self.S(self.BTN_R)
+        self._make_round_img(w, h, r, "#110D2E")
+        self._make_round_img(w, h, r, "#255B88")
+        yield
+
+        color = self._get_title_color()
+        for name in ("music_on", "music_off", "sound_on", "sound_off"):
+            atlas_photo(name, self.S(self.ICON_H_BASE), color)
+        yield
+
+        logos = (atlas_photo("logo_ucr", self.S(70)),
+                 atlas_photo("logo_tcu_658", self.S(40)),
+                 atlas_photo("logo_escuela", self.S(20)))
+        bar_w, bar_h = self._logo_bar_size([img.width() for img in logos])
+        self._make_round_img(bar_w, bar_h, bar_h // 2, fill="#FFFFFF", aa=4)
+        yield
+
     # ----------------- Build -----------------
     def _build(self):
         self._set_scale_from_canvas()
@@ -248,11 +272,51 @@ class CreditsView(ttk.Frame):
         self._redraw_background()
         self._refresh_center_text()
         self._layout_all()
+        self._warmer.start()
 
     def _on_back(self):
         if self.controller and hasattr(self.controller, "on_menu"):
             self.controller.on_menu()
 
+    # ----------------- Pool de vistas (App) -----------------
+    def reset(self):
+        """Credits no guarda estado entre visitas."""
+        if isinstance(self._btn_back, dict):
+            self.canvas.itemconfig(self._btn_back["img_item"], image=self._btn_back["img_norm"])
+
+    def on_show(self, state=None):
+        """Se llama al volver a mostrar la vista reutilizada."""
+        self._bind_hotkeys()
+        self._redraw_background()  # no-op si el fondo ya está en calidad final
+        self._sync_audio_icons()
+        self._warmer.start()
+
+    def on_hide(self):
+        self._bg_renderer.cancel()
+        self.canvas.config(cursor="")
+
+    def _bind_hotkeys(self):
+        self.canvas.bind_all("<m>", lambda e: (self._play_sfx("toggle"), self._toggle_music()))
+        self.canvas.bind_all("<M>", lambda e: (self._play_sfx("toggle"), self._toggle_music()))
+        self.canvas.bind_all("<s>", lambda e: (self._play_sfx("toggle"), self._toggle_sfx()))
+        self.canvas.bind_all("<S>", lambda e: (self._play_sfx("toggle"), self._toggle_sfx()))
+        self.canvas.bind_all("<p>", lambda e: perf_overlay.toggle(self.canvas, self._frame.name))
+        self.canvas.bind_all("<P>", lambda e: perf_overlay.toggle(self.canvas, self._frame.name))
+        perf_overlay.attach(self.canvas, self._frame.name)
+
+    def _sync_audio_icons(self):
+        """Re-aplica on/off de los íconos (el mute pudo cambiar en otra vista)."""
+        if self._item_music is not None and self.sound_manager:
+            self.canvas.itemconfig(
+                self._item_music,
+                image=self._img_music_off if self.sound_manager.is_muted() else self._img_music_on
+            )
+        if self._item_sound is not None and self.sfx_manager:
+            self.canvas.itemconfig(
+                self._item_sound,
+                image=self._img_sound_off if self.sfx_manager.is_muted() else self._img_sound_on
+            )
+
     # ----------------- Texto (título + columnas) -----------------
     def _refresh_center_text(self):
         w = max(1, self.canvas.winfo_width())
@@ -282,12 +346,9 @@ class CreditsView(ttk.Frame):
 
     # ----------------- Resize/Layout -----------------
     def _on_resize(self, _evt=None):
-        if self._resize_after:
-            self.after_cancel(self._resize_after)
-        self._resize_after = self.after(16, self._do_resize)
+        self._ticker.call_later(self, 16, self._do_resize, key="resize")
 
     def _do_resize(self):
-        self._resize_after = None
         w, h = self.canvas.winfo_width(), self.canvas.winfo_height()
         if w < 2 or h < 2 or (w, h) == self._last_size:
             return
@@ -304,9 +365,9 @@ class CreditsView(ttk.Frame):
                     self.S(self.BTN_W), self.S(self.BTN_H), self.S(self.BTN_R)
                 )
                 self._refresh_button_visual(self._btn_back)
+            self._warmer.start()
 
-        self._redraw_background()
-        self._layout_all()
+        self._frame.mark("background", "body")
 
     def _layout_all(self):
         w, h = self.canvas.winfo_width(), self.canvas.winfo_height()
@@ -316,7 +377,10 @@ class CreditsView(ttk.Frame):
         FOOT_H = self.S(self.FOOT_H)
 
         # Footer bar
-        foot_img = ImageTk.PhotoImage(self._make_bar_img(w, FOOT_H, self.TOPBAR, 160))
+        foot_img = self._bar_cache.get_or_create(
+            (w, FOOT_H, self.TOPBAR, 160),
+            lambda: ImageTk.PhotoImage(self._make_bar_img(w, FOOT_H, self.TOPBAR, 160))
+        )
         self.canvas.itemconfig(self._foot_item, image=foot_img)
         self._foot_img_ref = foot_img
         self.canvas.coords(self._foot_item, 0, h)
@@ -401,57 +465,15 @@ class CreditsView(ttk.Frame):
 
     # ----------------- Fondo (cover + overlay) -----------------
     def _redraw_background(self):
-        w, h = self.canvas.winfo_width(), self.canvas.winfo_height()
-        if w < 2 or h < 2:
-            return
-
-        sw, sh = self._bg_src.size
-        scale = max(w / sw, h / sh)
-
-        bg = self._bg_src.resize((max(1, int(sw * scale)), max(1, int(sh * scale))), Image.Resampling.LANCZOS)
-        left = (bg.width - w) // 2
-        top = (bg.height - h) // 2
-        bg = bg.crop((left, top, left + w, top + h)).convert("RGBA")
-
-        overlay = Image.new("RGBA", bg.size, (0, 0, 0, self.BG_OVERLAY_ALPHA))
-        bg = Image.alpha_composite(bg, overlay)
-
-        self._bg_photo = ImageTk.PhotoImage(bg)
-        self.canvas.itemconfig(self._bg_item, image=self._bg_photo)
-        self.canvas.coords(self._bg_item, 0, 0)
+        # Rápido (mipmap) mientras se arrastra; LANCZOS al asentarse
+        self._bg_renderer.redraw()
 
     # ----------------- PIL helpers -----------------
     def _make_bar_img(self, w, h, color_hex, alpha=160, aa=4):
-        key = ("bar", w, h, color_hex, alpha, aa)
-        if key in self._bar_cache:
-            return self._bar_cache[key].copy()
-
-        color_hex = color_hex.lstrip("#")
-        r = int(color_hex[0:2], 16)
-        g = int(color_hex[2:4], 16)
-        b = int(color_hex[4:6], 16)
-        W, H = max(1, w * aa), max(1, h * aa)
-        img = Image.new("RGBA", (W, H), (r, g, b, alpha))
-        out = img.resize((max(1, w), max(1, h)), Image.Resampling.LANCZOS)
-        self._bar_cache[key] = out.copy()
-        return out
+        return bar_image(w, h, color_hex, alpha)
 
     def _make_round_img(self, w, h, r, fill, aa=4):
-        w = max(1, int(w))
-        h = max(1, int(h))
-        r = max(0, int(r))
-        aa = max(1, int(aa))
-        key = ("round", w, h, r, fill, aa)
-        if key in self._btn_cache:
-            return self._btn_cache[key]
-        W, H, R = w * aa, h * aa, r * aa
-        img = Image.new("RGBA", (max(1, W), max(1, H)), (0, 0, 0, 0))
-        d = ImageDraw.Draw(img)
-        d.rounded_rectangle([0, 0, W - 1, H - 1], R, fill=fill)
-        img = img.resize((w, h), Image.Resampling.LANCZOS)
-        tkimg = ImageTk.PhotoImage(img)
-        self._btn_cache[key] = tkimg
-        return tkimg
+        return round_rect_photo(w, h, r, fill, aa=aa)
 
     # ----------------- Buttons -----------------
     def _create_button_item(self, text, command, width, height, r,
@@ -517,15 +539,6 @@ class CreditsView(ttk.Frame):
         except Exception:
             return self.TEXT
 
-    def _tint_rgba(self, img, color_str: str):
-        if img.mode != "RGBA":
-            img = img.convert("RGBA")
-        r, g, b, a = img.split()
-        rgb = ImageColor.getrgb(color_str)
-        colored = Image.new("RGBA", img.size, rgb + (255,))
-        colored.putalpha(a)
-        return colored
-
     def _ensure_icons_scale(self):
         new_h = self.S(self.ICON_H_BASE)
         if self._icons_h_cur == new_h and self._item_music is not None and self._item_sound is not None:
@@ -535,32 +548,12 @@ class CreditsView(ttk.Frame):
 
     def _load_icons(self):
         try:
-            icons_dir = Path(assets_path("icons"))
-            music_on = Image.open(icons_dir / "music_on.png").convert("RGBA")
-            music_off = Image.open(icons_dir / "music_off.png").convert("RGBA")
-            sound_on = Image.open(icons_dir / "sound_on.png").convert("RGBA")
-            sound_off = Image.open(icons_dir / "sound_off.png").convert("RGBA")
-
-            def scale_keep_ratio(img, h):
-                h = max(1, int(h))
-                w = max(1, int(img.width * (h / img.height)))
-                return img.resize((w, h), Image.Resampling.LANCZOS)
-
-            music_on = scale_keep_ratio(music_on, self._icons_h_cur)
-            music_off = scale_keep_ratio(music_off, self._icons_h_cur)
-            sound_on = scale_keep_ratio(sound_on, self._icons_h_cur)
-            sound_off = scale_keep_ratio(sound_off, self._icons_h_cur)
-
+            # Atlas compartido: PhotoImages ya escaladas/tintadas por (alto, color)
             color = self._get_title_color()
-            music_on = self._tint_rgba(music_on, color)
-            music_off = self._tint_rgba(music_off, color)
-            sound_on = self._tint_rgba(sound_on, color)
-            sound_off = self._tint_rgba(sound_off, color)
-
-            self._img_music_on = ImageTk.PhotoImage(music_on)
-            self._img_music_off = ImageTk.PhotoImage(music_off)
-            self._img_sound_on = ImageTk.PhotoImage(sound_on)
-            self._img_sound_off = ImageTk.PhotoImage(sound_off)
+            self._img_music_on  = atlas_photo("music_on",  self._icons_h_cur, color)
+            self._img_music_off = atlas_photo("music_off", self._icons_h_cur, color)
+            self._img_sound_on  = atlas_photo("sound_on",  self._icons_h_cur, color)
+            self._img_sound_off = atlas_photo("sound_off", self._icons_h_cur, color)
 
             if self._item_music is None:
                 initial = self._img_music_off if (self.sound_manager and self.sound_manager.is_muted()) else self._img_music_on
@@ -643,35 +636,16 @@ class CreditsView(ttk.Frame):
         self._logos_sig_cur = sig
 
         try:
-            logos_dir = Path(assets_path("logos"))
-            logo1 = Image.open(logos_dir / "logo_ucr.png").convert("RGBA")
-            logo2 = Image.open(logos_dir / "logo_tcu_658.png").convert("RGBA")
-            logo3 = Image.open(logos_dir / "logo_escuela.png").convert("RGBA")
-
-            def scale(img, h):
-                w = int(img.width * (h / img.height))
-                return img.resize((w, h), Image.Resampling.LANCZOS)
-
-            logo1 = scale(logo1, h1)
-            logo2 = scale(logo2, h2)
-            logo3 = scale(logo3, h3)
-
-            self._img_logo1_bar = ImageTk.PhotoImage(logo1)
-            self._img_logo2_bar = ImageTk.PhotoImage(logo2)
-            self._img_logo3_bar = ImageTk.PhotoImage(logo3)
+            self._img_logo1_bar = atlas_photo("logo_ucr", h1)
+            self._img_logo2_bar = atlas_photo("logo_tcu_658", h2)
+            self._img_logo3_bar = atlas_photo("logo_escuela", h3)
 
             left_pad = self.S(18)
-            right_pad = self.S(18)
             top_pad = self.S(10)
-            bottom_pad = self.S(10)
             gap = self.S(22)
 
-            widths = [logo1.width, logo2.width, logo3.width]
-            logos_total_w = sum(widths) + gap * 2
-
-            # === EXACTO: “tamaño extra” intencional ===
-            bar_w = left_pad + logos_total_w + right_pad + self.S(70)
-            bar_h = top_pad + h3 + bottom_pad + self.S(20)
+            widths = [self._img_logo1_bar.width(), self._img_logo2_bar.width(), self._img_logo3_bar.width()]
+            bar_w, bar_h = self._logo_bar_size(widths)
             radius = bar_h // 2
 
             bg_img = self._make_round_img(bar_w, bar_h, radius, fill="#FFFFFF", aa=4)
@@ -704,6 +678,14 @@ class CreditsView(ttk.Frame):
             print("[CreditsView] No se pudo crear la barra de logos:", e)
             self._logo_bar_cfg = None
 
+    def _logo_bar_size(self, widths) -> tuple[int, int]:
+        """(bar_w, bar_h) de la pastilla para logos de anchos `widths`."""
+        logos_total_w = sum(widths) + self.S(22) * 2
+        # === EXACTO: “tamaño extra” intencional ===
+        bar_w = self.S(18) + logos_total_w + self.S(18) + self.S(70)
+        bar_h = self.S(10) + self.S(20) + self.S(10) + self.S(20)
+        return bar_w, bar_h
+
     def _place_top_left_logobar(self, w: int, h: int):
         """
         Posiciona la barra de logos igual que MenuView:
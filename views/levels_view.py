@@ -1,12 +1,22 @@
 # views/levels_view.py — Mapa de niveles en Canvas + iconos música/sonido (abajo-izquierda) + Header escalable
+import json
 import math
 import os
 import time
 import tkinter as tk
 from tkinter import ttk
-from PIL import Image, ImageTk, ImageDraw, ImageFilter, ImageColor
-from pathlib import Path
-from utils.resource_path import resource_path, assets_path  # <<< CLAVE
+from PIL import Image, ImageTk
+from utils.resource_path import resource_path  # <<< CLAVE
+from utils.asset_cache import load_mipmaps
+from utils.sprite_atlas import atlas_photo
+from utils.render_cache import round_rect_photo, token_photo, resize_cache
+from utils.background import BackgroundRenderer
+from utils.frame_scheduler import FrameScheduler
+from utils.perf_overlay import perf_overlay
+from utils.ticker import ticker_for
+from utils.ui_scale import ScaleWarmer, scale_for
+from utils.mipmap import build_mipmaps
+from utils.path_index import resample_path
 
 
 class LevelsView(ttk.Frame):
@@ -55,13 +65,24 @@ class LevelsView(ttk.Frame):
 
     PATH_POLY = [(0.20, 0.82), (0.35, 0.70), (0.50, 0.60), (0.62, 0.50), (0.74, 0.38), (0.86, 0.22)]
 
+    # Mapa con scroll (más niveles que NODE_POS): cada "página" (alto del
+    # área visible) recorre PATH_POLY, espejada en x en páginas impares.
+    LEVELS_PER_PAGE = 8
+    SCROLL_STEP     = 0.15   # páginas por paso de rueda / flecha
+    CLICK_SLOP      = 5      # px: más movimiento que esto y el click es un arrastre
+
+    # Polilínea opcional de diseñador para todo el mapa: {"points": [[x, y], ...]}
+    # con x relativo al ancho e y en páginas (0..1 = primera pantalla, valores
+    # negativos más arriba). El nivel 1 va en el primer punto.
+    MAP_PATH = "data/level_map.json"
+
     # Iconos música/sonido (base)
     TOP_ICONS_H_BASE   = 28
     TOP_ICONS_GAP_BASE = 10
     TOP_ICONS_PAD_BASE = 12
 
     def __init__(self, parent, controller, progress_model, total_levels, switch_view, bg_path=None,
-                 sound_manager=None, sfx_manager=None):
+                 sound_manager=None, sfx_manager=None, map_path=None):
         super().__init__(parent)
         self.controller  = controller
         self.progress    = progress_model
@@ -83,28 +104,43 @@ class LevelsView(ttk.Frame):
         self._last_hover_ts = 0.0
 
         # Debounce resize
-        self._resize_after = None
+        self._ticker = ticker_for(self)  # debounce de resize y feedback de click
 
         # Canvas + fondo
         self.canvas = tk.Canvas(self, bd=0, highlightthickness=0)
         self.canvas.pack(expand=True, fill="both")
-        self._bg_src   = self._load_bg(self.bg_path)
-        self._bg_photo = None
+        self._bg_mips  = self._load_bg(self.bg_path)
         self._bg_item  = self.canvas.create_image(0, 0, anchor="nw")
+        self._bg_renderer = BackgroundRenderer(self.canvas, self._bg_item, self._bg_mips)
+        self._frame = FrameScheduler(self, {
+            "background": self._redraw_background,
+            "header": self._layout_chrome,
+            "body": self._layout_nodes,
+        }, name="levels")
+        # Pre-render del bucket de escala actual y vecinos (utils.ui_scale)
+        self._warmer = ScaleWarmer(self, self._iter_warm_jobs, name="levels")
 
         # Header
         self._hdr_item  = self.canvas.create_image(0, 0, anchor="nw")
         self._title_txt = self.canvas.create_text(
             0, 0, text="Select Level", fill=self.TEXT, font=("Mikado Ultra", 32), anchor="center"
         )
-        self._hdr_cache = {}
+        self._hdr_cache = resize_cache("levels.header")
 
         # Botón Back
         self._back_btn = None
 
-        # Nodos
+        # Nodos: solo existen items para los niveles visibles (self.nodes);
+        # los slots que salen del viewport se reciclan (self._free_slots)
         self.nodes = []
-        self._img_cache = {}  # cache de PhotoImage para tokens y rects
+        self._free_slots = []
+        self._node_imgs = None
+        self._map_pts, self._map_buckets = self._load_map_path(resource_path(map_path or self.MAP_PATH))
+        self._page_pts = self._page_points() if self._paged() and not self._map_pts else []
+        self._scroll = 0.0          # y de mundo (en páginas) del borde superior
+        self._focus_level = None
+        self._drag = None
+        self._pressed = None  # nodo bajo el botón hasta soltar (o hasta arrastrar)
 
         # Iconos música/SFX (abajo-izquierda)
         self._img_music_on  = None
@@ -118,12 +154,15 @@ class LevelsView(ttk.Frame):
         # Events
         self.canvas.bind("<Configure>", self._on_resize)
         self.canvas.bind("<Button-3>", self._print_norm_xy)
+        self.canvas.bind("<MouseWheel>", self._on_wheel)
+        self.canvas.bind("<Button-4>", lambda e: self._scroll_by(-self.SCROLL_STEP))
+        self.canvas.bind("<Button-5>", lambda e: self._scroll_by(self.SCROLL_STEP))
+        self.canvas.bind("<ButtonPress-1>", self._on_drag_start)
+        self.canvas.bind("<B1-Motion>", self._on_drag_move)
+        self.canvas.bind("<ButtonRelease-1>", self._on_drag_end)
 
         # Hotkeys
-        self.canvas.bind_all("<m>", lambda e: (self._play_sfx("toggle"), self._toggle_music()))
-        self.canvas.bind_all("<M>", lambda e: (self._play_sfx("toggle"), self._toggle_music()))
-        self.canvas.bind_all("<s>", lambda e: (self._play_sfx("toggle"), self._toggle_sfx()))
-        self.canvas.bind_all("<S>", lambda e: (self._play_sfx("toggle"), self._toggle_sfx()))
+        self._bind_hotkeys()
 
         # Build inicial (cuando haya tamaño válido)
         self.after(0, self._first_layout)
@@ -137,8 +176,7 @@ class LevelsView(ttk.Frame):
         except Exception:
             w, h = self.BASE_W, self.BASE_H
 
-        s = min(w / self.BASE_W, h / self.BASE_H)
-        s = min(1.0, max(0.6, s))
+        s = scale_for(w, h, self.BASE_W, self.BASE_H)
         changed = abs(s - getattr(self, "ui_scale", 1.0)) > 0.01
         self.ui_scale = s
         return changed
@@ -150,28 +188,90 @@ class LevelsView(ttk.Frame):
         size = max(8, int(round(pt * self.ui_scale)))
         return ("Mikado Ultra", size, "bold") if bold else ("Mikado Ultra", size)
 
+    def _iter_warm_jobs(self):
+        """Primitivas del mapa a la escala actual; cada yield es un paso (ScaleWarmer)."""
+        node_d = self.S(self.NODE_D_BASE)
+        for fill, border in ((self.PRIMARY, self.PRIMARY_BORDER),
+                             (self.PRIMARY_HOVER, self.PRIMARY_BORDER),
+                             (self.LOCK_FILL, self.LOCK_BORDER)):
+            self._token_img(node_d, fill=fill, border=border)
+            yield
+
+        w, h, r = self.S(120), self.S(40), self.S(12)
+        self._rect_img(w, h, r, "#110D2E")
+        self._rect_img(w, h, r, "#255B88")
+        yield
+
+        color = self._get_title_color()
+        for name in ("music_on", "music_off", "sound_on", "sound_off"):
+            atlas_photo(name, self.S(self.TOP_ICONS_H_BASE), color)
+        yield
+
     # ================= API pública =================
     def refresh(self):
-        """Actualiza desbloqueo, estrellas y aspecto (y re-render si la escala cambió)."""
+        """Actualiza desbloqueo, estrellas y aspecto de los nodos visibles."""
+        current = min(self.total, max(1, self.progress.unlocked()))
+        if current != self._focus_level:
+            # Nuevo nivel desbloqueado: centrar el mapa en él
+            self._focus_level = current
+            self.scroll_to_level(current)
+        for nd in self.nodes:
+            self._bind_slot(nd, nd["n"])
+
+    def scroll_to_level(self, n: int):
+        """Deja el nivel `n` centrado verticalmente (dentro del rango válido)."""
+        _x, y = self._node_pos(n)
+        self._set_scroll(y - 0.5)
+
+    # ================= Pool de vistas (App) =================
+    def reset(self):
+        """El mapa no guarda estado propio: el progreso se relee con refresh()."""
         for nd in self.nodes:
-            n = nd["n"]
-            unlocked = n <= self.progress.unlocked()
-            stars = self.progress.stars_for(n)
-            nd["unlocked"] = unlocked
-            nd["stars"] = stars
-
-            # label inferior
-            self.canvas.itemconfigure(
-                nd["label_item"],
-                text=("★" * stars + "☆" * (3 - stars)) if unlocked else ""
+            self._apply_node_visual(nd, hover=False)
+        if self._back_btn:
+            # el feedback de click se cancela al ocultar la vista
+            self.canvas.itemconfig(self._back_btn["img_item"], image=self._back_btn["img_norm"])
+
+    def on_show(self, state=None):
+        """Se llama al volver a mostrar la vista reutilizada."""
+        self._bind_hotkeys()
+        self._redraw_background()  # no-op si el fondo ya está en calidad final
+        self._sync_audio_icons()
+        self._warmer.start()
+
+    def on_hide(self):
+        self._bg_renderer.cancel()
+        self.canvas.config(cursor="")
+        self._drag = self._pressed = None
+        # Las flechas/RePág/AvPág son globales: no deben seguir activas en otras vistas
+        for seq in ("<Up>", "<Down>", "<Prior>", "<Next>"):
+            self.canvas.unbind_all(seq)
+
+    def _bind_hotkeys(self):
+        self.canvas.bind_all("<m>", lambda e: (self._play_sfx("toggle"), self._toggle_music()))
+        self.canvas.bind_all("<M>", lambda e: (self._play_sfx("toggle"), self._toggle_music()))
+        self.canvas.bind_all("<s>", lambda e: (self._play_sfx("toggle"), self._toggle_sfx()))
+        self.canvas.bind_all("<S>", lambda e: (self._play_sfx("toggle"), self._toggle_sfx()))
+        self.canvas.bind_all("<p>", lambda e: perf_overlay.toggle(self.canvas, self._frame.name))
+        self.canvas.bind_all("<P>", lambda e: perf_overlay.toggle(self.canvas, self._frame.name))
+        self.canvas.bind_all("<Up>",    lambda e: self._scroll_by(-self.SCROLL_STEP))
+        self.canvas.bind_all("<Down>",  lambda e: self._scroll_by(self.SCROLL_STEP))
+        self.canvas.bind_all("<Prior>", lambda e: self._scroll_by(-1.0))
+        self.canvas.bind_all("<Next>",  lambda e: self._scroll_by(1.0))
+        perf_overlay.attach(self.canvas, self._frame.name)
+
+    def _sync_audio_icons(self):
+        """Re-aplica on/off de los íconos (el mute pudo cambiar en otra vista)."""
+        if self._item_music is not None and self.sound_manager:
+            self.canvas.itemconfig(
+                self._item_music,
+                image=self._img_music_off if self.sound_manager.is_muted() else self._img_music_on
             )
-            # centro
-            self.canvas.itemconfigure(
-                nd["num_item"],
-                text=(str(n) if unlocked else "🔒"),
-                font=self.F(20, bold=True) if unlocked else self.F(18, bold=False)
+        if self._item_sound is not None and self.sfx_manager:
+            self.canvas.itemconfig(
+                self._item_sound,
+                image=self._img_sound_off if self.sfx_manager.is_muted() else self._img_sound_on
             )
-            self._apply_node_visual(nd, hover=False)
 
     # ================= Build =================
     def _first_layout(self):
@@ -180,7 +280,9 @@ class LevelsView(ttk.Frame):
         self._build_header()
         self._build_nodes()
         self._redraw_background()
+        self.refresh()
         self._layout_all()
+        self._warmer.start()
 
     def _build_header(self):
         # Back escalable: si ya existe y cambia escala, reconstruimos
@@ -195,104 +297,229 @@ class LevelsView(ttk.Frame):
             self._update_rect_button(self._back_btn, self.S(120), self.S(40), self.S(12))
 
     def _build_nodes(self):
-        """(Re)construye nodos al tamaño actual."""
-        # Borra nodos previos
+        """
+        Prepara los nodos a la escala actual. No crea items: los slots se
+        crean (o reciclan) en _layout_nodes solo para los niveles visibles,
+        así el costo no depende de total_levels.
+        """
+        node_d = self.S(self.NODE_D_BASE)
+        self._node_imgs = (
+            self._token_img(node_d, fill=self.PRIMARY,       border=self.PRIMARY_BORDER),
+            self._token_img(node_d, fill=self.PRIMARY_HOVER, border=self.PRIMARY_BORDER),
+            self._token_img(node_d, fill=self.LOCK_FILL,     border=self.LOCK_BORDER),
+        )
+
+        # Slots visibles: re-aplicar imágenes y fuentes a la nueva escala
         for nd in self.nodes:
-            for k in ("img_item", "num_item", "label_item"):
-                try:
-                    self.canvas.delete(nd[k])
-                except Exception:
-                    pass
-        self.nodes.clear()
-
-        # Posiciones
-        if len(self.NODE_POS) >= self.total:
-            pts = self.NODE_POS[:self.total]
+            self._bind_slot(nd, nd["n"])
+
+    def _page_points(self):
+        """
+        Posiciones de LEVELS_PER_PAGE niveles en una página: PATH_POLY
+        estirado en y para ocupar exactamente una página, de modo que el
+        último tramo empalma con el primero de la página siguiente.
+        """
+        y0, y1 = self.PATH_POLY[0][1], self.PATH_POLY[-1][1]
+        span = (y0 - y1) or 1.0
+        poly = [(x, y0 - (y0 - y) / span) for x, y in self.PATH_POLY]
+        return self._resample_path(poly, self.LEVELS_PER_PAGE + 1)[:-1]
+
+    def _load_map_path(self, path):
+        """
+        Lee la polilínea de diseñador (si existe) y la muestrea para todos los
+        niveles. Devuelve (posiciones, {página: [niveles]}) o ([], {}).
+        """
+        if not os.path.exists(path) or not self._paged():
+            return [], {}
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                poly = [(float(x), float(y)) for x, y in json.load(f)["points"]]
+        except Exception as e:
+            print(f"[LevelsView] Error leyendo {path}. Se usa el mapa por páginas. Detalle: {e}")
+            return [], {}
+        if len(poly) < 2:
+            return [], {}
+
+        pts = self._resample_path(poly, self.total)
+        buckets = {}
+        for n, (_x, y) in enumerate(pts, start=1):
+            buckets.setdefault(math.floor(y), []).append(n)
+        return pts, buckets
+
+    def _paged(self) -> bool:
+        return self.total > len(self.NODE_POS)
+
+    def _node_pos(self, n: int):
+        """(x_rel, y) del nivel n; y en páginas (crece hacia abajo, nivel 1 abajo)."""
+        if not self._paged():
+            return self.NODE_POS[n - 1]
+        if self._map_pts:
+            return self._map_pts[n - 1]
+        page, j = divmod(n - 1, self.LEVELS_PER_PAGE)
+        x, y = self._page_pts[j]
+        return (x if page % 2 == 0 else 1.0 - x), y - page
+
+    def _scroll_range(self):
+        """(min, max) del scroll; (0, 0) si todo entra en una pantalla."""
+        if not self._paged():
+            return 0.0, 0.0
+        if self._map_buckets:
+            lo_page, hi_page = min(self._map_buckets), max(self._map_buckets)
+            return min(0.0, lo_page - self.SCROLL_STEP), max(0.0, hi_page + self.SCROLL_STEP)
+        top_y = self._node_pos(self.total)[1]
+        return min(0.0, top_y - self.SCROLL_STEP), 0.0
+
+    def _visible_levels(self, top: float, margin: float):
+        """Niveles cuyo centro cae en [top - margin, top + 1 + margin]."""
+        lo, hi = top - margin, top + 1.0 + margin
+        if not self._paged():
+            cands = range(1, self.total + 1)
+        elif self._map_buckets:
+            # Polilínea libre: niveles agrupados por franja entera de y
+            cands = [n for p in range(math.floor(lo), math.floor(hi) + 1)
+                     for n in self._map_buckets.get(p, ())]
         else:
-            pts = self._resample_path(self.PATH_POLY, self.total)
-
-        # Medidas escaladas
-        node_d = self.S(self.NODE_D_BASE)
+            # La página p es una franja de alto 1 justo arriba de y = 1 - p:
+            # solo hay que mirar las 2-3 páginas que cortan el viewport
+            p0 = max(0, int(math.floor(-hi)))
+            p1 = min((self.total - 1) // self.LEVELS_PER_PAGE, int(math.ceil(-lo)) + 1)
+            cands = range(p0 * self.LEVELS_PER_PAGE + 1,
+                          min(self.total, (p1 + 1) * self.LEVELS_PER_PAGE) + 1)
+        for n in cands:
+            if lo <= self._node_pos(n)[1] <= hi:
+                yield n
+
+    # ---------- Slots reciclables ----------
+    def _take_slot(self):
+        if self._free_slots:
+            return self._free_slots.pop()
+
+        img_item = self.canvas.create_image(0, 0, anchor="center")
+        num_item = self.canvas.create_text(0, 0, text="", fill="#ffffff", anchor="center")
+        label_item = self.canvas.create_text(0, 0, text="", fill="#ffffff", anchor="n")
+        nd = {
+            "n": None, "pos": None, "unlocked": False, "stars": 0,
+            "img_item": img_item, "num_item": num_item, "label_item": label_item,
+            "img_norm": None, "img_hover": None, "img_lock": None,
+        }
+        # Bajo el header: al hacer scroll los nodos pasan por detrás de la barra
+        for tag in (img_item, num_item, label_item):
+            self.canvas.tag_lower(tag, self._hdr_item)
+            self.canvas.tag_bind(tag, "<Enter>",    lambda e, nd=nd: self._on_node_hover(nd))
+            self.canvas.tag_bind(tag, "<Leave>",    lambda e, nd=nd: self._on_node_leave(nd))
+            # El nivel se abre al soltar (_on_drag_end): arrastrar desde un nodo es scroll
+            self.canvas.tag_bind(tag, "<Button-1>", lambda e, nd=nd: self._on_node_press(nd))
+        return nd
+
+    def _bind_slot(self, nd, n: int):
+        """Asigna el nivel `n` al slot: progreso, textos, fuentes e imagen."""
+        unlocked = n <= self.progress.unlocked()
+        stars = self.progress.stars_for(n)
+        nd["n"], nd["pos"] = n, self._node_pos(n)
+        nd["unlocked"], nd["stars"] = unlocked, stars
+        nd["img_norm"], nd["img_hover"], nd["img_lock"] = self._node_imgs
+
+        self.canvas.itemconfigure(
+            nd["num_item"], state="normal",
+            text=(str(n) if unlocked else "🔒"),
+            font=self.F(20, bold=True) if unlocked else self.F(18, bold=False)
+        )
+        self.canvas.itemconfigure(
+            nd["label_item"], state="normal",
+            text=("★" * stars + "☆" * (3 - stars)) if unlocked else "",
+            font=self.F(12, bold=False)
+        )
+        self.canvas.itemconfigure(nd["img_item"], state="normal")
+        self._apply_node_visual(nd, hover=False)
 
-        for i in range(self.total):
-            n = i + 1
-            unlocked = n <= self.progress.unlocked()
-            stars = self.progress.stars_for(n)
+    def _release_slot(self, nd):
+        for k in ("img_item", "num_item", "label_item"):
+            self.canvas.itemconfigure(nd[k], state="hidden")
+        nd["n"] = None
+        self._free_slots.append(nd)
 
-            img_norm  = self._token_img(node_d, fill=self.PRIMARY,       border=self.PRIMARY_BORDER)
-            img_hover = self._token_img(node_d, fill=self.PRIMARY_HOVER, border=self.PRIMARY_BORDER)
-            img_lock  = self._token_img(node_d, fill=self.LOCK_FILL,     border=self.LOCK_BORDER)
+    # ---------- Scroll ----------
+    def _set_scroll(self, top: float):
+        lo, hi = self._scroll_range()
+        top = min(hi, max(lo, top))
+        if top != self._scroll:
+            self._scroll = top
+            self._frame.mark("body")
 
-            img_item = self.canvas.create_image(0, 0, image=img_norm, anchor="center")
+    def _scroll_by(self, pages: float):
+        self._set_scroll(self._scroll + pages)
 
-            center_text = str(n) if unlocked else "🔒"
-            center_font = self.F(20, bold=True) if unlocked else self.F(18, bold=False)
-            num_item = self.canvas.create_text(0, 0, text=center_text, fill="#ffffff",
-                                               font=center_font, anchor="center")
+    def _on_wheel(self, e):
+        # Windows: múltiplos de 120; macOS: deltas chicos. Solo importa el signo.
+        if e.delta:
+            self._scroll_by(-self.SCROLL_STEP if e.delta > 0 else self.SCROLL_STEP)
 
-            label = ("★" * stars + "☆" * (3 - stars)) if unlocked else ""
-            label_item = self.canvas.create_text(0, 0, text=label, fill="#ffffff",
-                                                 font=self.F(12, bold=False), anchor="n")
+    def _on_node_press(self, nd):
+        self._pressed = (nd, nd["n"])
 
-            nd = {
-                "n": n, "pos": pts[i], "unlocked": unlocked, "stars": stars,
-                "img_item": img_item, "num_item": num_item, "label_item": label_item,
-                "img_norm": img_norm, "img_hover": img_hover, "img_lock": img_lock,
-            }
-            self.nodes.append(nd)
+    def _on_drag_start(self, e):
+        self._drag = (e.x, e.y, self._scroll, False)
 
-            # Eventos
-            for tag in (img_item, num_item, label_item):
-                self.canvas.tag_bind(tag, "<Enter>",    lambda e, nd=nd: self._on_node_hover(nd))
-                self.canvas.tag_bind(tag, "<Leave>",    lambda e, nd=nd: self._on_node_leave(nd))
-                self.canvas.tag_bind(tag, "<Button-1>", lambda e, nd=nd: self._on_node_click(nd))
+    def _on_drag_move(self, e):
+        if self._drag is None:
+            return
+        x0, y0, top0, moved = self._drag
+        if not moved:
+            if abs(e.x - x0) <= self.CLICK_SLOP and abs(e.y - y0) <= self.CLICK_SLOP:
+                return
+            # Pasó el umbral: es un arrastre y el click en el nodo se cancela
+            self._drag = (x0, y0, top0, True)
+            self._pressed = None
+        if not self._paged():
+            return
+        page_h = max(1, self.canvas.winfo_height() - self.S(self.BAR_H_BASE))
+        self._set_scroll(top0 - (e.y - y0) / page_h)
 
-        for nd in self.nodes:
-            self._apply_node_visual(nd, hover=False)
+    def _on_drag_end(self, _e=None):
+        pressed, self._pressed, self._drag = self._pressed, None, None
+        # El slot pudo reasignarse a otro nivel mientras el botón estaba abajo
+        if pressed is not None and pressed[0]["n"] == pressed[1]:
+            self._on_node_click(pressed[0])
 
     # ================= Layout / Resize =================
     def _on_resize(self, _=None):
-        if self._resize_after:
-            self.after_cancel(self._resize_after)
-        self._resize_after = self.after(16, self._do_resize)
+        self._ticker.call_later(self, 16, self._do_resize, key="resize")
 
     def _do_resize(self):
-        self._resize_after = None
         w, h = self.canvas.winfo_width(), self.canvas.winfo_height()
         if (w, h) == self._last_size or w < 2 or h < 2:
             return
         self._last_size = (w, h)
 
         scale_changed = self._set_scale_from_canvas()
-        self._redraw_background()
-
         # Si cambia escala, hay que re-renderizar assets (header, back, nodos, iconos)
         if scale_changed:
             self._ensure_icons_scaled()
             self._build_header()
             self._build_nodes()
-
-            # Limitar cache si se infla (opcional pero recomendable)
-            if len(self._img_cache) > 800:
-                self._img_cache.clear()
             self._hdr_cache.clear()
+            self._warmer.start()
 
-        self._layout_all()
+        self._frame.mark("background", "header", "body")
 
     def _layout_all(self):
+        self._layout_chrome()
+        self._layout_nodes()
+
+    def _layout_chrome(self):
+        """Header, botón Back e íconos."""
         w, h = self.canvas.winfo_width(), self.canvas.winfo_height()
         if w < 2 or h < 2:
             return
 
         BAR_H  = self.S(self.BAR_H_BASE)
-        NODE_D = self.S(self.NODE_D_BASE)
 
         # Header bar (escalado)
         key = (w, BAR_H, self.TOPBAR, 220)
-        if key not in self._hdr_cache:
-            img = Image.new("RGBA", (w, BAR_H), (*self._hex(self.TOPBAR), 220))
-            self._hdr_cache[key] = ImageTk.PhotoImage(img)
-        self.canvas.itemconfig(self._hdr_item, image=self._hdr_cache[key])
+        hdr_img = self._hdr_cache.get_or_create(
+            key, lambda: ImageTk.PhotoImage(Image.new("RGBA", (w, BAR_H), (*self._hex(self.TOPBAR), 220)))
+        )
+        self.canvas.itemconfig(self._hdr_item, image=hdr_img)
         self.canvas.coords(self._hdr_item, 0, 0)
 
         # Título (fuente escalada)
@@ -305,15 +532,6 @@ class LevelsView(ttk.Frame):
             self.canvas.coords(self._back_btn["img_item"], self.S(12) + self.S(60), BAR_H // 2)
             self.canvas.coords(self._back_btn["txt_item"], self.S(12) + self.S(60), BAR_H // 2)
 
-        # Nodos (posiciones relativas, pero offset header escalado)
-        for nd in self.nodes:
-            x_rel, y_rel = nd["pos"]
-            cx = int(x_rel * w)
-            cy = int(y_rel * max(1, (h - BAR_H))) + BAR_H
-            self.canvas.coords(nd["img_item"], cx, cy)
-            self.canvas.coords(nd["num_item"], cx, cy)
-            self.canvas.coords(nd["label_item"], cx, cy + NODE_D // 2 + self.S(4))
-
         # Iconos música/sonido (escalados)
         self._place_bottom_left_icons(w, h)
         if self._item_music:
@@ -321,6 +539,42 @@ class LevelsView(ttk.Frame):
         if self._item_sound:
             self.canvas.tag_raise(self._item_sound)
 
+    def _layout_nodes(self):
+        """
+        Coloca los nodos visibles según el scroll. Los slots de niveles que
+        salieron del viewport se reciclan para los que entran.
+        """
+        w, h = self.canvas.winfo_width(), self.canvas.winfo_height()
+        if w < 2 or h < 2 or self._node_imgs is None:
+            return
+
+        BAR_H  = self.S(self.BAR_H_BASE)
+        NODE_D = self.S(self.NODE_D_BASE)
+        page_h = max(1, h - BAR_H)
+        top = self._scroll
+        margin = (NODE_D + self.S(24)) / page_h
+
+        by_n = {nd["n"]: nd for nd in self.nodes}
+        visible = []
+        for n in self._visible_levels(top, margin):
+            nd = by_n.pop(n, None)
+            if nd is None:
+                nd = self._take_slot()
+                self._bind_slot(nd, n)
+            visible.append(nd)
+        for nd in by_n.values():
+            self._release_slot(nd)
+        self.nodes = visible
+
+        # Posiciones relativas, con offset de header y scroll
+        for nd in self.nodes:
+            x_rel, y = nd["pos"]
+            cx = int(x_rel * w)
+            cy = int((y - top) * page_h) + BAR_H
+            self.canvas.coords(nd["img_item"], cx, cy)
+            self.canvas.coords(nd["num_item"], cx, cy)
+            self.canvas.coords(nd["label_item"], cx, cy + NODE_D // 2 + self.S(4))
+
     # ================= Interacción =================
     def _apply_node_visual(self, nd, hover=False):
         if nd["unlocked"]:
@@ -347,49 +601,18 @@ class LevelsView(ttk.Frame):
 
     # ================= Fondo / helpers de dibujo =================
     def _load_bg(self, path):
-        return Image.open(path).convert("RGB") if os.path.exists(path) else Image.new("RGB", (1600, 900), (22, 12, 45))
+        if os.path.exists(path):
+            return load_mipmaps(path)
+        return build_mipmaps(Image.new("RGB", (1600, 900), (22, 12, 45)))
 
     def _redraw_background(self):
-        w, h = self.canvas.winfo_width(), self.canvas.winfo_height()
-        if w < 2 or h < 2:
-            return
-        sw, sh = self._bg_src.size
-        scale = max(w / sw, h / sh)
-        bg = self._bg_src.resize((max(1, int(sw * scale)), max(1, int(sh * scale))), Image.Resampling.LANCZOS)
-        left = (bg.width - w) // 2
-        top = (bg.height - h) // 2
-        bg = bg.crop((left, top, left + w, top + h))
-        self._bg_photo = ImageTk.PhotoImage(bg)
-        self.canvas.itemconfig(self._bg_item, image=self._bg_photo)
-        self.canvas.coords(self._bg_item, 0, 0)
+        # Rápido (mipmap) mientras se arrastra; LANCZOS al asentarse
+        self._bg_renderer.redraw()
 
     def _token_img(self, d, fill="#2B6EA6", border="#1F5A86"):
         """Token circular con sombra. d ya viene escalado."""
-        SH_OFF  = self.S(self.SH_OFF_BASE)
-        SH_BLUR = self.S(self.SH_BLUR_BASE)
-
-        key = ("token", d, fill, border, SH_OFF, SH_BLUR)
-        if key in self._img_cache:
-            return self._img_cache[key]
-
-        aa = 4
-        D = d * aa
-        base = Image.new("RGBA", (D, D + SH_OFF * aa), (0, 0, 0, 0))
-
-        # sombra
-        sh = Image.new("RGBA", (D, D), (0, 0, 0, 0))
-        ImageDraw.Draw(sh).ellipse([0, 0, D - 1, D - 1], fill=(0, 0, 0, 120))
-        sh = sh.filter(ImageFilter.GaussianBlur(max(1, SH_BLUR) * aa))
-        base.alpha_composite(sh, (0, (SH_OFF * aa) // 2))
-
-        # círculo
-        border_w = max(1, int(round(8 * aa * self.ui_scale)))
-        ImageDraw.Draw(base).ellipse([0, 0, D - 1, D - 1], fill=fill, outline=border, width=border_w)
-
-        base = base.resize((d, d + SH_OFF), Image.Resampling.LANCZOS)
-        tkimg = ImageTk.PhotoImage(base)
-        self._img_cache[key] = tkimg
-        return tkimg
+        border_w = max(1, int(round(8 * 4 * self.ui_scale)))
+        return token_photo(d, fill, border, self.S(self.SH_OFF_BASE), self.S(self.SH_BLUR_BASE), border_w, aa=4)
 
     def _create_rect_button(self, text, command, width, height, r,
                             color="#110D2E", hover="#255B88", text_color="#CCCCCC"):
@@ -422,7 +645,7 @@ class LevelsView(ttk.Frame):
             self._play_sfx("click")
             try:
                 self.canvas.itemconfig(b["img_item"], image=b["img_hover"])
-                self.after(60, lambda: self.canvas.itemconfig(b["img_item"], image=b["img_norm"]))
+                self._ticker.call_later(self, 60, lambda: self.canvas.itemconfig(b["img_item"], image=b["img_norm"]), key=("click", b["img_item"]))
             except Exception:
                 pass
             if callable(b["cmd"]):
@@ -442,42 +665,11 @@ class LevelsView(ttk.Frame):
         self.canvas.itemconfig(btn["img_item"], image=btn["img_norm"])
 
     def _rect_img(self, w, h, r, fill):
-        key = ("rect", w, h, r, fill)
-        if key in self._img_cache:
-            return self._img_cache[key]
-        aa = 4
-        W, H, R = w * aa, h * aa, r * aa
-        img = Image.new("RGBA", (W, H), (0, 0, 0, 0))
-        ImageDraw.Draw(img).rounded_rectangle([0, 0, W - 1, H - 1], R, fill=fill)
-        img = img.resize((w, h), Image.Resampling.LANCZOS)
-        tkimg = ImageTk.PhotoImage(img)
-        self._img_cache[key] = tkimg
-        return tkimg
+        return round_rect_photo(w, h, r, fill)
 
     def _resample_path(self, poly, n):
-        if not poly:
-            return [(0.5, 0.5)] * n
-        segs = []
-        total = 0.0
-        for i in range(len(poly) - 1):
-            x1, y1 = poly[i]
-            x2, y2 = poly[i + 1]
-            d = math.hypot(x2 - x1, y2 - y1)
-            segs.append((d, (x1, y1), (x2, y2)))
-            total += d
-        if total == 0 or n <= 1:
-            return [poly[0]] * n
-        out = []
-        for k in range(n):
-            t = (k / (n - 1)) * total
-            acc = 0.0
-            for d, (x1, y1), (x2, y2) in segs:
-                if acc + d >= t:
-                    u = (t - acc) / d if d > 0 else 0
-                    out.append((x1 + u * (x2 - x1), y1 + u * (y2 - y1)))
-                    break
-                acc += d
-        return out
+        """n puntos equiespaciados sobre `poly` (índice por longitud + cache)."""
+        return list(resample_path(poly, n))
 
     @staticmethod
     def _hex(hx):
@@ -489,7 +681,7 @@ class LevelsView(ttk.Frame):
         w, h = self.canvas.winfo_width(), self.canvas.winfo_height()
         BAR_H = self.S(self.BAR_H_BASE)
         x_rel = round(e.x / max(1, w), 4)
-        y_rel = round((e.y - BAR_H) / max(1, (h - BAR_H)), 4)
+        y_rel = round((e.y - BAR_H) / max(1, (h - BAR_H)) + self._scroll, 4)
         print(f"click @ ({x_rel}, {y_rel})  # add to NODE_POS")
 
     # ========= Íconos de música/sonido (escalables) =========
@@ -500,15 +692,6 @@ class LevelsView(ttk.Frame):
         except Exception:
             return self.TEXT
 
-    def _tint_rgba(self, img: Image.Image, color_str: str) -> Image.Image:
-        if img.mode != "RGBA":
-            img = img.convert("RGBA")
-        r, g, b, a = img.split()
-        rgb = ImageColor.getrgb(color_str)
-        colored = Image.new("RGBA", img.size, rgb + (255,))
-        colored.putalpha(a)
-        return colored
-
     def _ensure_icons_scaled(self):
         """(Re)carga íconos al cambiar escala."""
         target_h = self.S(self.TOP_ICONS_H_BASE)
@@ -517,31 +700,12 @@ class LevelsView(ttk.Frame):
         self._icons_h_cur = target_h
 
         try:
-            icons_dir = Path(assets_path("icons"))
-            music_on  = Image.open(icons_dir / "music_on.png").convert("RGBA")
-            music_off = Image.open(icons_dir / "music_off.png").convert("RGBA")
-            sound_on  = Image.open(icons_dir / "sound_on.png").convert("RGBA")
-            sound_off = Image.open(icons_dir / "sound_off.png").convert("RGBA")
-
-            def scale_keep_ratio(img, h):
-                w = int(img.width * (h / img.height))
-                return img.resize((w, h), Image.Resampling.LANCZOS)
-
-            music_on  = scale_keep_ratio(music_on,  target_h)
-            music_off = scale_keep_ratio(music_off, target_h)
-            sound_on  = scale_keep_ratio(sound_on,  target_h)
-            sound_off = scale_keep_ratio(sound_off, target_h)
-
+            # Atlas compartido: PhotoImages ya escaladas/tintadas por (alto, color)
             color = self._get_title_color()
-            music_on  = self._tint_rgba(music_on,  color)
-            music_off = self._tint_rgba(music_off, color)
-            sound_on  = self._tint_rgba(sound_on,  color)
-            sound_off = self._tint_rgba(sound_off, color)
-
-            self._img_music_on  = ImageTk.PhotoImage(music_on)
-            self._img_music_off = ImageTk.PhotoImage(music_off)
-            self._img_sound_on  = ImageTk.PhotoImage(sound_on)
-            self._img_sound_off = ImageTk.PhotoImage(sound_off)
+            self._img_music_on  = atlas_photo("music_on",  target_h, color)
+            self._img_music_off = atlas_photo("music_off", target_h, color)
+            self._img_sound_on  = atlas_photo("sound_on",  target_h, color)
+            self._img_sound_off = atlas_photo("sound_off", target_h, color)
 
             initial_music = (self._img_music_off if (self.sound_manager and self.sound_manager.is_muted())
                              else self._img_music_on)
@@ -2,9 +2,15 @@ import time
 import tkinter as tk
 from tkinter import messagebox
 import customtkinter as ctk
-from PIL import Image, ImageTk, ImageDraw, ImageColor
-from pathlib import Path
 from utils.resource_path import resource_path, assets_path
+from utils.asset_cache import load_mipmaps
+from utils.sprite_atlas import atlas_photo
+from utils.render_cache import round_rect_photo
+from utils.background import BackgroundRenderer
+from utils.frame_scheduler import FrameScheduler
+from utils.perf_overlay import perf_overlay
+from utils.ticker import ticker_for
+from utils.ui_scale import ScaleWarmer, scale_for
 
 
 class MenuView(ctk.CTkFrame):
@@ -40,22 +46,22 @@ class MenuView(ctk.CTkFrame):
         self._last_hover_ts = 0.0
 
         # Debounce resize
-        self._resize_after = None
+        self._ticker = ticker_for(self)  # debounce de resize y feedback de click
 
         # Fondo
         bg_path = assets_path("images", "bg.jpg")
-        self._bg_src = Image.open(bg_path).convert("RGB")
-        self._bg_photo = None
+        self._bg_mips = load_mipmaps(bg_path)
 
         # Canvas base
         self.canvas = tk.Canvas(self, bd=0, highlightthickness=0)
         self.canvas.pack(fill="both", expand=True)
         self._bg_item = self.canvas.create_image(0, 0, anchor="nw")
-
-        # Caches
-        self._btn_cache = {}
-        self._icon_cache = {}
-        self._logo_cache = {}
+        self._bg_renderer = BackgroundRenderer(self.canvas, self._bg_item, self._bg_mips)
+        self._frame = FrameScheduler(
+            self, {"background": self._redraw_background, "body": self._layout_all}, name="menu"
+        )
+        # Pre-render del bucket de escala actual y vecinos (utils.ui_scale)
+        self._warmer = ScaleWarmer(self, self._iter_warm_jobs, name="menu")
 
         # Título / subtítulo (items)
         self.title_item = self.canvas.create_text(
@@ -74,30 +80,31 @@ class MenuView(ctk.CTkFrame):
         )
 
 
-        # Botones tipo imagen
+        # Botones tipo imagen (el controller se resuelve al click: App lo
+        # reemplaza al reutilizar la vista del pool)
         self._btns = []
         self._create_canvas_image_button(
             text="Play", dy=120,
-            command=self.controller.on_play,
+            command=lambda: self.controller.on_play(),
             width=320, height=64, r=16,
             color="#2b6ea6", hover="#327fbf",
         )
         self._create_canvas_image_button(
             text="How to Play", dy=195,
-            command=self.controller.on_how_to_play,
+            command=lambda: self.controller.on_how_to_play(),
             width=320, height=64, r=16,
             color="#2b6ea6", hover="#327fbf",
         )
 
         self._create_canvas_image_button(
             text="Credits", dy=270,
-            command=self.controller.on_credits,
+            command=lambda: self.controller.on_credits(),
             width=320, height=64, r=16,
             color="#2b6ea6", hover="#327fbf",
         )
         self._create_canvas_image_button(
             text="Exit", dy=345,
-            command=self.controller.on_exit,
+            command=lambda: self.controller.on_exit(),
             width=320, height=64, r=16,
             color="#2b6ea6", hover="#327fbf",
         )
@@ -125,10 +132,7 @@ class MenuView(ctk.CTkFrame):
 
         # Eventos
         self.canvas.bind("<Configure>", self._on_resize)
-        self.canvas.bind_all("<m>", lambda e: self._toggle_music())
-        self.canvas.bind_all("<M>", lambda e: self._toggle_music())
-        self.canvas.bind_all("<s>", lambda e: self._toggle_sfx())
-        self.canvas.bind_all("<S>", lambda e: self._toggle_sfx())
+        self._bind_hotkeys()
 
         # Primer layout
         self.after(0, self._first_layout)
@@ -142,8 +146,7 @@ class MenuView(ctk.CTkFrame):
         except Exception:
             w, h = self.BASE_W, self.BASE_H
 
-        s = min(w / self.BASE_W, h / self.BASE_H)
-        s = min(1.0, max(0.6, s))
+        s = scale_for(w, h, self.BASE_W, self.BASE_H)
         changed = abs(s - getattr(self, "ui_scale", 1.0)) > 0.01
         self.ui_scale = s
         return changed
@@ -155,6 +158,68 @@ class MenuView(ctk.CTkFrame):
         size = max(8, int(round(pt * self.ui_scale)))
         return ("Mikado Ultra", size, "bold") if bold else ("Mikado Ultra", size)
 
+    def _iter_warm_jobs(self):
+        """Primitivas del menú a la escala actual; cada yield es un paso (ScaleWarmer)."""
+        for b in self._btns:
+            w, h, r = self.S(b["base_w"]), self.S(b["base_h"]), self.S(b["base_r"])
+            outline_w = self.S(b["outline_width"]) if b["outline_width"] else 0
+            self._make_round_img(w, h, r, b["color"], b["outline"], outline_w)
+            self._make_round_img(w, h, r, b["hover"], b["outline"], outline_w)
+            yield
+
+        color = self._get_title_color()
+        for name in ("music_on", "music_off", "sound_on", "sound_off"):
+            atlas_photo(name, self.S(32), color)
+        yield
+
+        logos = (atlas_photo("logo_ucr", self.S(70)),
+                 atlas_photo("logo_tcu_658", self.S(40)),
+                 atlas_photo("logo_escuela", self.S(20)))
+        bar_w, bar_h = self._logo_bar_size([img.width() for img in logos])
+        self._make_round_img(bar_w, bar_h, bar_h // 2, fill="#FFFFFF")
+        yield
+
+    # ===================== Pool de vistas (App) =====================
+    def reset(self):
+        """El menú no guarda estado entre visitas."""
+        for b in self._btns:
+            b["hovering"] = False
+            if b.get("img_norm"):
+                self.canvas.itemconfig(b["img_item"], image=b["img_norm"])
+        self.canvas.config(cursor="")
+
+    def on_show(self, state=None):
+        """Se llama al volver a mostrar la vista reutilizada."""
+        self._bind_hotkeys()
+        self._redraw_background()  # no-op si el fondo ya está en calidad final
+        self._sync_audio_icons()
+        self._warmer.start()
+
+    def on_hide(self):
+        self._bg_renderer.cancel()
+
+    def _bind_hotkeys(self):
+        self.canvas.bind_all("<m>", lambda e: self._toggle_music())
+        self.canvas.bind_all("<M>", lambda e: self._toggle_music())
+        self.canvas.bind_all("<s>", lambda e: self._toggle_sfx())
+        self.canvas.bind_all("<S>", lambda e: self._toggle_sfx())
+        self.canvas.bind_all("<p>", lambda e: perf_overlay.toggle(self.canvas, self._frame.name))
+        self.canvas.bind_all("<P>", lambda e: perf_overlay.toggle(self.canvas, self._frame.name))
+        perf_overlay.attach(self.canvas, self._frame.name)
+
+    def _sync_audio_icons(self):
+        """Re-aplica on/off de los íconos (el mute pudo cambiar en otra vista)."""
+        if self._item_music is not None and self.sound_manager:
+            self.canvas.itemconfig(
+                self._item_music,
+                image=self._img_music_off if self.sound_manager.is_muted() else self._img_music_on
+            )
+        if self._item_sound is not None and self.sfx_manager:
+            self.canvas.itemconfig(
+                self._item_sound,
+                image=self._img_sound_off if self.sfx_manager.is_muted() else self._img_sound_on
+            )
+
     # ===================== Utilidades color/tinte =====================
     def _get_title_color(self) -> str:
         try:
@@ -163,15 +228,6 @@ class MenuView(ctk.CTkFrame):
         except Exception:
             return "white"
 
-    def _tint_rgba(self, img: Image.Image, color_str: str) -> Image.Image:
-        if img.mode != "RGBA":
-            img = img.convert("RGBA")
-        r, g, b, a = img.split()
-        rgb = ImageColor.getrgb(color_str)
-        colored = Image.new("RGBA", img.size, rgb + (255,))
-        colored.putalpha(a)
-        return colored
-
     # ===================== Toggle handlers =====================
     def _toggle_music(self):
         if not self.sound_manager or not self._item_music:
@@ -190,25 +246,7 @@ class MenuView(ctk.CTkFrame):
     # ===================== Botones tipo imagen (con SFX) =====================
     def _make_round_img(self, w: int, h: int, r: int, fill: str,
                         outline: str | None = None, outline_width: int = 0, aa_scale: int = 4):
-        key = ("round", w, h, r, fill, outline, outline_width, aa_scale)
-        if key in self._btn_cache:
-            return self._btn_cache[key]
-
-        W, H, R = w * aa_scale, h * aa_scale, r * aa_scale
-        img = Image.new("RGBA", (W, H), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(img)
-        draw.rounded_rectangle([0, 0, W - 1, H - 1], R, fill=fill)
-        if outline and outline_width > 0:
-            ow = outline_width * aa_scale
-            draw.rounded_rectangle(
-                [ow // 2, ow // 2, W - 1 - ow // 2, H - 1 - ow // 2],
-                R - ow // 2, outline=outline, width=ow
-            )
-
-        img = img.resize((w, h), Image.Resampling.LANCZOS)
-        tkimg = ImageTk.PhotoImage(img)
-        self._btn_cache[key] = tkimg
-        return tkimg
+        return round_rect_photo(w, h, r, fill, outline, outline_width, aa_scale)
 
     def _create_canvas_image_button(
         self, text: str, dy: int, command,
@@ -284,7 +322,7 @@ class MenuView(ctk.CTkFrame):
         try:
             if b.get("img_hover"):
                 self.canvas.itemconfig(b["img_item"], image=b["img_hover"])
-                self.after(60, lambda: self.canvas.itemconfig(b["img_item"], image=b.get("img_norm")))
+                self._ticker.call_later(self, 60, lambda: self.canvas.itemconfig(b["img_item"], image=b.get("img_norm")), key=("click", b["img_item"]))
         except Exception:
             pass
         try:
@@ -319,31 +357,12 @@ class MenuView(ctk.CTkFrame):
         self._icons_h_cur = target_h
 
         try:
-            icons_dir = Path(assets_path("icons"))
-            music_on  = Image.open(icons_dir / "music_on.png").convert("RGBA")
-            music_off = Image.open(icons_dir / "music_off.png").convert("RGBA")
-            sound_on  = Image.open(icons_dir / "sound_on.png").convert("RGBA")
-            sound_off = Image.open(icons_dir / "sound_off.png").convert("RGBA")
-
-            def scale_keep_ratio(img, h):
-                w = int(img.width * (h / img.height))
-                return img.resize((w, h), Image.Resampling.LANCZOS)
-
-            music_on  = scale_keep_ratio(music_on,  target_h)
-            music_off = scale_keep_ratio(music_off, target_h)
-            sound_on  = scale_keep_ratio(sound_on,  target_h)
-            sound_off = scale_keep_ratio(sound_off, target_h)
-
+            # Atlas compartido: PhotoImages ya escaladas/tintadas por (alto, color)
             title_color = self._get_title_color()
-            music_on  = self._tint_rgba(music_on,  title_color)
-            music_off = self._tint_rgba(music_off, title_color)
-            sound_on  = self._tint_rgba(sound_on,  title_color)
-            sound_off = self._tint_rgba(sound_off, title_color)
-
-            self._img_music_on  = ImageTk.PhotoImage(music_on)
-            self._img_music_off = ImageTk.PhotoImage(music_off)
-            self._img_sound_on  = ImageTk.PhotoImage(sound_on)
-            self._img_sound_off = ImageTk.PhotoImage(sound_off)
+            self._img_music_on  = atlas_photo("music_on",  target_h, title_color)
+            self._img_music_off = atlas_photo("music_off", target_h, title_color)
+            self._img_sound_on  = atlas_photo("sound_on",  target_h, title_color)
+            self._img_sound_off = atlas_photo("sound_off", target_h, title_color)
 
             initial_music = (self._img_music_off if (self.sound_manager and self.sound_manager.is_muted())
                              else self._img_music_on)
@@ -415,35 +434,16 @@ class MenuView(ctk.CTkFrame):
         self._logos_sig_cur = sig
 
         try:
-            logos_dir = Path(assets_path("logos"))
-            logo1 = Image.open(logos_dir / "logo_ucr.png").convert("RGBA")
-            logo2 = Image.open(logos_dir / "logo_tcu_658.png").convert("RGBA")
-            logo3 = Image.open(logos_dir / "logo_escuela.png").convert("RGBA")
-
-            def scale(img, h):
-                w = int(img.width * (h / img.height))
-                return img.resize((w, h), Image.Resampling.LANCZOS)
-
-            logo1 = scale(logo1, h1)
-            logo2 = scale(logo2, h2)
-            logo3 = scale(logo3, h3)
-
-            self._img_logo1_bar = ImageTk.PhotoImage(logo1)
-            self._img_logo2_bar = ImageTk.PhotoImage(logo2)
-            self._img_logo3_bar = ImageTk.PhotoImage(logo3)
+            self._img_logo1_bar = atlas_photo("logo_ucr", h1)
+            self._img_logo2_bar = atlas_photo("logo_tcu_658", h2)
+            self._img_logo3_bar = atlas_photo("logo_escuela", h3)
 
             left_pad = self.S(18)
-            right_pad = self.S(18)
             top_pad = self.S(10)
-            bottom_pad = self.S(10)
             gap = self.S(22)
 
-            widths = [logo1.width, logo2.width, logo3.width]
-            logos_total_w = sum(widths) + gap * 2
-
-            # === EXACTO: “tamaño extra” intencional ===
-            bar_w = left_pad + logos_total_w + right_pad + self.S(70)
-            bar_h = top_pad + h3 + bottom_pad + self.S(20)
+            widths = [self._img_logo1_bar.width(), self._img_logo2_bar.width(), self._img_logo3_bar.width()]
+            bar_w, bar_h = self._logo_bar_size(widths)
             radius = bar_h // 2
 
             bg_img = self._make_round_img(bar_w, bar_h, radius, fill="#FFFFFF", outline=None, outline_width=0)
@@ -476,6 +476,14 @@ class MenuView(ctk.CTkFrame):
             print("[MenuView] No se pudo crear la barra de logos:", e)
             self._logo_bar_cfg = None
 
+    def _logo_bar_size(self, widths) -> tuple[int, int]:
+        """(bar_w, bar_h) de la pastilla para logos de anchos `widths`."""
+        logos_total_w = sum(widths) + self.S(22) * 2
+        # === EXACTO: “tamaño extra” intencional ===
+        bar_w = self.S(18) + logos_total_w + self.S(18) + self.S(70)
+        bar_h = self.S(10) + self.S(20) + self.S(10) + self.S(20)
+        return bar_w, bar_h
+
     def _place_top_left_logobar(self, w: int, h: int):
         """
         Posiciona la barra de logos igual que tu versión original:
@@ -524,18 +532,8 @@ class MenuView(ctk.CTkFrame):
 
     # ===================== Background cover =====================
     def _redraw_background(self):
-        w, h = self.canvas.winfo_width(), self.canvas.winfo_height()
-        if w < 2 or h < 2:
-            return
-        src_w, src_h = self._bg_src.size
-        scale = max(w / src_w, h / src_h)
-        bg = self._bg_src.resize((max(1, int(src_w * scale)), max(1, int(src_h * scale))), Image.Resampling.LANCZOS)
-        left = (bg.width - w) // 2
-        top = (bg.height - h) // 2
-        bg = bg.crop((left, top, left + w, top + h))
-        self._bg_photo = ImageTk.PhotoImage(bg)
-        self.canvas.itemconfig(self._bg_item, image=self._bg_photo)
-        self.canvas.coords(self._bg_item, 0, 0)
+        # Rápido (mipmap) mientras se arrastra; LANCZOS al asentarse
+        self._bg_renderer.redraw()
 
     # ===================== Layout / Resize =====================
     def _first_layout(self):
@@ -544,17 +542,12 @@ class MenuView(ctk.CTkFrame):
         self._ensure_logobar_scaled()
         self._refresh_buttons()
         self._layout_all()
+        self._warmer.start()
 
     def _on_resize(self, event=None):
-        if self._resize_after:
-            try:
-                self.after_cancel(self._resize_after)
-            except Exception:
-                pass
-        self._resize_after = self.after(16, self._do_resize)
+        self._ticker.call_later(self, 16, self._do_resize, key="resize")
 
     def _do_resize(self):
-        self._resize_after = None
         w, h = self.canvas.winfo_width(), self.canvas.winfo_height()
         if w < 2 or h < 2:
             return
@@ -563,18 +556,13 @@ class MenuView(ctk.CTkFrame):
         self._last_size = (w, h)
 
         scale_changed = self._set_scale_from_canvas()
-        self._redraw_background()
-
         if scale_changed:
             self._ensure_icons_scaled()
             self._ensure_logobar_scaled()
             self._refresh_buttons()
+            self._warmer.start()
 
-            # opcional: limitar cache si crece demasiado
-            if len(self._btn_cache) > 600:
-                self._btn_cache.clear()
-
-        self._layout_all()
+        self._frame.mark("background", "body")
 
     def _layout_all(self):
         w, h = self.canvas.winfo_width(), self.canvas.winfo_height()
@@ -2,11 +2,19 @@
 import time
 import tkinter as tk
 from tkinter import ttk
-import tkinter.font as tkfont
-from PIL import Image, ImageTk, ImageDraw, ImageFilter, ImageColor
+from PIL import ImageTk
 import math
-from pathlib import Path
 from utils.resource_path import resource_path, assets_path
+from utils.asset_cache import load_mipmaps
+from utils.sprite_atlas import atlas_photo
+from utils.render_cache import bar_image, panel_image, panel_photo, round_rect_photo, resize_cache
+from utils.background import BackgroundRenderer
+from utils.text_fit import TextFitter
+from utils.perf import perf
+from utils.frame_scheduler import FrameScheduler
+from utils.perf_overlay import perf_overlay
+from utils.ticker import ticker_for
+from utils.ui_scale import ScaleWarmer, scale_for
 
 
 class PlayView(ttk.Frame):
@@ -48,6 +56,9 @@ class PlayView(ttk.Frame):
     BTN_SH_BLUR  = 3
     BTN_SH_ALPHA = 90
 
+    BTN_GOOD = "#266e3b"   # respuesta correcta
+    BTN_BAD  = "#7b2a2a"   # respuesta incorrecta
+
     TWO_COL_MIN_W = 2*BTN_W + BTN_GAP_X + 40
     TF_ROW_MIN_W  = 2*BTN_W + BTN_GAP_X + 40
 
@@ -67,6 +78,10 @@ class PlayView(ttk.Frame):
     BTN_MAX_LINES  = 2    # objetivo: 2 líneas (si es imposible, reduce fuente)
     BTN_FONT_PT    = 18   # base
     BTN_FONT_MIN_PT = 11  # mínimo
+    _TEXT_FIT = None      # TextFitter compartido (ver _text_fitter)
+
+    # Reutilizar items de tarjeta/botones entre preguntas (False = recrearlos)
+    RETAIN_ITEMS = True
 
     def __init__(self, parent, controller, switch_view, sound_manager=None, sfx_manager=None):
         super().__init__(parent)
@@ -84,20 +99,17 @@ class PlayView(ttk.Frame):
 
         # Fondo
         bg_path = assets_path("images", "bg.jpg")
-        self._bg_src = Image.open(bg_path).convert("RGB")
-        self._bg_photo = None
+        self._bg_mips = load_mipmaps(bg_path)
 
         self.canvas = tk.Canvas(self, bd=0, highlightthickness=0)
         self.canvas.pack(expand=True, fill="both")
         self._bg_item = self.canvas.create_image(0, 0, anchor="nw")
+        self._bg_renderer = BackgroundRenderer(self.canvas, self._bg_item, self._bg_mips)
 
-        # Caches
-        self._btn_cache   = {}
-        self._panel_cache = {}
-        self._bar_cache   = {}
-        self._hdr_photo_cache = {}
-        self._foot_photo_cache = {}
-        self._card_photo_cache = {}
+        # Caches (las primitivas viven en utils.render_cache, compartidas;
+        # las barras dependen del ancho y van en caches acotadas por bytes)
+        self._hdr_photo_cache = resize_cache("play.header")
+        self._foot_photo_cache = resize_cache("play.footer")
 
         # Header
         self._hdr_img   = None
@@ -127,6 +139,7 @@ class PlayView(ttk.Frame):
         self._question_item = None
         self._q_text = ""
         self._buttons   = []
+        self._btn_pool  = []         # items retenidos (RETAIN_ITEMS)
 
         # Footer
         self._foot_img  = None
@@ -161,9 +174,19 @@ class PlayView(ttk.Frame):
         self._pre_feedback = None
         self._pre_correct = None
 
-        # Redibujo y layout
-        self._resize_after = None
+        # Redibujo y layout: las regiones sucias se redibujan juntas en una
+        # pasada idle por frame (ver _layout_all / FrameScheduler)
+        self._ticker = ticker_for(self)  # debounce de resize y feedback de click
         self._last_size = (0, 0)
+        self._frame = FrameScheduler(self, {
+            "background": self._redraw_background,
+            "header": self._layout_header,
+            "body": self._layout_body_region,
+            "footer": self._layout_footer,
+            "icons": self._layout_icons,
+        }, name="play")
+        # Pre-render del bucket de escala actual y vecinos (utils.ui_scale)
+        self._warmer = ScaleWarmer(self, self._iter_warm_jobs, name="play")
         self.canvas.bind("<Configure>", self._on_resize)
 
         self._ready = False
@@ -176,11 +199,95 @@ class PlayView(ttk.Frame):
 
         self._played_answer_sfx = False
 
+        # Precompute del nivel en idle (ver precompute_level)
+        self._precompute_qs = []
+        self._precompute_jobs = None
+        self._precompute_after = None
+        self._precompute_ms = 0.0
+
         # Atajos de teclado
+        self._bind_hotkeys()
+
+    # ===================== Pool de vistas (App) =====================
+    def reset(self):
+        """
+        Deja la vista como recién creada para reutilizarla con otro nivel:
+        borra cuerpo y pantalla de nivel completado y limpia el estado de
+        pregunta. Fondo, barras e íconos se conservan.
+        """
+        if self._complete_active:
+            for k, item in self._complete.items():
+                if isinstance(item, dict):
+                    self.canvas.delete(item["img_item"]); self.canvas.delete(item["txt_item"])
+                elif item:
+                    self.canvas.delete(item)
+                self._complete[k] = 0
+            self._complete_active = False
+
+        self._clear_body()
+        self._q_text = ""
+
+        for k in ("_back_btn", "_next_btn", "_quit_btn"):
+            btn = getattr(self, k, None)
+            if btn:
+                # state normal y sin el feedback de click (se cancela al ocultar)
+                self.canvas.itemconfigure(btn["img_item"], state="normal", image=btn["img_norm"])
+                self.canvas.itemconfigure(btn["txt_item"], state="normal")
+
+        self._q = None
+        self._idx = 0
+        self._total = 0
+        self._disabled = False
+        self.feedback_text = ""
+        self._last_choice_was_good = None
+        self._user_outcome = None
+        self._answer_locked = False
+        self._answer_idx = None
+        self._review = False
+        self._preselected_index = None
+        self._preselected_tf = None
+        self._pre_feedback = None
+        self._pre_correct = None
+        self._played_answer_sfx = False
+        self._pending_render = None
+        self._next_enabled = False
+        self.cancel_precompute()
+        self._precompute_qs = []
+        self._frame.mark("footer")
+
+    def on_show(self, state=None):
+        """Se llama al volver a mostrar la vista reutilizada."""
+        self._bind_hotkeys()
+        self._redraw_background()  # no-op si el fondo ya está en calidad final
+        self._sync_audio_icons()
+        self._warmer.start()
+
+    def on_hide(self):
+        self._bg_renderer.cancel()
+        self.cancel_precompute()
+        self.canvas.config(cursor="")
+
+    def _bind_hotkeys(self):
         self.canvas.bind_all("<m>", lambda e: (self._play_sfx("toggle"), self._toggle_music()))
         self.canvas.bind_all("<M>", lambda e: (self._play_sfx("toggle"), self._toggle_music()))
         self.canvas.bind_all("<s>", lambda e: (self._play_sfx("toggle"), self._toggle_sfx()))
         self.canvas.bind_all("<S>", lambda e: (self._play_sfx("toggle"), self._toggle_sfx()))
+        self.canvas.bind_all("<p>", lambda e: perf_overlay.toggle(self.canvas, self._frame.name))
+        self.canvas.bind_all("<P>", lambda e: perf_overlay.toggle(self.canvas, self._frame.name))
+        perf_overlay.attach(self.canvas, self._frame.name)
+
+    def _sync_audio_icons(self):
+        """Re-aplica on/off de los íconos (el mute pudo cambiar en otra vista)."""
+        if self._item_music is not None and self.sound_manager:
+            self.canvas.itemconfig(
+                self._item_music,
+                image=self._img_music_off if self.sound_manager.is_muted() else self._img_music_on
+            )
+        if self._item_sound is not None and self.sfx_manager:
+            self.canvas.itemconfig(
+                self._item_sound,
+                image=self._img_sound_off if self.sfx_manager.is_muted() else self._img_sound_on
+            )
 
     # ===================== Escala =====================
     def _set_scale_from_canvas(self):
@@ -190,8 +297,7 @@ class PlayView(ttk.Frame):
             h = max(1, self.canvas.winfo_height())
         except Exception:
             w, h = self.BASE_W, self.BASE_H
-        s = min(w / self.BASE_W, h / self.BASE_H)
-        s = min(1.0, max(0.6, s))  # no bajar de 60% para legibilidad
+        s = scale_for(w, h, self.BASE_W, self.BASE_H)  # bucket; no baja de 60% para legibilidad
         changed = (abs(getattr(self, "ui_scale", 1.0) - s) > 0.01)
         self.ui_scale = s
         return changed
@@ -204,6 +310,31 @@ class PlayView(ttk.Frame):
         """Fuente escalada."""
         return ("Mikado Ultra", max(8, int(round(size * getattr(self, "ui_scale", 1.0)))))
 
+    def _iter_warm_jobs(self):
+        """Primitivas de Play a la escala actual; cada yield es un paso (ScaleWarmer)."""
+        bw, bh, br = self.S(self.BTN_W), self.S(self.BTN_H), self.S(self.BTN_R)
+        for color in ("#110D2E", "#255B88", self.BTN_GOOD, self.BTN_BAD):
+            self._make_button_img(bw, bh, br, color)
+            yield
+
+        # en cualquier bucket la ventana entra S(1000) + margen: mismo ancho que la tarjeta real
+        self._card_photo(self.S(1000))
+        yield
+
+        # Back/Next, Quit y botones de nivel completado
+        for w, h, r in ((self.S(self.NAV_W), self.S(self.NAV_H), self.S(self.NAV_R)),
+                        (self.S(120), self.S(40), self.S(12)),
+                        (self.S(200), self.S(56), self.S(16))):
+            self._make_round_img(w, h, r, "#110D2E")
+            self._make_round_img(w, h, r, "#255B88")
+        self._make_round_img(self.S(self.NAV_W), self.S(self.NAV_H), self.S(self.NAV_R), "#3A365A")
+        yield
+
+        color = self._get_title_color()
+        for name in ("music_on", "music_off", "sound_on", "sound_off"):
+            atlas_photo(name, self.S(28), color)
+        yield
+
     def _ensure_icons_scale(self):
         """Reescala y re-tintea iconos si cambió la escala."""
         base_h = 28
@@ -214,53 +345,24 @@ class PlayView(ttk.Frame):
             self._icons_h_cur = new_h
 
     # ===================== Texto en botones (wrap + autofit) =====================
-    def _wrap_text(self, text: str, max_px: int, font_obj: tkfont.Font) -> list[str]:
-        """Wrap básico por palabras, midiendo en pixeles con tkfont."""
-        words = (text or "").split()
-        if not words:
-            return [""]
-
-        lines = []
-        cur = words[0]
-        for w in words[1:]:
-            candidate = cur + " " + w
-            if font_obj.measure(candidate) <= max_px:
-                cur = candidate
-            else:
-                lines.append(cur)
-                cur = w
-        lines.append(cur)
-        return lines
-
     def _choose_button_font_pt(self, text: str, inner_w: int, inner_h: int) -> int:
         """
         Escoge el tamaño de fuente (en 'pt base') más grande que:
           - permita wrap a <= BTN_MAX_LINES
           - y que el alto total (líneas * linespace) quepa en inner_h
+        Memoizado por (texto, inner_w, inner_h, ui_scale) en utils.text_fit.
         """
-        start_pt = self.BTN_FONT_PT
-        min_pt   = self.BTN_FONT_MIN_PT
-
-        for pt in range(start_pt, min_pt - 1, -1):
-            px_size = max(8, int(round(pt * self.ui_scale)))
-            f = tkfont.Font(family="Mikado Ultra", size=px_size)
-            lines = self._wrap_text(text, inner_w, f)
-            line_h = f.metrics("linespace")
-            total_h = len(lines) * line_h
-            if len(lines) <= self.BTN_MAX_LINES and total_h <= inner_h:
-                return pt
-
-        # si no se logra 2 líneas, prioriza que quepa en altura aunque sean 3 líneas:
-        for pt in range(start_pt, min_pt - 1, -1):
-            px_size = max(8, int(round(pt * self.ui_scale)))
-            f = tkfont.Font(family="Mikado Ultra", size=px_size)
-            lines = self._wrap_text(text, inner_w, f)
-            line_h = f.metrics("linespace")
-            total_h = len(lines) * line_h
-            if total_h <= inner_h:
-                return pt
-
-        return min_pt
+        return self._text_fitter().fit(text, inner_w, inner_h, self.ui_scale)
+
+    @classmethod
+    def _text_fitter(cls) -> TextFitter:
+        # Compartido entre instancias: pool de fuentes + memo sobreviven a la vista
+        if cls._TEXT_FIT is None:
+            cls._TEXT_FIT = TextFitter(
+                family="Mikado Ultra", start_pt=cls.BTN_FONT_PT,
+                min_pt=cls.BTN_FONT_MIN_PT, max_lines=cls.BTN_MAX_LINES, name="play.textfit",
+            )
+        return cls._TEXT_FIT
 
     def _apply_button_text_layout(self, btn: dict):
         """Aplica width (wrap) + font auto-fit al texto del botón."""
@@ -280,6 +382,12 @@ class PlayView(ttk.Frame):
         pt = self._choose_button_font_pt(text, inner_w, inner_h)
         font_tuple = ("Mikado Ultra", max(8, int(round(pt * self.ui_scale))))
 
+        # Layout repetido con el mismo resultado: no tocar Tk
+        fit = (text, inner_w, font_tuple)
+        if btn.get("_fit") == fit:
+            return
+        btn["_fit"] = fit
+
         try:
             self.canvas.itemconfigure(
                 btn["txt_item"],
@@ -295,12 +403,13 @@ class PlayView(ttk.Frame):
         if not self._ready:
             self._pending_render = (q, idx, total, state)
             return
+        self._apply_question(q, idx, total, state)
+        # Una sola pasada de layout para todo lo marcado arriba (cuerpo,
+        # footer/Next...), antes de que Tk pinte el canvas
+        self._frame.flush()
 
-        try:
-            self.canvas.update_idletasks()
-        except Exception:
-            pass
-
+    def _apply_question(self, q, idx, total, state):
+        """Aplica el estado de la pregunta; el layout queda marcado en _frame."""
         self._q = q
         self._idx = idx
         self._total = total
@@ -362,7 +471,7 @@ class PlayView(ttk.Frame):
             self._answer_idx = idx
             self._user_outcome = bool(good)
 
-            color = "#266e3b" if good else "#7b2a2a"
+            color = self.BTN_GOOD if good else self.BTN_BAD
             b["img_norm"]  = self._make_button_img(b["w"], b["h"], b["r"], color)
             b["img_hover"] = b["img_norm"]
             self.canvas.itemconfig(b["img_item"], image=b["img_norm"])
@@ -375,7 +484,7 @@ class PlayView(ttk.Frame):
             self.set_feedback()
             self.set_next_enabled(True)  # <- habilita Next al responder
         else:
-            color = "#266e3b" if good else "#7b2a2a"
+            color = self.BTN_GOOD if good else self.BTN_BAD
             b["img_norm"]  = self._make_button_img(b["w"], b["h"], b["r"], color)
             b["img_hover"] = b["img_norm"]
             self.canvas.itemconfig(b["img_item"], image=b["img_norm"])
@@ -403,10 +512,9 @@ class PlayView(ttk.Frame):
 
     # === Habilitar/Deshabilitar Next ===
     def set_next_enabled(self, enabled: bool):
+        # Solo estado: el footer aplica los visuales una vez por frame
         self._next_enabled = bool(enabled)
-        if self._next_btn is not None:
-            self._applyz = self._apply_next_visuals()
-            self._apply_next_visuals()
+        self._frame.mark("footer")
 
     def _apply_next_visuals(self):
         if self._next_btn is None:
@@ -473,15 +581,80 @@ class PlayView(ttk.Frame):
         # --- CLAVE: re-aplicar wrap + autofit ---
         self._apply_button_text_layout(btn)
 
+    # --- Precompute de nivel ---
+    def precompute_level(self, questions):
+        """
+        Prepara en callbacks idle (un paso por callback, sin bloquear la UI)
+        todo lo que el nivel va a necesitar a la escala actual:
+          - imágenes de botón normal / hover / correcto / incorrecto y tarjeta;
+          - text-fit de cada opción de cada pregunta.
+        Después, navegar entre preguntas solo reutiliza lo cacheado.
+        """
+        self.cancel_precompute()
+        self._precompute_qs = [q for q in questions if q]
+        self._precompute_ms = 0.0
+        self._precompute_jobs = self._iter_precompute_jobs()
+        self._precompute_after = self.after_idle(self._precompute_step)
+
+    def cancel_precompute(self):
+        if self._precompute_after is not None:
+            try:
+                self.after_cancel(self._precompute_after)
+            except Exception:
+                pass
+        self._precompute_after = None
+        self._precompute_jobs = None
+
+    def _precompute_step(self):
+        self._precompute_after = None
+        if self._precompute_jobs is None:
+            return
+        if not self._ready:
+            # aún sin escala válida (primer layout pendiente)
+            self._precompute_after = self.after(16, self._precompute_step)
+            return
+        t0 = time.perf_counter()
+        try:
+            next(self._precompute_jobs)
+        except StopIteration:
+            self._precompute_jobs = None
+            perf.record("play.precompute_level", self._precompute_ms)
+            return
+        except Exception as e:
+            print(f"Warning: level precompute stopped: {e}")
+            self._precompute_jobs = None
+            return
+        self._precompute_ms += (time.perf_counter() - t0) * 1000.0
+        self._precompute_after = self.after_idle(self._precompute_step)
+
+    def _iter_precompute_jobs(self):
+        """Generador: cada `yield` es un paso de trabajo (un callback idle)."""
+        w = self.canvas.winfo_width()
+        bw, bh, br = self.S(self.BTN_W), self.S(self.BTN_H), self.S(self.BTN_R)
+
+        for color in ("#110D2E", "#255B88", self.BTN_GOOD, self.BTN_BAD):
+            self._make_button_img(bw, bh, br, color)
+            yield
+
+        self._card_photo(max(self.S(420), min(w - self.S(24), self.S(1000))))
+        yield
+
+        inner_w = max(10, bw - self.S(self.BTN_TEXT_PAD_X))
+        inner_h = max(10, bh - self.S(self.BTN_TEXT_PAD_Y))
+        for q in self._precompute_qs:
+            if q.get("type") == "mcq":
+                texts = q.get("options", [])
+            elif q.get("type") == "truefalse":
+                texts = ["True", "False"]
+            else:
+                texts = []
+            for text in texts:
+                self._choose_button_font_pt(text, inner_w, inner_h)
+            yield
+
     # --- Level Complete ---
     def level_complete(self, stars, score, total):
-        if self._card_item is not None:
-            self.canvas.delete(self._card_item); self._card_item = None
-        if self._question_item is not None:
-            self.canvas.delete(self._question_item); self._question_item = None
-        for b in self._buttons:
-            self.canvas.delete(b["img_item"]); self.canvas.delete(b["txt_item"])
-        self._buttons.clear()
+        self._clear_body()
 
         for k in ("_back_btn", "_next_btn", "_quit_btn"):
             btn = getattr(self, k, None)
@@ -491,7 +664,7 @@ class PlayView(ttk.Frame):
 
         self._complete_active = True
         self._build_level_complete_plain(stars, score, total)
-        self._layout_all()
+        self._frame.mark("body")
 
     def _build_level_complete_plain(self, stars, score, total):
         self._complete["title"] = self.canvas.create_text(
@@ -561,20 +734,17 @@ class PlayView(ttk.Frame):
         self._ensure_icons_scale()
 
         self._ready = True
-        self._redraw_background()
         self._layout_all()
+        self._warmer.start()
         if self._pending_render:
             q, idx, total, state = self._pending_render
             self._pending_render = None
             self.render_question(q, idx, total, **state)
 
     def _on_resize(self, event=None):
-        if self._resize_after:
-            self.after_cancel(self._resize_after)
-        self._resize_after = self.after(16, self._do_resize)
+        self._ticker.call_later(self, 16, self._do_resize, key="resize")
 
     def _do_resize(self):
-        self._resize_after = None
         w, h = self.canvas.winfo_width(), self.canvas.winfo_height()
         if (w, h) == self._last_size or w < 2 or h < 2:
             return
@@ -583,8 +753,9 @@ class PlayView(ttk.Frame):
         scale_changed = self._set_scale_from_canvas()
         if scale_changed:
             self._ensure_icons_scale()
-
-        self._redraw_background()
+            if self._precompute_qs:
+                self.precompute_level(self._precompute_qs)
+            self._warmer.start()
 
         if scale_changed and self._q is not None:
             pre = {}
@@ -599,30 +770,33 @@ class PlayView(ttk.Frame):
                     pre["correct"] = (True if self._user_outcome is True else
                                       False if self._user_outcome is False else None)
 
-            self.render_question(self._q, self._idx, self._total, review=self._review, **pre)
+            self._apply_question(self._q, self._idx, self._total, dict(pre, review=self._review))
 
         self._layout_all()
 
         if self._answer_locked:
             self.set_next_enabled(True)
+        self._frame.flush()
 
     def _layout_all(self):
+        """Marca todas las regiones; se redibujan en la próxima pasada idle."""
+        self._frame.mark()
+
+    def _canvas_size(self):
         w, h = self.canvas.winfo_width(), self.canvas.winfo_height()
-        if w < 2 or h < 2:
-            return
+        return (w, h) if (w >= 2 and h >= 2) else None
 
+    def _layout_header(self):
+        size = self._canvas_size()
+        if size is None:
+            return
+        w, _h = size
         BAR_H   = self.S(self.BAR_H)
-        FOOT_H  = self.S(self.FOOT_H)
-        NAV_W   = self.S(self.NAV_W)
-        NAV_H   = self.S(self.NAV_H)
-        NAV_R   = self.S(self.NAV_R)
 
-        # Header
         bar_key = (w, BAR_H, self.TOPBAR, 230)
-        pil_bar = self._make_bar_img(w, BAR_H, self.TOPBAR, alpha=230)
-        if bar_key not in self._hdr_photo_cache:
-            self._hdr_photo_cache[bar_key] = ImageTk.PhotoImage(pil_bar)
-        self._hdr_img = self._hdr_photo_cache[bar_key]
+        self._hdr_img = self._hdr_photo_cache.get_or_create(
+            bar_key, lambda: ImageTk.PhotoImage(self._make_bar_img(w, BAR_H, self.TOPBAR, alpha=230))
+        )
         self.canvas.itemconfig(self._hdr_item, image=self._hdr_img)
         self.canvas.coords(self._hdr_item, 0, 0)
 
@@ -631,21 +805,6 @@ class PlayView(ttk.Frame):
         self.canvas.coords(self._level_txt, w//2, BAR_H//2)
         self.canvas.coords(self._prog_txt,  w-12,  BAR_H//2)
 
-        # Iconos abajo-izquierda
-        self._place_bottom_left_icons(w, h)
-
-        # Footer
-        foot_key = (w, FOOT_H, self.TOPBAR, 160)
-        pil_foot = self._make_bar_img(w, FOOT_H, self.TOPBAR, alpha=160)
-        if foot_key not in self._foot_photo_cache:
-            self._foot_photo_cache[foot_key] = ImageTk.PhotoImage(pil_foot)
-        self._foot_img = self._foot_photo_cache[foot_key]
-        self.canvas.itemconfig(self._foot_item, image=self._foot_img)
-        self.canvas.coords(self._foot_item, 0, h)
-
-        self.canvas.itemconfigure(self._feed_txt, font=self.F(10))
-        self.canvas.coords(self._feed_txt, 12, h - FOOT_H//2)
-
         # Quit (arriba-izquierda)
         if self._quit_btn is None:
             self._quit_btn = self._create_button_item(
@@ -659,6 +818,26 @@ class PlayView(ttk.Frame):
         self.canvas.coords(self._quit_btn["img_item"], 12 + self.S(60), BAR_H//2)
         self.canvas.coords(self._quit_btn["txt_item"], 12 + self.S(60), BAR_H//2)
 
+    def _layout_footer(self):
+        size = self._canvas_size()
+        if size is None:
+            return
+        w, h = size
+        FOOT_H  = self.S(self.FOOT_H)
+        NAV_W   = self.S(self.NAV_W)
+        NAV_H   = self.S(self.NAV_H)
+        NAV_R   = self.S(self.NAV_R)
+
+        foot_key = (w, FOOT_H, self.TOPBAR, 160)
+        self._foot_img = self._foot_photo_cache.get_or_create(
+            foot_key, lambda: ImageTk.PhotoImage(self._make_bar_img(w, FOOT_H, self.TOPBAR, alpha=160))
+        )
+        self.canvas.itemconfig(self._foot_item, image=self._foot_img)
+        self.canvas.coords(self._foot_item, 0, h)
+
+        self.canvas.itemconfigure(self._feed_txt, font=self.F(10))
+        self.canvas.coords(self._feed_txt, 12, h - FOOT_H//2)
+
         # Back/Next centrados en footer
         if self._back_btn is None:
             self._back_btn = self._create_button_item(
@@ -679,6 +858,7 @@ class PlayView(ttk.Frame):
         self._next_btn["w"], self._next_btn["h"], self._next_btn["r"] = NAV_W, NAV_H, NAV_R
 
         self._refresh_button_visual(self._back_btn)
+        # Un solo _apply_next_visuals por frame, con el último estado de Next
         self._refresh_button_visual(self._next_btn, respect_enabled=True)
 
         total_w = NAV_W*2 + self.S(20)
@@ -689,13 +869,18 @@ class PlayView(ttk.Frame):
         self.canvas.coords(self._next_btn["img_item"], start_x + NAV_W + self.S(20), cy)
         self.canvas.coords(self._next_btn["txt_item"], start_x + NAV_W + self.S(20), cy)
 
-        # Cuerpo
+    def _layout_body_region(self):
         self._layout_body()
-
         # Fin de nivel
         if self._complete_active:
             self._layout_level_complete_plain()
 
+    def _layout_icons(self):
+        size = self._canvas_size()
+        if size is None:
+            return
+        # Iconos abajo-izquierda, siempre por encima del resto
+        self._place_bottom_left_icons(*size)
         if self._item_music: self.canvas.tag_raise(self._item_music)
         if self._item_sound: self.canvas.tag_raise(self._item_sound)
 
@@ -707,43 +892,15 @@ class PlayView(ttk.Frame):
         except Exception:
             return self.TEXT
 
-    def _tint_rgba(self, img, color_str: str):
-        if img.mode != "RGBA":
-            img = img.convert("RGBA")
-        r, g, b, a = img.split()
-        rgb = ImageColor.getrgb(color_str)
-        colored = Image.new("RGBA", img.size, rgb + (255,))
-        colored.putalpha(a)
-        return colored
-
     def _load_top_icons(self):
         """Carga/escala/tinta iconos. Se llama al iniciar y cuando cambia escala."""
         try:
-            icons_dir = Path(assets_path("icons"))
-            music_on  = Image.open(icons_dir / "music_on.png").convert("RGBA")
-            music_off = Image.open(icons_dir / "music_off.png").convert("RGBA")
-            sound_on  = Image.open(icons_dir / "sound_on.png").convert("RGBA")
-            sound_off = Image.open(icons_dir / "sound_off.png").convert("RGBA")
-
-            def scale_keep_ratio(img, h):
-                w = int(img.width * (h / img.height))
-                return img.resize((w, h), Image.Resampling.LANCZOS)
-
-            music_on  = scale_keep_ratio(music_on,  self._top_icons_h)
-            music_off = scale_keep_ratio(music_off, self._top_icons_h)
-            sound_on  = scale_keep_ratio(sound_on,  self._top_icons_h)
-            sound_off = scale_keep_ratio(sound_off, self._top_icons_h)
-
+            # Atlas compartido: PhotoImages ya escaladas/tintadas por (alto, color)
             color = self._get_title_color()
-            music_on  = self._tint_rgba(music_on,  color)
-            music_off = self._tint_rgba(music_off, color)
-            sound_on  = self._tint_rgba(sound_on,  color)
-            sound_off = self._tint_rgba(sound_off, color)
-
-            self._img_music_on  = ImageTk.PhotoImage(music_on)
-            self._img_music_off = ImageTk.PhotoImage(music_off)
-            self._img_sound_on  = ImageTk.PhotoImage(sound_on)
-            self._img_sound_off = ImageTk.PhotoImage(sound_off)
+            self._img_music_on  = atlas_photo("music_on",  self._top_icons_h, color)
+            self._img_music_off = atlas_photo("music_off", self._top_icons_h, color)
+            self._img_sound_on  = atlas_photo("sound_on",  self._top_icons_h, color)
+            self._img_sound_off = atlas_photo("sound_off", self._top_icons_h, color)
 
             if self._item_music is None:
                 initial_music = (self._img_music_off if (self.sound_manager and self.sound_manager.is_muted())
@@ -812,18 +969,76 @@ class PlayView(ttk.Frame):
 
     # ===================== BODY & FACTORIES =====================
     def _rebuild_body(self):
+        self._disabled = False
+        if self.RETAIN_ITEMS:
+            self._update_card_and_text()
+            self._update_buttons()
+        else:
+            self._clear_body()
+            self._build_card_and_text()
+            self._build_buttons()
+        self._frame.mark("body")
+
+    def _clear_body(self):
+        """
+        Quita tarjeta, enunciado y botones de respuesta. Con RETAIN_ITEMS
+        solo se ocultan (los items se reutilizan en el próximo render).
+        """
+        if self.RETAIN_ITEMS:
+            for item in (self._card_item, self._question_item):
+                if item is not None:
+                    self.canvas.itemconfigure(item, state="hidden")
+            for b in self._btn_pool:
+                self.canvas.itemconfigure(b["img_item"], state="hidden")
+                self.canvas.itemconfigure(b["txt_item"], state="hidden")
+            self._buttons = []
+            return
+
         if self._card_item is not None:
             self.canvas.delete(self._card_item); self._card_item = None
         if self._question_item is not None:
             self.canvas.delete(self._question_item); self._question_item = None
         for b in self._buttons:
             self.canvas.delete(b["img_item"]); self.canvas.delete(b["txt_item"])
-        self._buttons.clear()
-        self._disabled = False
+        self._buttons = []
 
-        self._build_card_and_text()
-        self._build_buttons()
-        self._layout_body()
+    def _update_card_and_text(self):
+        """Modo retenido: actualiza imagen/texto de la tarjeta existente."""
+        if self._card_item is None or self._question_item is None:
+            self._build_card_and_text()
+            return
+        w = self.canvas.winfo_width()
+        card_w = max(self.S(420), min(w - self.S(24), self.S(1000)))
+        self._card_img = self._card_photo(card_w)
+
+        qtext = self._q.get("question","") if self._q else ""
+        self._q_text = qtext
+        self.canvas.itemconfigure(self._card_item, image=self._card_img, state="normal")
+        self.canvas.itemconfigure(
+            self._question_item, text=qtext, fill="#1a2a2d", font=self.F(24),
+            width=int(card_w - self.S(48)), state="normal"
+        )
+
+    def _update_buttons(self):
+        """
+        Modo retenido: reutiliza los items de botón del pool (crece hasta el
+        máximo visto, p.ej. 4 en mcq) y oculta los sobrantes (truefalse = 2).
+        """
+        specs = self._button_specs()
+        while len(self._btn_pool) < len(specs):
+            self._btn_pool.append(self._create_button_item(text="", command=None))
+
+        bw, bh, br = self.S(self.BTN_W), self.S(self.BTN_H), self.S(self.BTN_R)
+        for b, (text, cmd) in zip(self._btn_pool, specs):
+            b["text"], b["cmd"] = text, cmd
+            b["w"], b["h"], b["r"] = bw, bh, br
+            self.canvas.itemconfigure(b["txt_item"], text=text, state="normal")
+            self.canvas.itemconfigure(b["img_item"], state="normal")
+            self._refresh_button_visual(b)
+        for b in self._btn_pool[len(specs):]:
+            self.canvas.itemconfigure(b["img_item"], state="hidden")
+            self.canvas.itemconfigure(b["txt_item"], state="hidden")
+        self._buttons = self._btn_pool[:len(specs)]
 
     def _layout_body(self):
         w, h = self.canvas.winfo_width(), self.canvas.winfo_height()
@@ -910,22 +1125,11 @@ class PlayView(ttk.Frame):
         BAR_H   = self.S(self.BAR_H)
         CARD_H  = self.S(self.CARD_H)
         CARD_TOP= self.S(self.CARD_TOP)
-        CARD_R  = self.S(self.CARD_R)
 
         usable_w = w - self.S(24)
         card_w = max(self.S(420), min(usable_w, self.S(1000)))
 
-        panel_key = (card_w, CARD_H, CARD_R, self.CARD, (0,0,0,90), (0, self.S(self.SH_OFF)), self.S(self.SH_BLUR))
-        pil_panel = self._make_panel_img(
-            card_w, CARD_H, CARD_R,
-            fill=self.CARD,
-            shadow_color=(0,0,0,90),
-            shadow_offset=(0, self.S(self.SH_OFF)),
-            blur=self.S(self.SH_BLUR)
-        )
-        if panel_key not in self._card_photo_cache:
-            self._card_photo_cache[panel_key] = ImageTk.PhotoImage(pil_panel)
-        self._card_img = self._card_photo_cache[panel_key]
+        self._card_img = self._card_photo(card_w)
 
         self._card_item = self.canvas.create_image(
             w//2, BAR_H + CARD_TOP + CARD_H//2, image=self._card_img, anchor="center"
@@ -942,101 +1146,53 @@ class PlayView(ttk.Frame):
         )
 
     def _build_buttons(self):
+        for text, cmd in self._button_specs():
+            self._buttons.append(self._create_button_item(text=text, command=cmd))
+
+    def _button_specs(self):
+        """[(texto, comando)] de los botones de respuesta de la pregunta actual."""
         qtype = self._q.get("type") if self._q else None
         if qtype == "mcq":
-            for i, opt in enumerate(self._q.get("options", []) if self._q else []):
-                self._buttons.append(self._create_button_item(
-                    text=opt,
-                    command=lambda i=i: (None if self._disabled else self.controller.on_answer_mcq(i))
-                ))
-        elif qtype == "truefalse":
-            for label, val in [("True", True), ("False", False)]:
-                self._buttons.append(self._create_button_item(
-                    text=label,
-                    command=lambda v=val: (None if self._disabled else self.controller.on_answer_tf(v))
-                ))
-        else:
-            self._buttons.append(self._create_button_item(text="(Unsupported)", command=lambda: None))
+            return [
+                (opt, lambda i=i: (None if self._disabled else self.controller.on_answer_mcq(i)))
+                for i, opt in enumerate(self._q.get("options", []) if self._q else [])
+            ]
+        if qtype == "truefalse":
+            return [
+                (label, lambda v=val: (None if self._disabled else self.controller.on_answer_tf(v)))
+                for label, val in [("True", True), ("False", False)]
+            ]
+        return [("(Unsupported)", lambda: None)]
+
+    def _card_photo(self, card_w):
+        return panel_photo(
+            card_w, self.S(self.CARD_H), self.S(self.CARD_R),
+            fill=self.CARD,
+            shadow_color=(0,0,0,90),
+            shadow_offset=(0, self.S(self.SH_OFF)),
+            blur=self.S(self.SH_BLUR)
+        )
 
     # ============= FACTORÍAS DE IMÁGENES =============
     def _redraw_background(self):
-        w, h = self.canvas.winfo_width(), self.canvas.winfo_height()
-        if w < 2 or h < 2:
-            return
-        src_w, src_h = self._bg_src.size
-        scale = max(w/src_w, h/src_h)
-        bg = self._bg_src.resize((max(1,int(src_w*scale)), max(1,int(src_h*scale))), Image.Resampling.LANCZOS)
-        left = (bg.width - w)//2; top = (bg.height - h)//2
-        bg = bg.crop((left, top, left + w, top + h))
-        self._bg_photo = ImageTk.PhotoImage(bg)
-        self.canvas.itemconfig(self._bg_item, image=self._bg_photo)
-        self.canvas.coords(self._bg_item, 0, 0)
+        # Rápido (mipmap) mientras se arrastra; LANCZOS al asentarse
+        self._bg_renderer.redraw()
 
     def _make_bar_img(self, w, h, color_hex, alpha=160, aa_scale=4):
-        key = ("bar", w, h, color_hex, alpha, aa_scale)
-        if key in self._bar_cache:
-            return self._bar_cache[key]
-        color_hex = color_hex.lstrip("#")
-        r = int(color_hex[0:2], 16)
-        g = int(color_hex[2:4], 16)
-        b = int(color_hex[4:6], 16)
-        W, H = max(1, w*aa_scale), max(1, h*aa_scale)
-        img = Image.new("RGBA", (W, H), (r, g, b, alpha))
-        img = img.resize((w, h), Image.Resampling.LANCZOS)
-        self._bar_cache[key] = img
-        return img
+        return bar_image(w, h, color_hex, alpha)
 
     def _make_panel_img(self, w, h, r, fill="#CCCCCC",
                         shadow_color=(0,0,0,90), shadow_offset=(0,8), blur=3, aa_scale=4):
-        key = (w, h, r, fill, shadow_color, shadow_offset, blur, aa_scale)
-        if key in self._panel_cache:
-            return self._panel_cache[key].copy()
-        W, H, R = w*aa_scale, h*aa_scale, r*aa_scale
-        ox, oy = shadow_offset
-        ox *= aa_scale; oy *= aa_scale
-        base = Image.new("RGBA", (W + abs(ox), H + abs(oy)), (0,0,0,0))
-        shadow = Image.new("RGBA", (W, H), (0,0,0,0))
-        dsh = ImageDraw.Draw(shadow)
-        dsh.rounded_rectangle([0,0,W-1,H-1], R, fill=shadow_color)
-        if blur > 0:
-            shadow = shadow.filter(ImageFilter.GaussianBlur(blur*aa_scale))
-        sx = max(0, ox); sy = max(0, oy)
-        base.alpha_composite(shadow, (sx, sy))
-        card = Image.new("RGBA", (W, H), (0,0,0,0))
-        dc = ImageDraw.Draw(card)
-        dc.rounded_rectangle([0,0,W-1,H-1], R, fill=fill)
-        base.alpha_composite(card, (0,0))
-        base = base.resize((w + abs(ox)//aa_scale, h + abs(oy)//aa_scale), Image.Resampling.LANCZOS)
-        self._panel_cache[key] = base.copy()
-        return base
+        return panel_image(w, h, r, fill, shadow_color, shadow_offset, blur, aa_scale)
 
     def _make_round_img(self, w, h, r, fill, outline=None, outline_width=0, aa_scale=4):
-        key = (w, h, r, fill, outline, outline_width, aa_scale)
-        if key in self._btn_cache:
-            return self._btn_cache[key]
-        W, H, R = w*aa_scale, h*aa_scale, r*aa_scale
-        img = Image.new("RGBA", (W, H), (0,0,0,0))
-        draw = ImageDraw.Draw(img)
-        draw.rounded_rectangle([0,0,W-1,H-1], R, fill=fill)
-        if outline and outline_width>0:
-            ow = outline_width*aa_scale
-            draw.rounded_rectangle([ow//2, ow//2, W-1-ow//2, H-1-ow//2], R-ow//2, outline=outline, width=ow)
-        img = img.resize((w, h), Image.Resampling.LANCZOS)
-        tkimg = ImageTk.PhotoImage(img)
-        self._btn_cache[key] = tkimg
-        return tkimg
+        return round_rect_photo(w, h, r, fill, outline, outline_width, aa_scale)
 
     def _make_button_img(self, w, h, r, fill, shadow_color=None, shadow_offset=None, blur=None):
         shadow_color   = shadow_color or (0, 0, 0, self.BTN_SH_ALPHA)
         shadow_offset  = shadow_offset or (0, self.S(self.BTN_SH_OFF))
         blur           = blur if blur is not None else self.S(self.BTN_SH_BLUR)
-        key = ("btn_with_shadow", w, h, r, fill, shadow_color, shadow_offset, blur)
-        if key in self._btn_cache:
-            return self._btn_cache[key]
-        pil_img = self._make_panel_img(w, h, r, fill=fill, shadow_color=shadow_color, shadow_offset=shadow_offset, blur=blur)
-        tkimg = ImageTk.PhotoImage(pil_img)
-        self._btn_cache[key] = tkimg
-        return tkimg
+        return panel_photo(w, h, r, fill, shadow_color, shadow_offset, blur)
 
     def _create_button_item(self, text, command, width=None, height=None, r=None,
                             color="#110D2E", hover="#255B88", text_color="#CCCCCC", shadow=True):
@@ -1088,7 +1244,7 @@ class PlayView(ttk.Frame):
             self._play_sfx("click")
             try:
                 self.canvas.itemconfig(b["img_item"], image=b["img_hover"])
-                self.after(60, lambda: self.canvas.itemconfig(b["img_item"], image=b["img_norm"]))
+                self._ticker.call_later(self, 60, lambda: self.canvas.itemconfig(b["img_item"], image=b["img_norm"]), key=("click", b["img_item"]))
             except Exception:
                 pass
             if callable(b["cmd"]):